@@ -1,4 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
 from PyInstaller.utils.hooks import collect_all, copy_metadata
 
 
@@ -66,10 +68,14 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# ASANA_MCP_IMPORTTIME=1 builds a variant that prints `-X importtime` data to
+# stderr, for benchmarks/bench_startup.py --target onedir.
+run_options = [("X importtime", None, "OPTION")] if os.environ.get("ASANA_MCP_IMPORTTIME") else []
+
 exe = EXE(
     pyz,
     a.scripts,
-    [],
+    run_options,
     exclude_binaries=True,
     name="asana-mcp-server",
     debug=False,
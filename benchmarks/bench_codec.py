@@ -0,0 +1,106 @@
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_asana import FakeAsana, FakeAsanaConfig
+from src.codec import BACKENDS, build_codec, dumps_pretty
+from src.records import TaskRecord, decode_page
+from src.tool_impl import FIELD_PRESETS
+
+
+def task_page(tasks: int, preset: str = "full") -> bytes:
+    """A ``{"data": [...]}`` task listing as Asana would send it, projected to ``preset``."""
+    fake = FakeAsana(FakeAsanaConfig(tasks=tasks, projects=1))
+    params = {"opt_fields": FIELD_PRESETS["task"][preset]}
+    items = [fake._project(task, params) for task in fake.tasks.values()]
+    return json.dumps({"data": items}).encode("utf-8")
+
+
+def _timed_ms(fn: Callable[[], Any], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=3))
+    return round(best / number * 1000, 2)
+
+
+def _retained_bytes(fn: Callable[[], Any]) -> int:
+    """Bytes still allocated while the result of ``fn`` is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def run(tasks: int, number: int) -> List[Dict[str, Any]]:
+    raw = task_page(tasks)
+    decoded = json.loads(raw)
+    rows = []
+    for name in BACKENDS:
+        codec = build_codec(name)
+        if codec.name != name:
+            continue  # backend not installed
+        assert codec.loads(raw) == decoded, name
+        rows.append(
+            {
+                "case": f"codec:{name}",
+                "tasks": tasks,
+                "decode_ms": _timed_ms(lambda codec=codec: codec.loads(raw), number),
+                "encode_ms": _timed_ms(lambda codec=codec: codec.dumps(decoded), number),
+                "pretty_ms": _timed_ms(lambda codec=codec: codec.dumps_pretty(decoded), number),
+            }
+        )
+    baseline = rows[-1]
+    for row in rows:
+        row["speedup"] = round(
+            (baseline["decode_ms"] + baseline["encode_ms"]) / max(row["decode_ms"] + row["encode_ms"], 1e-9), 1
+        )
+    # Memory held by the decoded page: plain dicts versus slotted records with shared references.
+    assert [record.to_dict() for record in decode_page(raw, TaskRecord)] == decoded["data"]
+    dict_bytes = _retained_bytes(lambda: build_codec("stdlib").loads(raw))
+    record_bytes = _retained_bytes(lambda: decode_page(raw, TaskRecord))
+    rows.append(
+        {
+            "case": "records",
+            "tasks": tasks,
+            "dict_bytes": dict_bytes,
+            "record_bytes": record_bytes,
+            "memory_ratio": round(dict_bytes / max(record_bytes, 1), 2),
+            "records_ms": _timed_ms(lambda: decode_page(raw, TaskRecord), number),
+        }
+    )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON codec backends and typed records on task listings.")
+    parser.add_argument("--tasks", type=int, default=10_000, help="Tasks in the benchmark payload")
+    parser.add_argument("--number", type=int, default=5, help="Iterations per timing repeat")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    rows = run(args.tasks, args.number)
+    if args.json:
+        print(dumps_pretty(rows))
+        return
+    for row in rows:
+        if row["case"] == "records":
+            print(
+                f"{row['case']:<16} dicts={row['dict_bytes']}B records={row['record_bytes']}B"
+                f" ratio={row['memory_ratio']}x decode+records={row['records_ms']}ms"
+            )
+            continue
+        print(
+            f"{row['case']:<16} decode={row['decode_ms']}ms encode={row['encode_ms']}ms"
+            f" pretty={row['pretty_ms']}ms speedup={row['speedup']}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.logging_utils import SENSITIVE_KEYS
+from src.redaction import compile_plan, redact
+from src.tool_impl import BatchCreateTasksInput, GetTaskInput
+
+
+def legacy_redact_dict(payload: Any) -> Any:
+    if isinstance(payload, dict):
+        redacted: Dict[str, Any] = {}
+        for key, value in payload.items():
+            if key.lower() in SENSITIVE_KEYS:
+                redacted[key] = None if value is None else "[REDACTED]"
+            else:
+                redacted[key] = legacy_redact_dict(value)
+        return redacted
+    if isinstance(payload, list):
+        return [legacy_redact_dict(item) for item in payload]
+    return payload
+
+
+def fixtures() -> Dict[str, Any]:
+    tasks = [
+        {
+            "gid": str(index),
+            "name": f"Task {index}",
+            "completed": False,
+            "assignee": {"gid": "7", "name": "Owner"},
+            "memberships": [{"project": {"gid": "1", "name": "P"}, "section": {"gid": "2", "name": "S"}}],
+        }
+        for index in range(1_000)
+    ]
+    return {
+        "test_redaction_payload": {
+            "access_token": "secret",
+            "notes": "private",
+            "nested": {"token": "hidden"},
+            "list": [{"password": "pw"}],
+        },
+        "get_task_input": {"task_gid": "123", "opt_fields": "name,completed"},
+        "asana_error_body": {
+            "errors": [{"message": "task: Not a recognized ID", "help": "For more information...", "phrase": "x"}]
+        },
+        "task_list_clean": {"data": tasks},
+        "task_list_with_notes": {"data": [{**task, "notes": "private"} for task in tasks]},
+        "batch_create_input": {"tasks": [{"name": f"Task {i}", "notes": "private"} for i in range(200)]},
+    }
+
+
+def _timed_us(fn: Callable[[], Any], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return round(best / number * 1_000_000, 2)
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def run(number: int) -> List[Dict[str, Any]]:
+    plans = {
+        "get_task_input": compile_plan(GetTaskInput),
+        "batch_create_input": compile_plan(BatchCreateTasksInput),
+    }
+    rows = []
+    for name, payload in fixtures().items():
+        assert legacy_redact_dict(payload) == redact(payload), name
+        candidates: Dict[str, Callable[[], Any]] = {
+            "legacy": lambda payload=payload: legacy_redact_dict(payload),
+            "engine": lambda payload=payload: redact(payload),
+        }
+        if name in plans:
+            candidates["plan"] = lambda payload=payload, plan=plans[name]: plan.apply(payload)
+        row: Dict[str, Any] = {"fixture": name}
+        for label, fn in candidates.items():
+            row[f"{label}_us"] = _timed_us(fn, number)
+            row[f"{label}_bytes"] = _peak_bytes(fn)
+        row["speedup"] = round(row["legacy_us"] / max(row["engine_us"], 1e-9), 1)
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare redaction engine with the legacy recursive copy.")
+    parser.add_argument("--number", type=int, default=200, help="Iterations per timing repeat")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    rows = run(args.number)
+    if args.json:
+        print(json.dumps(rows, indent=2, sort_keys=True))
+        return
+    for row in rows:
+        plan = f" plan={row['plan_us']}us" if "plan_us" in row else ""
+        print(
+            f"{row['fixture']:<24} legacy={row['legacy_us']}us/{row['legacy_bytes']}B"
+            f" engine={row['engine_us']}us/{row['engine_bytes']}B{plan} speedup={row['speedup']}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+ONEDIR_BINARY = ROOT / "dist" / "asana-mcp-server" / "asana-mcp-server"
+HEAVY_MODULES = ("pydantic", "httpx", "mcp", "anyio", "starlette", "sqlite3")
+FLAGS = ("--version", "--health-check")
+
+
+@dataclass
+class ImportSample:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportSample]:
+    samples = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        head, cumulative_us, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        self_us = head.split(":", 1)[1]
+        samples.append(ImportSample(name.strip(), int(self_us), int(cumulative_us), depth))
+    return samples
+
+
+def _command(target: str, flag: str, binary: Optional[Path]) -> List[str]:
+    if target == "source":
+        return [sys.executable, "-X", "importtime", "-m", "src.server", flag]
+    return [str(binary or ONEDIR_BINARY), flag]
+
+
+def _environment(workdir: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("ASANA_ACCESS_TOKEN", "bench-token")
+    env["LOG_FILE"] = os.path.join(workdir, "startup.log")
+    # Frozen builds ignore PYTHON* variables; build the onedir variant with
+    # ASANA_MCP_IMPORTTIME=1 to get import timings, otherwise only wall time is reported.
+    return env
+
+
+def measure(target: str, flag: str, runs: int, binary: Optional[Path] = None) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        env = _environment(workdir)
+        command = _command(target, flag, binary)
+        walls: List[float] = []
+        samples: List[ImportSample] = []
+        for run in range(runs + 1):
+            started = time.perf_counter()
+            completed = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+            elapsed = time.perf_counter() - started
+            if completed.returncode != 0:
+                raise RuntimeError(f"{' '.join(command)} exited {completed.returncode}: {completed.stderr[-500:]}")
+            if run == 0:
+                continue  # warm the OS page cache
+            walls.append(elapsed)
+            samples = parse_importtime(completed.stderr)
+
+    top_level = [sample for sample in samples if sample.depth == 0]
+    imported = {sample.module for sample in samples}
+    return {
+        "target": target,
+        "flag": flag,
+        "runs": runs,
+        "wall_ms_min": round(min(walls) * 1000, 1),
+        "wall_ms_median": round(statistics.median(walls) * 1000, 1),
+        "import_ms": round(sum(sample.cumulative_us for sample in top_level) / 1000, 1) if samples else None,
+        "modules": len(imported) if samples else None,
+        "heavy_modules": sorted(module for module in HEAVY_MODULES if module in imported),
+        "slowest": [
+            {"module": sample.module, "cumulative_ms": round(sample.cumulative_us / 1000, 1)}
+            for sample in sorted(top_level, key=lambda sample: sample.cumulative_us, reverse=True)[:5]
+        ],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for --version and --health-check.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target", action="append", choices=("source", "onedir"), default=[])
+    parser.add_argument("--binary", type=Path, default=None, help=f"Onedir executable (default {ONEDIR_BINARY})")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if a median wall time exceeds this")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    targets = args.target or ["source"] + (["onedir"] if (args.binary or ONEDIR_BINARY).exists() else [])
+    rows = [measure(target, flag, args.runs, args.binary) for target in targets for flag in FLAGS]
+    if args.json:
+        print(json.dumps(rows, indent=2, sort_keys=True))
+    else:
+        for row in rows:
+            imports = f" imports={row['import_ms']}ms/{row['modules']} modules" if row["import_ms"] is not None else ""
+            heavy = ",".join(row["heavy_modules"]) or "-"
+            print(
+                f"{row['target']:<7} {row['flag']:<15} median={row['wall_ms_median']}ms min={row['wall_ms_min']}ms"
+                f"{imports} heavy={heavy}"
+            )
+    if args.max_ms is not None:
+        slow = [row for row in rows if row["wall_ms_median"] > args.max_ms]
+        for row in slow:
+            print(f"SLOW {row['target']} {row['flag']}: {row['wall_ms_median']}ms > {args.max_ms}ms", file=sys.stderr)
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+os.environ.setdefault("ASANA_ACCESS_TOKEN", "bench-token")
+os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "asana-mcp-bench.log"))
+# Audit lines also go to stderr; set LOG_LEVEL=INFO to include audit logging in the numbers.
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from benchmarks.fake_asana import PROJECT_GID, SECTION_GID, WORKSPACE_GID, FakeAsana, FakeAsanaConfig  # noqa: E402
+from src import tool_impl  # noqa: E402
+from src.asana_client import AsyncAsanaClient  # noqa: E402
+from src.cache import ResponseCache  # noqa: E402
+from src.config import Settings  # noqa: E402
+from src.metrics import Metrics  # noqa: E402
+from src.mirror import TaskMirror  # noqa: E402
+from src.rate_limit import RateLimiter  # noqa: E402
+
+BATCH_SIZE = 25
+PayloadFactory = Callable[[FakeAsana, int], Dict[str, Any]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    tool: str
+    payload: PayloadFactory
+
+
+def _task_gid(fake: FakeAsana, index: int) -> str:
+    gids = fake.task_gids()
+    return gids[index % len(gids)]
+
+
+def _fresh_gid(fake: FakeAsana, index: int) -> str:
+    return fake.add_task(f"Disposable {index}")
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("get_current_user", "get_current_user", lambda fake, i: {}),
+    Scenario("list_workspaces", "list_workspaces", lambda fake, i: {}),
+    Scenario(
+        "list_projects_paginated",
+        "list_projects",
+        lambda fake, i: {"workspace_gid": WORKSPACE_GID, "max_items": 250},
+    ),
+    Scenario("get_task", "get_task", lambda fake, i: {"task_gid": _task_gid(fake, i)}),
+    Scenario(
+        "get_task_tree",
+        "get_task_tree",
+        lambda fake, i: {"task_gid": fake.add_task_tree()},
+    ),
+    Scenario(
+        "search_tasks_paginated",
+        "search_tasks",
+        lambda fake, i: {"workspace_gid": WORKSPACE_GID, "text": "task", "max_items": 300},
+    ),
+    Scenario(
+        "search_tasks_local",
+        "search_tasks",
+        lambda fake, i: {"workspace_gid": WORKSPACE_GID, "projects": PROJECT_GID, "text": "task 1", "source": "local"},
+    ),
+    Scenario("create_task", "create_task", lambda fake, i: {"name": f"Bench {i}", "workspace": WORKSPACE_GID}),
+    Scenario("update_task", "update_task", lambda fake, i: {"task_gid": _task_gid(fake, i), "name": f"Renamed {i}"}),
+    Scenario("delete_task", "delete_task", lambda fake, i: {"task_gid": _fresh_gid(fake, i)}),
+    Scenario(
+        "move_task_to_section",
+        "move_task_to_section",
+        lambda fake, i: {"section_gid": SECTION_GID, "task_gid": _task_gid(fake, i)},
+    ),
+    Scenario(
+        "create_task_in_section",
+        "create_task_in_section",
+        lambda fake, i: {"section_gid": SECTION_GID, "name": f"Bench {i}", "workspace": WORKSPACE_GID},
+    ),
+    Scenario(
+        "create_task_in_section_one_call",
+        "create_task_in_section",
+        lambda fake, i: {"section_gid": SECTION_GID, "name": f"Bench {i}", "projects": [PROJECT_GID]},
+    ),
+    Scenario(
+        "create_task_with_subtasks",
+        "create_task_with_subtasks",
+        lambda fake, i: {
+            "name": f"Bench {i}",
+            "workspace": WORKSPACE_GID,
+            "subtasks": [{"name": f"Step {n}"} for n in range(BATCH_SIZE)],
+        },
+    ),
+    Scenario(
+        "create_task_with_dependencies",
+        "create_task_with_dependencies",
+        lambda fake, i: {
+            "name": f"Bench {i}",
+            "workspace": WORKSPACE_GID,
+            "dependencies": [_task_gid(fake, i)],
+            "dependents": [_task_gid(fake, i + 1)],
+        },
+    ),
+    Scenario(
+        "move_tasks_to_section_in_order",
+        "move_tasks_to_section_in_order",
+        lambda fake, i: {"section_gid": SECTION_GID, "task_gids": [_task_gid(fake, i * 5 + n) for n in range(5)]},
+    ),
+    Scenario(
+        "batch_create_tasks",
+        "batch_create_tasks",
+        lambda fake, i: {"tasks": [{"name": f"Bench {i}.{n}", "workspace": WORKSPACE_GID} for n in range(BATCH_SIZE)]},
+    ),
+    Scenario(
+        "batch_update_tasks",
+        "batch_update_tasks",
+        lambda fake, i: {
+            "tasks": [{"task_gid": _task_gid(fake, i * BATCH_SIZE + n), "name": "Renamed"} for n in range(BATCH_SIZE)]
+        },
+    ),
+    Scenario(
+        "batch_delete_tasks",
+        "batch_delete_tasks",
+        lambda fake, i: {"task_gids": [_fresh_gid(fake, i * BATCH_SIZE + n) for n in range(BATCH_SIZE)]},
+    ),
+    Scenario(
+        "batch_move_tasks_to_section",
+        "batch_move_tasks_to_section",
+        lambda fake, i: {
+            "moves": [
+                {"section_gid": SECTION_GID, "task_gid": _task_gid(fake, i * BATCH_SIZE + n)} for n in range(BATCH_SIZE)
+            ]
+        },
+    ),
+    Scenario(
+        "export_project",
+        "export_project",
+        lambda fake, i: {"project_gid": PROJECT_GID, "path": f"export-{i}.ndjson.gz", "resume": False},
+    ),
+    Scenario("cache_stats", "cache_stats", lambda fake, i: {}),
+    Scenario("server_stats", "server_stats", lambda fake, i: {}),
+    Scenario(
+        "sync_mirror",
+        "sync_mirror",
+        lambda fake, i: {"workspace_gid": WORKSPACE_GID, "project_gids": [PROJECT_GID]},
+    ),
+]
+
+
+def tool_functions() -> List[str]:
+    return sorted(
+        name
+        for name, fn in vars(tool_impl).items()
+        if not name.startswith("_") and inspect.iscoroutinefunction(fn) and fn.__module__ == tool_impl.__name__
+    )
+
+
+@dataclass
+class BenchOptions:
+    iterations: int = 50
+    concurrency: int = 8
+    latency_ms: float = 2.0
+    jitter_ms: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    tasks: int = 1_000
+    projects: int = 250
+    cache: bool = False
+    alloc_samples: int = 3
+    only: List[str] = field(default_factory=list)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _Environment:
+    """Points tool_impl's shared client, cache and mirror at a fake Asana."""
+
+    def __init__(self, options: BenchOptions, workdir: str) -> None:
+        self.fake = FakeAsana(
+            FakeAsanaConfig(
+                latency=options.latency_ms / 1000,
+                jitter=options.jitter_ms / 1000,
+                error_rate_429=options.error_rate_429,
+                error_rate_5xx=options.error_rate_5xx,
+                projects=options.projects,
+                tasks=options.tasks,
+            )
+        )
+        settings = Settings(
+            asana_access_token="bench-token",
+            asana_max_retries=5,
+            asana_cache_enabled=options.cache,
+            asana_max_concurrent_requests=max(options.concurrency, 1),
+        )
+        self.metrics = Metrics()
+        self.cache = ResponseCache.from_settings(settings)
+        self.client = AsyncAsanaClient(
+            settings,
+            transport=self.fake.transport(),
+            limiter=RateLimiter(1_000_000, 1_000_000, max_concurrent=settings.asana_max_concurrent_requests),
+            cache=self.cache,
+            metrics=self.metrics,
+        )
+        self.mirror = TaskMirror(os.path.join(workdir, "mirror.sqlite3"))
+        self.export_dir = Path(workdir, "exports")
+        self._stack = ExitStack()
+
+    def __enter__(self) -> "_Environment":
+        for name, value in (
+            ("get_async_client", lambda: self.client),
+            ("get_response_cache", lambda: self.cache),
+            ("get_mirror", lambda: self.mirror),
+            ("get_export_dir", lambda: self.export_dir),
+            ("REGISTRY", self.metrics),
+        ):
+            self._stack.enter_context(mock.patch.object(tool_impl, name, value))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stack.close()
+        self.mirror.close()
+        asyncio.run(self.client.aclose())
+
+
+async def _run_scenario(env: _Environment, scenario: Scenario, options: BenchOptions) -> Dict[str, Any]:
+    tool_fn = getattr(tool_impl, scenario.tool)
+    payloads = [scenario.payload(env.fake, index) for index in range(options.iterations)]
+    if scenario.name == "search_tasks_local":
+        await tool_impl.sync_mirror({"workspace_gid": WORKSPACE_GID, "project_gids": [PROJECT_GID], "full": True})
+    env.metrics.reset()
+    calls_before = env.fake.upstream_calls()
+    faults_before = sum(env.fake.faults.values())
+
+    latencies: List[float] = []
+    outcomes: Dict[str, int] = {}
+    gate = asyncio.Semaphore(max(options.concurrency, 1))
+
+    async def one(payload: Dict[str, Any]) -> None:
+        async with gate:
+            started = time.perf_counter()
+            with env.metrics.track_tool(scenario.tool) as call:
+                result = await tool_fn(payload)
+                call.outcome = result.get("status", "ok")
+            latencies.append(time.perf_counter() - started)
+            outcomes[call.outcome] = outcomes.get(call.outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(payload) for payload in payloads))
+    wall = time.perf_counter() - started
+
+    upstream = env.fake.upstream_calls() - calls_before
+    snapshot = env.metrics.snapshot()
+    retries = sum(sum(reasons.values()) for reasons in snapshot["retries"].values())
+
+    peak = 0
+    for index in range(options.alloc_samples):
+        payload = scenario.payload(env.fake, options.iterations + index)
+        tracemalloc.start()
+        try:
+            await tool_fn(payload)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "scenario": scenario.name,
+        "tool": scenario.tool,
+        "iterations": options.iterations,
+        "ok": outcomes.get("ok", 0),
+        "errors": options.iterations - outcomes.get("ok", 0),
+        "throughput_ops": round(options.iterations / wall, 1) if wall else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "alloc_peak_kib": round(peak / 1024, 1),
+        "upstream_calls": upstream,
+        "upstream_calls_per_op": round(upstream / options.iterations, 3),
+        "retries": retries,
+        "faults": sum(env.fake.faults.values()) - faults_before,
+    }
+
+
+def run_suite(options: BenchOptions) -> List[Dict[str, Any]]:
+    scenarios = [s for s in SCENARIOS if not options.only or s.name in options.only or s.tool in options.only]
+    rows = []
+    for scenario in scenarios:
+        with tempfile.TemporaryDirectory() as workdir, _Environment(options, workdir) as env:
+            tool_impl.get_logger()
+            rows.append(asyncio.run(_run_scenario(env, scenario, options)))
+    return rows
+
+
+def check_baseline(rows: List[Dict[str, Any]], baseline: List[Dict[str, Any]], latency_tolerance: Optional[float]) -> List[str]:
+    """Upstream call counts are deterministic and compared exactly; latency only when asked."""
+    expected = {row["scenario"]: row for row in baseline}
+    failures = []
+    for row in rows:
+        base = expected.get(row["scenario"])
+        if base is None:
+            continue
+        if row["upstream_calls_per_op"] > base["upstream_calls_per_op"]:
+            failures.append(
+                f"{row['scenario']}: upstream calls/op {row['upstream_calls_per_op']} > {base['upstream_calls_per_op']}"
+            )
+        if row["errors"] and not base.get("errors"):
+            failures.append(f"{row['scenario']}: {row['errors']} errors")
+        if latency_tolerance is not None and row["p99_ms"] > base["p99_ms"] * latency_tolerance:
+            failures.append(f"{row['scenario']}: p99 {row['p99_ms']}ms > {latency_tolerance}x baseline {base['p99_ms']}ms")
+    return failures
+
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    columns = [
+        "scenario", "throughput_ops", "p50_ms", "p99_ms", "alloc_peak_kib", "upstream_calls_per_op", "retries", "errors",
+    ]
+    widths = {name: max(len(name), *(len(str(row[name])) for row in rows)) for name in columns}
+    print("  ".join(name.ljust(widths[name]) for name in columns))
+    for row in rows:
+        print(
+            "  ".join(
+                str(row[name]).ljust(widths[name]) if name == "scenario" else str(row[name]).rjust(widths[name])
+                for name in columns
+            )
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run every tool against an in-process fake Asana.")
+    defaults = BenchOptions()
+    parser.add_argument("--iterations", type=int, default=defaults.iterations)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="Fake server latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--error-rate-429", type=float, default=defaults.error_rate_429)
+    parser.add_argument("--error-rate-5xx", type=float, default=defaults.error_rate_5xx)
+    parser.add_argument("--tasks", type=int, default=defaults.tasks, help="Tasks in the fake project")
+    parser.add_argument("--projects", type=int, default=defaults.projects, help="Projects in the fake workspace")
+    parser.add_argument("--cache", action="store_true", help="Enable the response cache")
+    parser.add_argument("--only", action="append", default=[], help="Scenario or tool name (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    parser.add_argument("--write-baseline", help="Write results to this JSON file")
+    parser.add_argument(
+        "--baseline",
+        help="Re-run with the options recorded in this JSON file and fail on regressions",
+    )
+    parser.add_argument(
+        "--latency-tolerance",
+        type=float,
+        default=None,
+        help="With --baseline, also fail when p99 exceeds baseline by this factor",
+    )
+    args = parser.parse_args(argv)
+
+    options = BenchOptions(
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate_429=args.error_rate_429,
+        error_rate_5xx=args.error_rate_5xx,
+        tasks=args.tasks,
+        projects=args.projects,
+        cache=args.cache,
+        only=args.only,
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        # Re-run with the recorded options so call counts are comparable.
+        options = BenchOptions(**{**baseline["options"], "only": args.only})
+
+    rows = run_suite(options)
+    report = {"options": asdict(options), "results": rows}
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        _print_table(rows)
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    if baseline is not None:
+        failures = check_baseline(rows, baseline["results"], args.latency_tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.metrics import endpoint_family
+
+API_PREFIX = "/api/1.0"
+WORKSPACE_GID = "1000"
+PROJECT_GID = "2000"
+SECTION_GID = "3000"
+USER_GID = "4000"
+
+
+@dataclass
+class FakeAsanaConfig:
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    retry_after: float = 0.0
+    projects: int = 250
+    tasks: int = 1_000
+    sections: int = 4
+    notes_bytes: int = 200
+    seed: int = 1
+
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., Tuple[int, Dict[str, Any]]]]
+
+
+class FakeAsana:
+    """In-memory Asana stand-in served through ``httpx.MockTransport``.
+
+    Implements the endpoints the tools use, with injectable latency, 429/5xx
+    responses and large offset-paginated collections.
+    """
+
+    def __init__(self, config: Optional[FakeAsanaConfig] = None) -> None:
+        self.config = config or FakeAsanaConfig()
+        self._rng = random.Random(self.config.seed)
+        self.calls: Counter = Counter()
+        self.faults: Counter = Counter()
+        self._next_gid = 10_000_000
+        self._sync = 0
+        self.user = {"gid": USER_GID, "resource_type": "user", "name": "Bench User", "email": "bench@example.com"}
+        self.workspaces = [{"gid": WORKSPACE_GID, "resource_type": "workspace", "name": "Bench Workspace"}]
+        self.projects = [
+            {"gid": str(2000 + index), "resource_type": "project", "name": f"Project {index}", "archived": False}
+            for index in range(self.config.projects)
+        ]
+        self.sections = [
+            {"gid": str(int(SECTION_GID) + index), "resource_type": "section", "name": f"Section {index}"}
+            for index in range(max(self.config.sections, 1))
+        ]
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        for index in range(self.config.tasks):
+            self.add_task(f"Task {index}")
+        self._routes: List[Route] = [
+            ("GET", re.compile(r"^/users/me$"), self._get_me),
+            ("GET", re.compile(r"^/workspaces$"), self._list_workspaces),
+            ("GET", re.compile(r"^/workspaces/(\w+)/projects$"), self._list_projects),
+            ("GET", re.compile(r"^/workspaces/(\w+)/tasks/search$"), self._search_tasks),
+            ("GET", re.compile(r"^/projects/(\w+)/tasks$"), self._project_tasks),
+            ("GET", re.compile(r"^/projects/(\w+)/sections$"), self._list_sections),
+            ("GET", re.compile(r"^/sections/(\w+)/tasks$"), self._section_tasks),
+            ("GET", re.compile(r"^/tasks/(\w+)$"), self._get_task),
+            ("GET", re.compile(r"^/tasks/(\w+)/subtasks$"), self._list_subtasks),
+            ("GET", re.compile(r"^/tasks/(\w+)/(dependencies|dependents)$"), self._list_links),
+            ("GET", re.compile(r"^/tasks/(\w+)/stories$"), self._list_stories),
+            ("GET", re.compile(r"^/events$"), self._events),
+            ("POST", re.compile(r"^/tasks$"), self._create_task),
+            ("PUT", re.compile(r"^/tasks/(\w+)$"), self._update_task),
+            ("DELETE", re.compile(r"^/tasks/(\w+)$"), self._delete_task),
+            ("POST", re.compile(r"^/tasks/(\w+)/subtasks$"), self._create_subtask),
+            ("POST", re.compile(r"^/tasks/(\w+)/(addDependencies|addDependents)$"), self._link_tasks),
+            ("POST", re.compile(r"^/sections/(\w+)/addTask$"), self._add_task_to_section),
+            ("POST", re.compile(r"^/batch$"), self._batch),
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def new_gid(self) -> str:
+        self._next_gid += 1
+        return str(self._next_gid)
+
+    def add_task(self, name: str, **fields: Any) -> str:
+        gid = self.new_gid()
+        index = len(self.tasks)
+        section = self.sections[index % len(self.sections)]
+        self.tasks[gid] = {
+            "gid": gid,
+            "resource_type": "task",
+            "name": name,
+            "notes": "x" * self.config.notes_bytes,
+            "completed": False,
+            "completed_at": None,
+            "num_subtasks": 0,
+            "assignee": {"gid": USER_GID, "name": "Bench User"},
+            "due_on": None,
+            "start_on": None,
+            "created_at": f"2024-01-01T00:00:00.{index:06d}Z",
+            "modified_at": f"2024-01-02T00:00:00.{index:06d}Z",
+            "memberships": [
+                {
+                    "project": {"gid": PROJECT_GID, "name": "Project 0"},
+                    "section": {"gid": section["gid"], "name": section["name"]},
+                }
+            ],
+            "projects": [{"gid": PROJECT_GID, "name": "Project 0"}],
+            "permalink_url": f"https://app.asana.com/0/{PROJECT_GID}/{gid}",
+            **fields,
+        }
+        return gid
+
+    def task_gids(self) -> List[str]:
+        return list(self.tasks)
+
+    def add_subtask(self, parent_gid: str, name: str) -> str:
+        gid = self.add_task(name, parent={"gid": parent_gid})
+        self.tasks[parent_gid]["num_subtasks"] += 1
+        return gid
+
+    def add_task_tree(self, fanout: int = 3, depth: int = 2) -> str:
+        root = self.add_task("Tree root")
+        level = [root]
+        for _ in range(depth):
+            level = [self.add_subtask(parent, f"{parent}.{n}") for parent in level for n in range(fanout)]
+        return root
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        delay = self.config.latency + (self._rng.uniform(0, self.config.jitter) if self.config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        path = request.url.path.removeprefix(API_PREFIX)
+        self.calls[f"{request.method} {endpoint_family(path)}"] += 1
+
+        roll = self._rng.random()
+        if roll < self.config.error_rate_429:
+            self.faults["429"] += 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": str(self.config.retry_after)},
+                json={"errors": [{"message": "Rate limited"}]},
+            )
+        if roll < self.config.error_rate_429 + self.config.error_rate_5xx:
+            self.faults["503"] += 1
+            return httpx.Response(503, json={"errors": [{"message": "Service unavailable"}]})
+
+        body = json.loads(request.content) if request.content else None
+        status, payload = self.dispatch(request.method, path, dict(request.url.params), body)
+        return httpx.Response(status, json=payload)
+
+    def dispatch(
+        self, method: str, path: str, params: Dict[str, str], body: Optional[Dict[str, Any]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path) if route_method == method.upper() else None
+            if match:
+                return handler(*match.groups(), params=params, body=body)
+        return 404, {"errors": [{"message": f"No route for {method} {path}"}]}
+
+    def _project(self, item: Dict[str, Any], params: Dict[str, str]) -> Dict[str, Any]:
+        opt_fields = params.get("opt_fields")
+        if not opt_fields:
+            return {key: item[key] for key in ("gid", "resource_type", "name") if key in item}
+        wanted = {field.split(".", 1)[0] for field in opt_fields.split(",")} | {"gid", "resource_type"}
+        return {key: value for key, value in item.items() if key in wanted}
+
+    def _page(self, items: List[Dict[str, Any]], params: Dict[str, str], path: str) -> Dict[str, Any]:
+        limit = int(params.get("limit", 100))
+        start = int(params.get("offset", 0))
+        page = [self._project(item, params) for item in items[start:start + limit]]
+        end = start + limit
+        next_page = None
+        if end < len(items):
+            next_page = {"offset": str(end), "path": f"{path}?offset={end}", "uri": ""}
+        return {"data": page, "next_page": next_page}
+
+    def _get_me(self, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        return 200, {"data": self._project(self.user, params)}
+
+    def _list_workspaces(self, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        return 200, {"data": [self._project(item, params) for item in self.workspaces]}
+
+    def _list_projects(self, workspace_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        return 200, self._page(self.projects, params, f"/workspaces/{workspace_gid}/projects")
+
+    def _project_tasks(self, project_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        return 200, self._page(list(self.tasks.values()), params, f"/projects/{project_gid}/tasks")
+
+    def _list_sections(self, project_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        return 200, self._page(self.sections, params, f"/projects/{project_gid}/sections")
+
+    def _section_tasks(self, section_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        members = [
+            task for task in self.tasks.values()
+            if any((membership.get("section") or {}).get("gid") == section_gid for membership in task["memberships"])
+        ]
+        return 200, self._page(members, params, f"/sections/{section_gid}/tasks")
+
+    def _search_tasks(self, workspace_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        text = (params.get("text") or "").lower()
+        before = params.get("created_at.before")
+        matches = [
+            task for task in self.tasks.values()
+            if (not text or text in task["name"].lower()) and (not before or task["created_at"] < before)
+        ]
+        matches.sort(key=lambda task: task["created_at"], reverse=params.get("sort_ascending") != "true")
+        limit = int(params.get("limit", 100))
+        return 200, {"data": [self._project(task, params) for task in matches[:limit]]}
+
+    def _get_task(self, task_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        task = self.tasks.get(task_gid)
+        if task is None:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        return 200, {"data": self._project(task, params)}
+
+    def _events(self, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        self._sync += 1
+        token = f"sync-{self._sync}"
+        if not params.get("sync"):
+            return 412, {"errors": [{"message": "Sync token invalid or too old"}], "sync": token}
+        return 200, {"data": [], "sync": token, "has_more": False}
+
+    def _create_task(self, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        data = dict((body or {}).get("data") or {})
+        gid = self.add_task(data.pop("name", "Untitled"))
+        self.tasks[gid].update({key: value for key, value in data.items() if isinstance(value, str)})
+        return 201, {"data": self.tasks[gid]}
+
+    def _create_subtask(self, parent_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        if parent_gid not in self.tasks:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        status, created = self._create_task(params, body)
+        created["data"]["parent"] = {"gid": parent_gid}
+        self.tasks[parent_gid]["num_subtasks"] += 1
+        return status, created
+
+    def _list_subtasks(self, task_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        if task_gid not in self.tasks:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        children = [task for task in self.tasks.values() if (task.get("parent") or {}).get("gid") == task_gid]
+        return 200, self._page(children, params, f"/tasks/{task_gid}/subtasks")
+
+    def _list_links(self, task_gid: str, kind: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        task = self.tasks.get(task_gid)
+        if task is None:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        linked = [self.tasks[gid] for gid in task.get(kind) or [] if gid in self.tasks]
+        return 200, self._page(linked, params, f"/tasks/{task_gid}/{kind}")
+
+    def _list_stories(self, task_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        if task_gid not in self.tasks:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        stories = [
+            {"gid": f"{task_gid}{index:02d}", "resource_type": "story", "text": f"Update {index}"}
+            for index in range(3)
+        ]
+        return 200, self._page(stories, params, f"/tasks/{task_gid}/stories")
+
+    def _link_tasks(self, task_gid: str, action: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        data = (body or {}).get("data") or {}
+        linked = data.get("dependencies") or data.get("dependents") or []
+        if task_gid not in self.tasks or any(gid not in self.tasks for gid in linked):
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        kind = "dependencies" if action == "addDependencies" else "dependents"
+        self.tasks[task_gid].setdefault(kind, []).extend(linked)
+        return 200, {"data": {}}
+
+    def _update_task(self, task_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        task = self.tasks.get(task_gid)
+        if task is None:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        task.update((body or {}).get("data") or {})
+        return 200, {"data": task}
+
+    def _delete_task(self, task_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        if self.tasks.pop(task_gid, None) is None:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        return 200, {"data": {}}
+
+    def _add_task_to_section(self, section_gid: str, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        task_gid = ((body or {}).get("data") or {}).get("task")
+        if task_gid not in self.tasks:
+            return 404, {"errors": [{"message": "task: Not a recognized ID"}]}
+        return 200, {"data": {}}
+
+    def _batch(self, params: Dict[str, str], body: Any) -> Tuple[int, Dict[str, Any]]:
+        results = []
+        for action in ((body or {}).get("data") or {}).get("actions") or []:
+            method = action.get("method", "get").upper()
+            relative_path = action.get("relative_path", "")
+            self.calls[f"{method} {endpoint_family(relative_path)} (batched)"] += 1
+            status, payload = self.dispatch(method, relative_path, {}, {"data": action.get("data")})
+            results.append({"status_code": status, "headers": {}, "body": payload})
+        return 200, {"data": results}
+
+    def upstream_calls(self) -> int:
+        return sum(count for key, count in self.calls.items() if not key.endswith("(batched)"))
@@ -1,23 +1,187 @@
 import argparse
-import json
-from typing import Any, Callable, Dict
+import asyncio
+import sys
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, TextIO, Union
+
+from src import codec
+
+ToolFn = Callable[[Dict[str, Any]], Any]
+
+# In --order input, finished results wait for earlier lines; this many
+# parallel-windows may be buffered before reading more input.
+INPUT_ORDER_WINDOW = 4
 
 
 def load_payload(args: argparse.Namespace) -> Dict[str, Any]:
     if args.payload_file:
-        with open(args.payload_file, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        with open(args.payload_file, "rb") as handle:
+            return codec.loads(handle.read())
     if args.payload:
-        return json.loads(args.payload)
+        return codec.loads(args.payload)
     return {}
 
 
-def run_tool(tool_fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+def _error(code: str, message: str) -> Dict[str, Any]:
+    return {"status": "error", "error": {"code": code, "message": message}}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _call(tool_fn: ToolFn, payload: Dict[str, Any]) -> Any:
+    if asyncio.iscoroutinefunction(tool_fn):
+        return await tool_fn(payload)
+    result = await asyncio.to_thread(tool_fn, payload)
+    return await result if asyncio.iscoroutine(result) else result
+
+
+async def run_jsonl(
+    tool_fn: ToolFn,
+    source: IO[str],
+    out: TextIO,
+    parallel: int = 8,
+    order: str = "input",
+) -> Dict[str, Any]:
+    """Run one payload per input line with at most ``parallel`` in flight.
+
+    Each output line is ``{"line": n, "result": envelope}``; the last line is
+    ``{"summary": {...}}``. Every call shares the process-wide client, so the
+    configured rate limit applies across the whole batch.
+    """
+    slots = asyncio.Semaphore(max(1, parallel))
+    window = asyncio.Semaphore(max(1, parallel) * INPUT_ORDER_WINDOW)
+    pending: Dict[int, Dict[str, Any]] = {}
+    next_seq = 0
+    counts = {"total": 0, "ok": 0, "error": 0, "invalid": 0}
+    latencies: List[float] = []
+    started = time.perf_counter()
+
+    def write(record: Dict[str, Any]) -> None:
+        out.write(codec.dumps_text(record, sort_keys=True) + "\n")
+        out.flush()
+
+    def emit(record: Dict[str, Any]) -> None:
+        # Every result line took a window slot when its input was read.
+        write(record)
+        window.release()
+
+    def finish(seq: int, line: int, result: Any, outcome: Optional[str] = None) -> None:
+        nonlocal next_seq
+        if outcome is None:
+            ok = not isinstance(result, dict) or result.get("status") != "error"
+            outcome = "ok" if ok else "error"
+        counts[outcome] += 1
+        record = {"line": line, "result": result}
+        if order == "completion":
+            emit(record)
+            return
+        pending[seq] = record
+        while next_seq in pending:
+            emit(pending.pop(next_seq))
+            next_seq += 1
+
+    async def run_one(seq: int, line: int, payload: Dict[str, Any]) -> None:
+        call_started = time.perf_counter()
+        try:
+            result = await _call(tool_fn, payload)
+        except Exception as exc:  # noqa: BLE001 - one bad payload must not stop the batch
+            result = _error("exception", f"{type(exc).__name__}: {exc}")
+        finally:
+            latencies.append(time.perf_counter() - call_started)
+            slots.release()
+        finish(seq, line, result)
+
+    tasks = set()
+    line = 0
+    while True:
+        text = await asyncio.to_thread(source.readline)
+        if not text:
+            break
+        line += 1
+        if not text.strip():
+            continue
+        seq = counts["total"]
+        counts["total"] += 1
+        await window.acquire()
+        try:
+            payload = codec.loads(text)
+            if not isinstance(payload, dict):
+                raise ValueError("payload must be a JSON object")
+        except ValueError as exc:
+            finish(seq, line, _error("invalid_payload", str(exc)), "invalid")
+            continue
+        await slots.acquire()
+        task = asyncio.ensure_future(run_one(seq, line, payload))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+    summary = {
+        **counts,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 0.5) * 1000, 1),
+            "p95": round(_percentile(latencies, 0.95) * 1000, 1),
+            "max": round(max(latencies, default=0.0) * 1000, 1),
+        },
+    }
+    write({"summary": summary})
+    return summary
+
+
+def _resolve(tool: Union[str, ToolFn]) -> ToolFn:
+    if not isinstance(tool, str):
+        return tool
+    from src import tool_impl
+
+    return getattr(tool_impl, tool)
+
+
+def run_tool(tool: Union[str, ToolFn]) -> None:
+    """CLI entry point. Pass the tool_impl function name so a single payload can
+    be forwarded to a running daemon without importing the client stack."""
     parser = argparse.ArgumentParser()
     parser.add_argument("--payload", help="JSON payload string", default=None)
     parser.add_argument("--payload-file", help="Path to JSON payload file", default=None)
+    parser.add_argument("--jsonl", help="Run one payload per line from this file ('-' for stdin)", default=None)
+    parser.add_argument("--parallel", type=int, default=8, help="Concurrent payloads in --jsonl mode")
+    parser.add_argument(
+        "--order",
+        choices=("input", "completion"),
+        default="input",
+        help="Emit --jsonl results in input order or as they finish",
+    )
+    parser.add_argument("--no-daemon", action="store_true", help="Always run in-process")
     args = parser.parse_args()
 
+    if args.jsonl:
+        source: Optional[IO[str]] = None
+        try:
+            source = sys.stdin if args.jsonl == "-" else open(args.jsonl, "r", encoding="utf-8")
+            asyncio.run(run_jsonl(_resolve(tool), source, sys.stdout, args.parallel, args.order))
+        finally:
+            if source is not None and source is not sys.stdin:
+                source.close()
+        return
+
     payload = load_payload(args)
-    result = tool_fn(payload)
-    print(json.dumps(result, indent=2, sort_keys=True))
+    result = None
+    if isinstance(tool, str) and not args.no_daemon:
+        from src.daemon import DaemonError, forward
+
+        try:
+            result = forward(tool, payload)
+        except DaemonError as exc:
+            print(exc, file=sys.stderr)
+            raise SystemExit(1) from exc
+    if result is None:
+        result = _resolve(tool)(payload)
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+    print(codec.dumps_pretty(result))
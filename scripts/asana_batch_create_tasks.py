@@ -0,0 +1,5 @@
+from scripts._tool_runner import run_tool
+
+
+if __name__ == "__main__":
+    run_tool("batch_create_tasks")
@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import create_task
 
 
 if __name__ == "__main__":
-    run_tool(create_task)
+    run_tool("create_task")
@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import delete_task
 
 
 if __name__ == "__main__":
-    run_tool(delete_task)
+    run_tool("delete_task")
@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import get_task
 
 
 if __name__ == "__main__":
-    run_tool(get_task)
+    run_tool("get_task")
@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import list_projects
 
 
 if __name__ == "__main__":
-    run_tool(list_projects)
+    run_tool("list_projects")
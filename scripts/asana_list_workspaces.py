@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import list_workspaces
 
 
 if __name__ == "__main__":
-    run_tool(list_workspaces)
+    run_tool("list_workspaces")
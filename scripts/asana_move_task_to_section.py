@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import move_task_to_section
 
 
 if __name__ == "__main__":
-    run_tool(move_task_to_section)
+    run_tool("move_task_to_section")
@@ -1,6 +1,5 @@
 from scripts._tool_runner import run_tool
-from src.tool_impl import search_tasks
 
 
 if __name__ == "__main__":
-    run_tool(search_tasks)
+    run_tool("search_tasks")
@@ -1,20 +1,19 @@
 import sys
 
-
-try:
-    from src.server import main as server_main
-except ModuleNotFoundError as exc:
-    if exc.name == "mcp":
-        print(
-            "Missing dependency: mcp. Install with `uv sync` (or `uv sync --group dev`).",
-            file=sys.stderr,
-        )
-        raise SystemExit(1) from exc
-    raise
+from src.server import main as server_main
 
 
 def main() -> None:
-    server_main()
+    try:
+        server_main()
+    except ModuleNotFoundError as exc:
+        if exc.name == "mcp":
+            print(
+                "Missing dependency: mcp. Install with `uv sync` (or `uv sync --group dev`).",
+                file=sys.stderr,
+            )
+            raise SystemExit(1) from exc
+        raise
 
 
 if __name__ == "__main__":
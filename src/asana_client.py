@@ -1,32 +1,300 @@
+import asyncio
+import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, NoReturn, Optional, Tuple, Union
 
 import httpx
 
-from src.config import get_settings
+from src import codec
+from src.cache import CacheKey, ResponseCache, cache_key, invalidation_prefixes
+from src.circuit_breaker import CircuitBreaker, CircuitOpen
+from src.config import Settings, get_settings
+from src.metrics import REGISTRY, Metrics, endpoint_family
+from src.rate_limit import RateLimiter
+from src.retry import RetryPolicy, RetryState
+from src.singleflight import AsyncSingleFlight, SingleFlight
 
 
 class AsanaError(RuntimeError):
+    code = "asana_error"
+
     def __init__(self, status_code: int, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.status_code = status_code
         self.details = details or {}
 
 
-def _is_retryable(status_code: int) -> bool:
-    return status_code in {429, 500, 502, 503, 504}
+class CircuitOpenError(AsanaError):
+    code = "circuit_open"
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            503,
+            f"Asana is failing for {endpoint}; not sending requests for {retry_in:.1f}s",
+            {"endpoint": endpoint, "retry_after_seconds": round(retry_in, 3)},
+        )
+
+
+class DeadlineExceededError(AsanaError):
+    code = "deadline_exceeded"
+
+    def __init__(self, path: str, wait: float, remaining: float):
+        super().__init__(
+            504,
+            "Request deadline reached before the Asana call could be sent",
+            {"endpoint": endpoint_family(path), "wait_seconds": round(wait, 3), "remaining_seconds": round(remaining, 3)},
+        )
+
+
+class TransportFailedError(AsanaError):
+    code = "transport_error"
+
+    def __init__(self, path: str, exc: httpx.TransportError):
+        super().__init__(
+            503,
+            f"Could not reach Asana: {type(exc).__name__}",
+            {"endpoint": endpoint_family(path), "error": str(exc)},
+        )
+
+
+def _retry_reason(response: httpx.Response) -> str:
+    return "rate_limited" if response.status_code == 429 else "server_error"
+
+
+def _error_from_response(response: httpx.Response) -> AsanaError:
+    try:
+        data = codec.loads(response.content)
+    except ValueError:
+        data = {"message": response.text}
+    return AsanaError(response.status_code, "Asana API error", data)
+
+
+MAX_PAGE_SIZE = 100
+JSON_HEADERS = {"Content-Type": "application/json"}
+SEARCH_CURSOR_FIELD = "created_at"
+SEARCH_CURSOR_PARAM = "created_at.before"
+
+
+def _page_params(
+    params: Optional[Dict[str, Any]], page_size: int, remaining: Optional[int]
+) -> Dict[str, Any]:
+    page_params = dict(params or {})
+    limit = min(page_size, MAX_PAGE_SIZE)
+    page_params["limit"] = min(limit, remaining) if remaining is not None else limit
+    return page_params
+
+
+def _search_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    search_params = dict(params or {})
+    if search_params.get("sort_by", SEARCH_CURSOR_FIELD) != SEARCH_CURSOR_FIELD:
+        return None
+    search_params["sort_by"] = SEARCH_CURSOR_FIELD
+    search_params["sort_ascending"] = False
+    fields = [f for f in str(search_params.get("opt_fields", "")).split(",") if f]
+    if fields and SEARCH_CURSOR_FIELD not in fields:
+        fields.append(SEARCH_CURSOR_FIELD)
+        search_params["opt_fields"] = ",".join(fields)
+    elif not fields:
+        search_params["opt_fields"] = f"name,{SEARCH_CURSOR_FIELD}"
+    return search_params
+
+
+def _unsorted_search_page(response: Dict[str, Any], limit: int, max_items: Optional[int]) -> Dict[str, Any]:
+    # Only created_at ordering has a cursor; other sorts stop after one page, so flag a full page
+    # when the caller asked for more than it could hold.
+    items = response.get("data") or []
+    wanted_more = max_items is None or max_items > limit
+    response["next_page"] = None
+    response["truncated"] = wanted_more and len(items) >= limit
+    return response
+
+
+def _search_cursor(items: List[Dict[str, Any]], requested: int) -> Optional[str]:
+    if len(items) < requested:
+        return None
+    last = items[-1] if isinstance(items[-1], dict) else {}
+    return last.get(SEARCH_CURSOR_FIELD)
+
+
+def _next_offset(response: Dict[str, Any]) -> Optional[str]:
+    next_page = response.get("next_page") if isinstance(response, dict) else None
+    return next_page.get("offset") if isinstance(next_page, dict) else None
 
 
-class AsanaClient:
-    def __init__(self) -> None:
-        settings = get_settings()
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _timeout(settings: Settings) -> httpx.Timeout:
+    default = settings.asana_timeout_seconds
+    return httpx.Timeout(
+        default,
+        connect=settings.asana_connect_timeout_seconds or default,
+        read=settings.asana_read_timeout_seconds or default,
+        write=settings.asana_write_timeout_seconds or default,
+        pool=settings.asana_pool_timeout_seconds or default,
+    )
+
+
+def _limits(settings: Settings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.asana_max_connections,
+        max_keepalive_connections=settings.asana_max_keepalive_connections,
+        keepalive_expiry=settings.asana_keepalive_expiry_seconds,
+    )
+
+
+class _BaseAsanaClient:
+    _flights: Union[SingleFlight, AsyncSingleFlight]
+    _client: Union[httpx.Client, httpx.AsyncClient]
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[Metrics] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        settings = settings or get_settings()
         self.base_url = settings.asana_api_base.rstrip("/")
-        self.timeout = settings.asana_timeout_seconds
-        self.max_retries = settings.asana_max_retries
+        self.timeout = _timeout(settings)
+        self.limits = _limits(settings)
+        self.http2 = settings.asana_http2 and http2_available()
+        if settings.asana_http2 and not self.http2:
+            logging.getLogger("asana_mcp").warning(
+                "ASANA_HTTP2 is set but the h2 package is missing (install httpx[http2]); using HTTP/1.1."
+            )
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(settings)
+        self.breaker = breaker or CircuitBreaker.from_settings(settings)
+        self._pool_lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._saturated = 0
+        self.limiter = limiter or RateLimiter.from_settings(settings)
+        self.cache = cache if cache is not None else ResponseCache.from_settings(settings)
+        self.metrics = metrics or REGISTRY
+        self._headers = {"Authorization": f"Bearer {settings.asana_access_token}"}
+
+    @property
+    def coalesced_requests(self) -> int:
+        return self._flights.shared
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _request_started(self) -> None:
+        with self._pool_lock:
+            if self._in_flight >= self.limits.max_connections:
+                self._saturated += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _request_finished(self) -> None:
+        with self._pool_lock:
+            self._in_flight -= 1
+
+    def pool_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry_seconds": self.limits.keepalive_expiry,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "saturated_requests": self._saturated,
+        }
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for connection in connections if connection.is_idle())
+            stats["http2_connections"] = sum(1 for connection in connections if "HTTP/2" in connection.info())
+        return stats
+
+    def _cache_lookup(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[CacheKey], Optional[Dict[str, Any]]]:
+        if self.cache is None or method.upper() != "GET" or self.cache.ttl_for(path) is None:
+            return None, None
+        key = cache_key(path, params)
+        cached = self.cache.get(key)
+        return key, codec.loads(cached) if cached is not None else None
+
+    def _cache_store(
+        self,
+        method: str,
+        path: str,
+        key: Optional[CacheKey],
+        payload: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        if self.cache is None:
+            return
+        if key is not None:
+            self.cache.set(key, response.content)
+        elif method.upper() != "GET":
+            self.cache.invalidate(invalidation_prefixes(method, path, payload))
+
+    def _acquire_circuit(self, path: str) -> Tuple[str, bool]:
+        family = endpoint_family(path)
+        try:
+            return family, self.breaker.acquire(family)
+        except CircuitOpen as exc:
+            self.metrics.record_error(path, "circuit_open")
+            raise CircuitOpenError(family, exc.retry_in) from None
+
+    def _check_wait(self, path: str, retry: RetryState, delay: float, cost: float) -> None:
+        remaining = retry.remaining()
+        if delay > remaining or remaining <= 0:
+            # The request will not be sent, so its tokens go back to the bucket.
+            self.limiter.refund(path, cost)
+            self.metrics.record_error(path, "deadline_exceeded")
+            raise DeadlineExceededError(path, delay, remaining)
+
+    def _record_response(self, path: str, response: httpx.Response, family: str, probe: bool) -> None:
+        self.breaker.record(family, failed=response.status_code >= 500, probe=probe)
+        if response.status_code == 429:
+            self.limiter.on_rate_limited(path, self.retry_policy.rate_limit_pause(response))
+        elif response.status_code < 400:
+            self.limiter.on_success(path)
+
+    def _record_retry(self, path: str, reason: str, delay: float) -> None:
+        self.metrics.record_retry(path, reason)
+        self.metrics.record_sleep("backoff", delay)
+
+    def _raise_for_response(self, path: str, response: httpx.Response) -> NoReturn:
+        self.metrics.record_error(path, f"http_{response.status_code}")
+        raise _error_from_response(response)
+
+
+class AsanaClient(_BaseAsanaClient):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[Metrics] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        super().__init__(settings, limiter, cache, metrics, retry_policy, breaker)
+        self._flights = SingleFlight()
         self._client = httpx.Client(
             base_url=self.base_url,
-            headers={"Authorization": f"Bearer {settings.asana_access_token}"},
+            headers=self._headers,
             timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=transport,
         )
 
     def close(self) -> None:
@@ -38,27 +306,306 @@ class AsanaClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         payload: Optional[Dict[str, Any]] = None,
+        cost: float = 1.0,
     ) -> Dict[str, Any]:
-        for attempt in range(self.max_retries + 1):
-            response = self._client.request(
-                method,
-                path,
-                params=params,
-                json=payload,
+        key, cached = self._cache_lookup(method, path, params)
+        if cached is not None:
+            return cached
+        if method.upper() == "GET":
+            response = self._flights.do(
+                key or cache_key(path, params),
+                lambda: self._send(method, path, params, payload, cost, key),
             )
-            if response.status_code < 400:
-                return response.json()
+        else:
+            response = self._send(method, path, params, payload, cost, key)
+        return codec.loads(response.content)
 
-            if _is_retryable(response.status_code) and attempt < self.max_retries:
-                retry_after = response.headers.get("Retry-After")
-                delay = float(retry_after) if retry_after else 2 ** attempt
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        payload: Optional[Dict[str, Any]],
+        cost: float,
+        key: Optional[CacheKey],
+    ) -> httpx.Response:
+        retry = self.retry_policy.begin(method)
+        # Encoded once, outside the retry loop.
+        body = codec.dumps(payload) if payload is not None else None
+        while True:
+            family, probe = self._acquire_circuit(path)
+            try:
+                delay = self.limiter.reserve(path, cost)
+                self._check_wait(path, retry, delay, cost)
+                if delay:
+                    self.metrics.record_sleep("rate_limit", delay)
+                    time.sleep(delay)
+                with self.limiter.slots, self.metrics.track_request(method, path) as call:
+                    self._request_started()
+                    try:
+                        response = self._client.request(
+                            method,
+                            path,
+                            params=params,
+                            content=body,
+                            headers=JSON_HEADERS if body is not None else None,
+                        )
+                    finally:
+                        self._request_finished()
+                    call.status = response.status_code
+            except httpx.TransportError as exc:
+                self.breaker.record(family, failed=True, probe=probe)
+                delay = retry.next_delay()
+                if delay is None:
+                    raise TransportFailedError(path, exc) from exc
+                self._record_retry(path, "transport_error", delay)
                 time.sleep(delay)
                 continue
+            except BaseException:
+                self.breaker.release(family, probe)
+                raise
+            self._record_response(path, response, family, probe)
+            if response.status_code < 400:
+                self._cache_store(method, path, key, payload, response)
+                return response
+
+            delay = retry.next_delay(response)
+            if delay is None:
+                self._raise_for_response(path, response)
+            self._record_retry(path, _retry_reason(response), delay)
+            time.sleep(delay)
 
+    def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        remaining = max_items
+        offset = None
+        while remaining is None or remaining > 0:
+            page_params = _page_params(params, page_size, remaining)
+            if offset:
+                page_params["offset"] = offset
+            response = self.request("GET", path, params=page_params)
+            yield response
+            if remaining is not None:
+                remaining -= len(response.get("data") or [])
+            offset = _next_offset(response)
+            if not offset:
+                return
+
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        for page in self.iter_pages(path, params, page_size, max_items):
+            yield from page.get("data") or []
+
+    def iter_search_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        search_params = _search_params(params)
+        if search_params is None:
+            page_params = _page_params(params, page_size, max_items)
+            response = self.request("GET", path, params=page_params)
+            yield _unsorted_search_page(response, page_params["limit"], max_items)
+            return
+        remaining = max_items
+        while remaining is None or remaining > 0:
+            page_params = _page_params(search_params, page_size, remaining)
+            response = self.request("GET", path, params=page_params)
+            items = response.get("data") or []
+            cursor = _search_cursor(items, page_params["limit"])
+            response["next_page"] = {SEARCH_CURSOR_PARAM: cursor} if cursor else None
+            yield response
+            if not cursor:
+                return
+            if remaining is not None:
+                remaining -= len(items)
+            search_params[SEARCH_CURSOR_PARAM] = cursor
+
+
+class AsyncAsanaClient(_BaseAsanaClient):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[Metrics] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        super().__init__(settings, limiter, cache, metrics, retry_policy, breaker)
+        self._flights = AsyncSingleFlight()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def prewarm(self, connections: int = 1) -> int:
+        # A minimal /users/me per connection pays the TLS handshake up front and
+        # confirms the token. HTTP/2 multiplexes, so one connection is enough.
+        count = 1 if self.http2 else max(1, min(connections, self.limits.max_connections))
+        results = await asyncio.gather(
+            *(
+                self._send("GET", "/users/me", {"opt_fields": "gid"}, None, 1.0, None)
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return count
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        cost: float = 1.0,
+    ) -> Dict[str, Any]:
+        key, cached = self._cache_lookup(method, path, params)
+        if cached is not None:
+            return cached
+        if method.upper() == "GET":
+            response = await self._flights.do(
+                key or cache_key(path, params),
+                lambda: self._send(method, path, params, payload, cost, key),
+            )
+        else:
+            response = await self._send(method, path, params, payload, cost, key)
+        return codec.loads(response.content)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        payload: Optional[Dict[str, Any]],
+        cost: float,
+        key: Optional[CacheKey],
+    ) -> httpx.Response:
+        retry = self.retry_policy.begin(method)
+        # Encoded once, outside the retry loop.
+        body = codec.dumps(payload) if payload is not None else None
+        while True:
+            family, probe = self._acquire_circuit(path)
             try:
-                data = response.json()
-            except ValueError:
-                data = {"message": response.text}
-            raise AsanaError(response.status_code, "Asana API error", data)
+                delay = self.limiter.reserve(path, cost)
+                self._check_wait(path, retry, delay, cost)
+                if delay:
+                    self.metrics.record_sleep("rate_limit", delay)
+                    await asyncio.sleep(delay)
+                async with self.limiter.async_slots():
+                    with self.metrics.track_request(method, path) as call:
+                        self._request_started()
+                        try:
+                            response = await self._client.request(
+                                method,
+                                path,
+                                params=params,
+                                content=body,
+                                headers=JSON_HEADERS if body is not None else None,
+                            )
+                        finally:
+                            self._request_finished()
+                        call.status = response.status_code
+            except httpx.TransportError as exc:
+                self.breaker.record(family, failed=True, probe=probe)
+                delay = retry.next_delay()
+                if delay is None:
+                    raise TransportFailedError(path, exc) from exc
+                self._record_retry(path, "transport_error", delay)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self.breaker.release(family, probe)
+                raise
+            self._record_response(path, response, family, probe)
+            if response.status_code < 400:
+                self._cache_store(method, path, key, payload, response)
+                return response
+
+            delay = retry.next_delay(response)
+            if delay is None:
+                self._raise_for_response(path, response)
+            self._record_retry(path, _retry_reason(response), delay)
+            await asyncio.sleep(delay)
 
-        raise AsanaError(500, "Asana API retry exhaustion")
+    async def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        remaining = max_items
+        offset = None
+        while remaining is None or remaining > 0:
+            page_params = _page_params(params, page_size, remaining)
+            if offset:
+                page_params["offset"] = offset
+            response = await self.request("GET", path, params=page_params)
+            yield response
+            if remaining is not None:
+                remaining -= len(response.get("data") or [])
+            offset = _next_offset(response)
+            if not offset:
+                return
+
+    async def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for page in self.iter_pages(path, params, page_size, max_items):
+            for item in page.get("data") or []:
+                yield item
+
+    async def iter_search_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        search_params = _search_params(params)
+        if search_params is None:
+            page_params = _page_params(params, page_size, max_items)
+            response = await self.request("GET", path, params=page_params)
+            yield _unsorted_search_page(response, page_params["limit"], max_items)
+            return
+        remaining = max_items
+        while remaining is None or remaining > 0:
+            page_params = _page_params(search_params, page_size, remaining)
+            response = await self.request("GET", path, params=page_params)
+            items = response.get("data") or []
+            cursor = _search_cursor(items, page_params["limit"])
+            response["next_page"] = {SEARCH_CURSOR_PARAM: cursor} if cursor else None
+            yield response
+            if not cursor:
+                return
+            if remaining is not None:
+                remaining -= len(items)
+            search_params[SEARCH_CURSOR_PARAM] = cursor
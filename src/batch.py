@@ -0,0 +1,64 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from src.asana_client import AsanaError, AsyncAsanaClient
+
+BATCH_LIMIT = 10
+BATCH_PATH = "/batch"
+
+
+def batch_action(
+    method: str,
+    relative_path: str,
+    data: Optional[Dict[str, Any]] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    action: Dict[str, Any] = {"method": method.lower(), "relative_path": relative_path}
+    if data is not None:
+        action["data"] = data
+    if options:
+        action["options"] = options
+    return action
+
+
+def chunked(items: List[Any], size: int = BATCH_LIMIT) -> List[List[Any]]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+async def _send_chunk(client: AsyncAsanaClient, actions: List[Dict[str, Any]]) -> List[Any]:
+    try:
+        response = await client.request(
+            "POST",
+            BATCH_PATH,
+            payload={"data": {"actions": actions}},
+            cost=len(actions),
+        )
+    except AsanaError as exc:
+        return [exc] * len(actions)
+    results = response.get("data") if isinstance(response, dict) else None
+    if not isinstance(results, list) or len(results) != len(actions):
+        return [AsanaError(502, "Asana batch response did not match request", {"details": response})] * len(actions)
+    return results
+
+
+def _window(client: AsyncAsanaClient) -> int:
+    """Chunks in flight at once.
+
+    Each chunk reserves ``BATCH_LIMIT`` tokens when it starts and then waits
+    for them, so starting every chunk together pushes the later ones past
+    their retry deadline before they are sent. Starting only as many as the
+    bucket's burst covers keeps each chunk's wait to a few refills.
+    """
+    limiter = client.limiter
+    return max(1, min(limiter.max_concurrent, int(limiter.burst // BATCH_LIMIT)))
+
+
+async def run_batch(client: AsyncAsanaClient, actions: List[Dict[str, Any]]) -> List[Any]:
+    slots = asyncio.Semaphore(_window(client))
+
+    async def send(chunk: List[Dict[str, Any]]) -> List[Any]:
+        async with slots:
+            return await _send_chunk(client, chunk)
+
+    responses = await asyncio.gather(*(send(chunk) for chunk in chunked(actions)))
+    return [result for chunk_results in responses for result in chunk_results]
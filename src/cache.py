@@ -0,0 +1,186 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from src.config import Settings
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+DEFAULT_TTLS: Sequence[Tuple[Pattern[str], float]] = (
+    (re.compile(r"^/users/me$"), 300.0),
+    (re.compile(r"^/workspaces$"), 300.0),
+    (re.compile(r"^/workspaces/[^/]+/projects$"), 120.0),
+    (re.compile(r"^/tasks/[^/]+$"), 30.0),
+)
+
+
+def _normalize_param(key: str, value: Any) -> str:
+    if key == "opt_fields":
+        fields = {field.strip() for field in str(value).split(",") if field.strip()}
+        return ",".join(sorted(fields))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def cache_key(path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    normalized = tuple(
+        sorted((key, _normalize_param(key, value)) for key, value in (params or {}).items())
+    )
+    return (path, normalized)
+
+
+def invalidation_prefixes(method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> List[str]:
+    data = payload.get("data") if isinstance(payload, dict) else None
+    data = data if isinstance(data, dict) else {}
+    parts = [part for part in path.split("/") if part]
+    prefixes: List[str] = []
+
+    if parts == ["batch"]:
+        for action in data.get("actions") or []:
+            prefixes.extend(
+                invalidation_prefixes(
+                    action.get("method", ""),
+                    action.get("relative_path", ""),
+                    {"data": action.get("data")},
+                )
+            )
+        return prefixes
+
+    if parts[:1] == ["tasks"] and len(parts) >= 2:
+        prefixes.append(f"/tasks/{parts[1]}")
+    if parts[:1] == ["sections"] and data.get("task"):
+        prefixes.append(f"/tasks/{data['task']}")
+    # Only workspace project listings are cached for projects; a write to a
+    # project whose workspace the path does not name clears all of them.
+    if parts[:1] == ["projects"]:
+        workspace = data.get("workspace")
+        prefixes.append(f"/workspaces/{workspace or '*'}/projects")
+    elif parts[-1:] == ["projects"]:
+        workspace = parts[1] if parts[0] == "workspaces" else data.get("workspace")
+        prefixes.append(f"/workspaces/{workspace or '*'}/projects")
+    if data.get("parent"):
+        prefixes.append(f"/tasks/{data['parent']}")
+    return prefixes
+
+
+def _covers(prefix: str, path: str) -> bool:
+    """``path`` is ``prefix`` or below it; a ``*`` segment in ``prefix`` matches any one segment."""
+    if "*" not in prefix:
+        return path == prefix or path.startswith(prefix + "/")
+    wanted = prefix.split("/")
+    actual = path.split("/")
+    return len(actual) >= len(wanted) and all(want in ("*", got) for want, got in zip(wanted, actual))
+
+
+class _Entry:
+    __slots__ = ("content", "expires_at", "size")
+
+    def __init__(self, content: bytes, expires_at: float) -> None:
+        self.content = content
+        self.expires_at = expires_at
+        self.size = len(content)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 8_000_000,
+        ttls: Sequence[Tuple[Pattern[str], float]] = DEFAULT_TTLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._ttls = ttls
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Optional["ResponseCache"]:
+        if not settings.asana_cache_enabled:
+            return None
+        return cls(settings.asana_cache_max_entries, settings.asana_cache_max_bytes)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self._ttls:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    def _drop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.content
+
+    def set(self, key: CacheKey, content: bytes) -> None:
+        ttl = self.ttl_for(key[0])
+        if ttl is None or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            entry = _Entry(content, self._clock() + ttl)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, prefixes: Iterable[str]) -> int:
+        prefixes = tuple(prefixes)
+        if not prefixes:
+            return 0
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if any(_covers(prefix, key[0]) for prefix in prefixes)
+            ]
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
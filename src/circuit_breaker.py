@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from src.config import Settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {key}")
+        self.key = key
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "trips")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.trips = 0
+
+
+class CircuitBreaker:
+    """Per-key breaker: opens after consecutive failures, probes after a cool-down.
+
+    Keys are endpoint families, so an outage of search does not block task reads.
+    ``acquire`` returns True when the caller holds a half-open probe slot; pass
+    that flag back to ``record`` (or ``release`` if the request was abandoned).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "CircuitBreaker":
+        return cls(
+            settings.asana_circuit_failure_threshold,
+            settings.asana_circuit_reset_seconds,
+            settings.asana_circuit_half_open_probes,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def acquire(self, key: str) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return False
+            now = self._clock()
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise CircuitOpen(key, remaining)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpen(key, 0.0)
+            circuit.probes += 1
+            return True
+
+    def record(self, key: str, failed: bool, probe: bool = False) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state == HALF_OPEN and probe:
+                circuit.probes -= 1
+                if failed:
+                    self._trip(circuit)
+                else:
+                    circuit.state = CLOSED
+                    circuit.failures = 0
+            elif circuit.state == CLOSED:
+                circuit.failures = circuit.failures + 1 if failed else 0
+                if circuit.failures >= self.failure_threshold:
+                    self._trip(circuit)
+
+    def release(self, key: str, probe: bool) -> None:
+        if not probe:
+            return
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def _trip(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.probes = 0
+        circuit.trips += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            return {
+                key: {
+                    "state": circuit.state,
+                    "consecutive_failures": circuit.failures,
+                    "trips": circuit.trips,
+                    "retry_in_seconds": round(max(0.0, circuit.opened_at + self.reset_timeout - now), 3)
+                    if circuit.state == OPEN
+                    else 0.0,
+                }
+                for key, circuit in self._circuits.items()
+                if circuit.state != CLOSED or circuit.failures or circuit.trips
+            }
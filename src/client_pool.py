@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.asana_client import AsanaError, AsyncAsanaClient
+from src.cache import ResponseCache
+from src.config import Settings
+from src.credentials import TokenFile, fingerprint
+from src.rate_limit import RateLimiter
+
+# A client handed out this recently may not have started its request yet, so
+# capacity eviction leaves it alone.
+EVICTION_GRACE_SECONDS = 1.0
+MAX_SWEEP_INTERVAL = 60.0
+
+
+class ClientPoolFull(AsanaError):
+    code = "client_pool_full"
+
+    def __init__(self, max_clients: int):
+        super().__init__(503, "Too many Asana credentials in use; try again shortly", {"max_clients": max_clients})
+
+
+class _Entry:
+    __slots__ = ("client", "last_used")
+
+    def __init__(self, client: AsyncAsanaClient, last_used: float) -> None:
+        self.client = client
+        self.last_used = last_used
+
+
+class ClientPool:
+    """One ``AsyncAsanaClient`` per credential, each with its own connections,
+    rate-limit buckets, response cache and circuit breaker.
+
+    ``get(None)`` returns the server's own credential, re-read from
+    ``ASANA_TOKEN_FILE`` when the file changes. Idle clients are closed after
+    ``idle_seconds``; at ``max_clients`` the least recently used idle client is
+    evicted, and if every client is busy the call fails with ``client_pool_full``.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        token_file: Optional[TokenFile] = None,
+        default_limiter: Optional[RateLimiter] = None,
+        default_cache: Optional[ResponseCache] = None,
+        factory: Optional[Callable[[Settings, RateLimiter, Optional[ResponseCache]], AsyncAsanaClient]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings
+        self.max_clients = settings.asana_client_pool_max
+        self.idle_seconds = settings.asana_client_idle_seconds
+        self._token_file = token_file or TokenFile(None, settings.asana_access_token)
+        self._default_limiter = default_limiter
+        self._default_cache = default_cache
+        self._default_token = self._token_file.token()
+        self._factory = factory or (
+            lambda resolved, limiter, cache: AsyncAsanaClient(resolved, limiter=limiter, cache=cache)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._closing: Set["asyncio.Task[Any]"] = set()
+        self._swept = clock()
+        self.created = 0
+        self.evicted = 0
+
+    def get(self, token: Optional[str] = None) -> AsyncAsanaClient:
+        if token is None:
+            token = self._current_default()
+        default = token == self._default_token
+        key = fingerprint(token)
+        now = self._clock()
+        with self._lock:
+            if now - self._swept >= min(self.idle_seconds, MAX_SWEEP_INTERVAL):
+                self._swept = now
+                self._evict(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._evict(now, room_for=1)
+                entry = _Entry(self._build(token, default), now)
+                self._entries[key] = entry
+                self.created += 1
+            entry.last_used = now
+            self._entries.move_to_end(key)
+            return entry.client
+
+    def _current_default(self) -> str:
+        token = self._token_file.token()
+        if token != self._default_token:
+            self._default_token = token
+            # The cache may hold another identity's view; the old client ages out.
+            if self._default_cache is not None:
+                self._default_cache.clear()
+        return token
+
+    def default_credential(self) -> str:
+        """Fingerprint of the server credential, after any token file reload."""
+        return fingerprint(self._current_default())
+
+    def _build(self, token: str, default: bool) -> AsyncAsanaClient:
+        resolved = self.settings.model_copy(update={"asana_access_token": token})
+        if default and self._default_limiter is not None:
+            return self._factory(resolved, self._default_limiter, self._default_cache)
+        return self._factory(resolved, RateLimiter.from_settings(resolved), ResponseCache.from_settings(resolved))
+
+    def _evict(self, now: float, room_for: int = 0) -> None:
+        for key, entry in list(self._entries.items()):
+            if entry.client.in_flight or now - entry.last_used < EVICTION_GRACE_SECONDS:
+                continue
+            idle = now - entry.last_used >= self.idle_seconds
+            full = len(self._entries) + room_for > self.max_clients
+            if idle or full:
+                self._close(self._entries.pop(key).client)
+                self.evicted += 1
+        if len(self._entries) + room_for > self.max_clients:
+            raise ClientPoolFull(self.max_clients)
+
+    def _close(self, client: AsyncAsanaClient) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(client.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def evict_idle(self) -> int:
+        before = self.evicted
+        with self._lock:
+            self._evict(self._clock())
+        return self.evicted - before
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), *self._closing, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            default_key = fingerprint(self._default_token)
+            clients = [
+                {
+                    "credential": key,
+                    "default": key == default_key,
+                    "idle_seconds": round(now - entry.last_used, 3),
+                    "in_flight": entry.client.in_flight,
+                }
+                for key, entry in self._entries.items()
+            ]
+        return {
+            "clients": clients,
+            "max_clients": self.max_clients,
+            "idle_seconds": self.idle_seconds,
+            "created": self.created,
+            "evicted": self.evicted,
+            "token_reloads": self._token_file.reloads,
+        }
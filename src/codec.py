@@ -0,0 +1,139 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+from src.env import json_codec
+
+# Preference order for ASANA_JSON_CODEC=auto.
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+Dumps = Callable[[Any, bool], bytes]
+Loads = Callable[[Union[bytes, str]], Any]
+
+
+class Codec:
+    """One JSON backend behind ``dumps``/``loads``/``dumps_pretty``.
+
+    Every backend writes the same bytes for the same value: compact separators,
+    UTF-8 rather than ``\\u`` escapes, optional sorted keys. A value the fast
+    backend refuses (ints beyond 64 bits, non-string keys, unknown types) falls
+    back to the standard library, so behaviour never narrows.
+    """
+
+    __slots__ = ("name", "_dumps", "_pretty", "_loads")
+
+    def __init__(self, name: str, dumps: Dumps, pretty: Callable[[Any], bytes], loads: Loads) -> None:
+        self.name = name
+        self._dumps = dumps
+        self._pretty = pretty
+        self._loads = loads
+
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        try:
+            return self._dumps(value, sort_keys)
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(value, sort_keys)
+
+    def dumps_text(self, value: Any, sort_keys: bool = False) -> str:
+        return self.dumps(value, sort_keys).decode("utf-8")
+
+    def dumps_pretty(self, value: Any) -> str:
+        """Indented, key-sorted text for people to read (CLI output)."""
+        try:
+            return self._pretty(value).decode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            return json.dumps(value, indent=2, sort_keys=True, ensure_ascii=False)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError:
+            # Re-parse with the standard library so callers always see json.JSONDecodeError.
+            return json.loads(data)
+
+
+def _stdlib_dumps(value: Any, sort_keys: bool) -> bytes:
+    return json.dumps(value, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib() -> Codec:
+    return Codec(
+        "stdlib",
+        _stdlib_dumps,
+        lambda value: json.dumps(value, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+        json.loads,
+    )
+
+
+def _orjson() -> Codec:
+    import orjson
+
+    def dumps(value: Any, sort_keys: bool) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+    return Codec(
+        "orjson",
+        dumps,
+        lambda value: orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2),
+        orjson.loads,
+    )
+
+
+def _msgspec() -> Codec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    sorted_encoder = msgspec.json.Encoder(order="sorted")
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return Codec(
+        "msgspec",
+        lambda value, sort_keys: (sorted_encoder if sort_keys else encoder).encode(value),
+        lambda value: msgspec.json.format(sorted_encoder.encode(value), indent=2),
+        loads,
+    )
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "stdlib": _stdlib}
+
+
+def build_codec(name: str = "auto") -> Codec:
+    """The named backend, or the first importable one for ``auto``; stdlib if the named one is missing."""
+    for candidate in BACKENDS if name == "auto" else (name, "stdlib"):
+        try:
+            return _FACTORIES[candidate]()
+        except ImportError:
+            continue
+    return _stdlib()
+
+
+@lru_cache
+def get_codec() -> Codec:
+    try:
+        name = json_codec()
+    except ValueError:
+        # The health check reports the bad value; serialization must keep working.
+        name = "auto"
+    return build_codec(name)
+
+
+def dumps(value: Any, sort_keys: bool = False) -> bytes:
+    return get_codec().dumps(value, sort_keys)
+
+
+def dumps_text(value: Any, sort_keys: bool = False) -> str:
+    return get_codec().dumps_text(value, sort_keys)
+
+
+def dumps_pretty(value: Any) -> str:
+    return get_codec().dumps_pretty(value)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return get_codec().loads(data)
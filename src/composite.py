@@ -0,0 +1,142 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.asana_client import AsanaError, AsyncAsanaClient
+from src.batch import BATCH_LIMIT, batch_action, chunked, run_batch
+
+# Later steps often need an earlier step's output (usually a new gid); a builder
+# receives the finished steps' ``data`` by name and returns (path, body).
+Builder = Callable[[Dict[str, Any]], Tuple[str, Optional[Dict[str, Any]]]]
+
+
+class Step:
+    __slots__ = ("name", "method", "path", "data", "after", "build")
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]],
+        after: Tuple[str, ...],
+        build: Optional[Builder],
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.path = path
+        self.data = data
+        self.after = after
+        self.build = build
+
+
+class Plan:
+    """A multi-step tool as a small dependency graph of Asana writes.
+
+    Steps run in waves: every step whose dependencies have finished runs in the
+    next wave. A wave of one step is a plain request; a larger wave goes through
+    the batch API, up to ten steps per upstream call, with the chunks in parallel.
+    """
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, Step] = {}
+
+    def add(
+        self,
+        name: str,
+        method: str,
+        path: str = "",
+        data: Optional[Dict[str, Any]] = None,
+        after: Iterable[str] = (),
+        build: Optional[Builder] = None,
+    ) -> str:
+        after = tuple(after)
+        unknown = [dep for dep in after if dep not in self.steps]
+        if name in self.steps or unknown:
+            raise ValueError(f"Step {name!r} is a duplicate or depends on unknown steps {unknown}")
+        self.steps[name] = Step(name, method, path, data, after, build)
+        return name
+
+    def waves(self) -> List[List[Step]]:
+        # Steps can only depend on earlier ones, so one pass in insertion order
+        # assigns each step the wave after its latest dependency.
+        depth: Dict[str, int] = {}
+        waves: List[List[Step]] = []
+        for step in self.steps.values():
+            level = max((depth[dep] + 1 for dep in step.after), default=0)
+            depth[step.name] = level
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(step)
+        return waves
+
+
+class PlanResult:
+    __slots__ = ("results", "upstream_calls")
+
+    def __init__(self) -> None:
+        # Step name -> response dict, AsanaError, or None when skipped.
+        self.results: Dict[str, Any] = {}
+        self.upstream_calls = 0
+
+    def ok(self, name: str) -> bool:
+        return isinstance(self.results.get(name), dict)
+
+    def data(self, name: str) -> Any:
+        result = self.results.get(name)
+        return result.get("data") if isinstance(result, dict) else None
+
+    def error(self, name: str) -> Optional[AsanaError]:
+        result = self.results.get(name)
+        return result if isinstance(result, AsanaError) else None
+
+
+def _batch_outcome(result: Any) -> Any:
+    if isinstance(result, AsanaError):
+        return result
+    status_code = result.get("status_code", 500) if isinstance(result, dict) else 500
+    body = result.get("body") if isinstance(result, dict) else None
+    if status_code < 400:
+        return body if isinstance(body, dict) else {"data": body}
+    return AsanaError(status_code, "Asana API error", {"details": body})
+
+
+async def _request(client: AsyncAsanaClient, method: str, path: str, data: Optional[Dict[str, Any]]) -> Any:
+    try:
+        return await client.request(method, path, payload={"data": data} if data is not None else None)
+    except AsanaError as exc:
+        return exc
+
+
+async def run_plan(client: AsyncAsanaClient, plan: Plan) -> PlanResult:
+    outcome = PlanResult()
+    for wave in plan.waves():
+        ready = []
+        for step in wave:
+            if all(outcome.ok(dep) for dep in step.after):
+                ready.append(step)
+            else:
+                outcome.results[step.name] = None
+        if not ready:
+            continue
+        finished = {name: outcome.data(name) for name in outcome.results if outcome.ok(name)}
+        requests = []
+        for step in list(ready):
+            try:
+                path, data = step.build(finished) if step.build is not None else (step.path, step.data)
+            except (KeyError, TypeError) as exc:
+                message = "Asana response lacks a field a later step needs"
+                outcome.results[step.name] = AsanaError(502, message, {"step": step.name, "missing": str(exc)})
+                ready.remove(step)
+                continue
+            requests.append((step.method, path, data))
+        if not ready:
+            continue
+        if len(ready) == 1:
+            results = [await _request(client, *requests[0])]
+            outcome.upstream_calls += 1
+        else:
+            actions = [batch_action(method, path, data) for method, path, data in requests]
+            results = [_batch_outcome(result) for result in await run_batch(client, actions)]
+            outcome.upstream_calls += len(chunked(actions, BATCH_LIMIT))
+        for step, result in zip(ready, results):
+            outcome.results[step.name] = result
+    return outcome
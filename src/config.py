@@ -1,46 +1,67 @@
-import logging
-import os
-from pathlib import Path
 from functools import lru_cache
+from typing import Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from src.env import DEFAULT_API_BASE, DEFAULT_LOG_FILE, DEFAULT_LOG_LEVEL, read_settings
+
 
 class Settings(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     asana_access_token: str = Field(min_length=1)
-    asana_api_base: str = "https://app.asana.com/api/1.0"
+    asana_api_base: str = DEFAULT_API_BASE
     asana_timeout_seconds: float = 30.0
-    asana_max_retries: int = 3
-    log_level: str = "INFO"
-    log_file: str = "logs/asana-mcp.log"
+    asana_connect_timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    asana_read_timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    asana_write_timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    asana_pool_timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    asana_http2: bool = False
+    asana_max_connections: int = Field(default=20, ge=1)
+    asana_max_keepalive_connections: int = Field(default=10, ge=0)
+    asana_keepalive_expiry_seconds: float = Field(default=30.0, ge=0)
+    asana_prewarm_connections: int = Field(default=0, ge=0)
+    asana_client_pool_max: int = Field(default=32, ge=1)
+    asana_client_idle_seconds: float = Field(default=900.0, gt=0)
+    asana_token_reload_seconds: float = Field(default=5.0, ge=0)
+    asana_accept_client_tokens: bool = False
+    asana_tool_timeout_seconds: Optional[float] = Field(default=None, gt=0)
+    asana_max_retries: int = Field(default=3, ge=0)
+    asana_retry_base_delay_seconds: float = Field(default=0.5, gt=0)
+    asana_retry_max_delay_seconds: float = Field(default=30.0, gt=0)
+    asana_retry_deadline_seconds: float = Field(default=60.0, gt=0)
+    asana_retry_after_cap_seconds: float = Field(default=60.0, ge=0)
+    asana_retry_non_idempotent: bool = False
+    asana_circuit_failure_threshold: int = Field(default=5, ge=0)
+    asana_circuit_reset_seconds: float = Field(default=30.0, gt=0)
+    asana_circuit_half_open_probes: int = Field(default=1, ge=1)
+    asana_rate_limit_per_minute: int = Field(default=150, ge=1)
+    asana_search_rate_limit_per_minute: int = Field(default=60, ge=1)
+    asana_max_concurrent_requests: int = Field(default=15, ge=1)
+    asana_cache_enabled: bool = True
+    asana_cache_max_entries: int = Field(default=512, ge=1)
+    asana_cache_max_bytes: int = Field(default=8_000_000, ge=1)
+    asana_resolver_ttl_seconds: float = Field(default=600.0, gt=0)
+    asana_resolver_path: Optional[str] = None
+    asana_mirror_path: Optional[str] = None
+    asana_export_dir: str = "exports"
+    asana_mirror_max_staleness_seconds: float = Field(default=300.0, ge=0)
+    asana_metrics_file: Optional[str] = None
+    asana_metrics_interval_seconds: float = Field(default=15.0, gt=0)
+    asana_transport: Literal["stdio", "http"] = "stdio"
+    asana_http_host: str = "127.0.0.1"
+    asana_http_port: int = Field(default=8000, ge=0, le=65535)
+    asana_http_workers: int = Field(default=1, ge=1)
+    asana_http_shutdown_timeout_seconds: float = Field(default=10.0, ge=0)
+    asana_http_auth_token: Optional[str] = None
+    asana_daemon_socket: Optional[str] = None
+    asana_daemon_idle_seconds: float = Field(default=900.0, ge=0)
+    asana_daemon_autostart: bool = False
+    log_level: str = DEFAULT_LOG_LEVEL
+    log_file: str = DEFAULT_LOG_FILE
 
     @staticmethod
     def from_env() -> "Settings":
-        logger = logging.getLogger("asana_mcp")
-        token_file = None
-        if "ASANA_TOKEN_FILE" in os.environ:
-            token_file = os.environ.get("ASANA_TOKEN_FILE", "")
-            logger.info("ASANA_TOKEN_FILE set (redacted)")
-            if not token_file.strip():
-                raise RuntimeError("ASANA_TOKEN_FILE is set but empty.")
-        token_from_file = ""
-        if token_file:
-            token_path = Path(token_file)
-            if token_path.exists():
-                token_from_file = token_path.read_text(encoding="utf-8").strip()
-                if not token_from_file:
-                    logger.warning("ASANA_TOKEN_FILE is empty after trimming: %s", token_path)
-            else:
-                logger.warning("ASANA_TOKEN_FILE does not exist: %s", token_path)
-        data = {
-            "asana_access_token": token_from_file or os.getenv("ASANA_ACCESS_TOKEN", ""),
-            "asana_api_base": os.getenv("ASANA_API_BASE", "https://app.asana.com/api/1.0"),
-            "asana_timeout_seconds": float(os.getenv("ASANA_TIMEOUT_SECONDS", "30")),
-            "asana_max_retries": int(os.getenv("ASANA_MAX_RETRIES", "3")),
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-            "log_file": os.getenv("LOG_FILE", "logs/asana-mcp.log"),
-        }
+        data = read_settings()
         try:
             return Settings(**data)
         except ValidationError as exc:
@@ -0,0 +1,85 @@
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+# Asana token supplied by the caller of the current tool call (HTTP header);
+# None means the server's own credential.
+_request_token: ContextVar[Optional[str]] = ContextVar("asana_mcp_request_token", default=None)
+
+
+def fingerprint(token: str) -> str:
+    """Stable, non-reversible label for a credential, safe for logs and stats."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:12]
+
+
+def current_token() -> Optional[str]:
+    return _request_token.get()
+
+
+@contextmanager
+def credential_scope(token: Optional[str]) -> Iterator[None]:
+    reset = _request_token.set(token or None)
+    try:
+        yield
+    finally:
+        _request_token.reset(reset)
+
+
+class TokenFile:
+    """Re-reads ``ASANA_TOKEN_FILE`` when its mtime changes, at most once per interval."""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        fallback: str,
+        interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._token = fallback
+        self._stamp: Optional[Tuple[float, int]] = self._stat()
+        self._checked = clock()
+        self.reloads = 0
+
+    @classmethod
+    def from_env(cls, fallback: str, interval: float) -> "TokenFile":
+        return cls(os.environ.get("ASANA_TOKEN_FILE") or None, fallback, interval)
+
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        if self.path is None:
+            return None
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def token(self) -> str:
+        if self.path is None or self.interval <= 0:
+            return self._token
+        now = self._clock()
+        with self._lock:
+            if now - self._checked < self.interval:
+                return self._token
+            self._checked = now
+            stamp = self._stat()
+            if stamp is None or stamp == self._stamp:
+                return self._token
+            self._stamp = stamp
+            try:
+                token = self.path.read_text(encoding="utf-8").strip()
+            except OSError:
+                return self._token
+            # An empty or half-written file keeps the previous token.
+            if token and token != self._token:
+                self._token = token
+                self.reloads += 1
+            return self._token
@@ -0,0 +1,282 @@
+import asyncio
+import errno
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from src import codec
+from src.credentials import fingerprint
+from src.env import is_true, read_settings
+
+# Keep module-level imports to the standard library (and src.codec, which loads
+# its backend on first use): forward() runs in every script launch, before (and
+# usually instead of) loading httpx and pydantic.
+
+# tool_impl functions the scripts may forward; anything else runs in-process.
+DAEMON_TOOLS = frozenset(
+    {
+        "get_current_user",
+        "list_workspaces",
+        "list_projects",
+        "get_task",
+        "get_task_tree",
+        "search_tasks",
+        "create_task",
+        "update_task",
+        "delete_task",
+        "move_task_to_section",
+        "create_task_in_section",
+        "create_task_with_subtasks",
+        "create_task_with_dependencies",
+        "move_tasks_to_section_in_order",
+        "batch_create_tasks",
+        "batch_update_tasks",
+        "batch_delete_tasks",
+        "batch_move_tasks_to_section",
+        "cache_stats",
+        "sync_mirror",
+        "export_project",
+        "server_stats",
+    }
+)
+# Settings that name files, per tool. A relative path resolves against the
+# process's working directory, so the daemon only runs these tools when its
+# resolved paths match the caller's.
+PATH_SETTINGS = {
+    "export_project": ("asana_export_dir",),
+    "sync_mirror": ("asana_mirror_path",),
+    "search_tasks": ("asana_mirror_path",),
+}
+CONNECT_TIMEOUT_SECONDS = 0.5
+# How long a script waits for the reply: the daemon's own tool deadline plus a
+# grace period, or REPLY_TIMEOUT_SECONDS when ASANA_TOOL_TIMEOUT_SECONDS is unset.
+REPLY_GRACE_SECONDS = 5.0
+REPLY_TIMEOUT_SECONDS = 600.0
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+IDLE_CHECK_SECONDS = 5.0
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DaemonError(RuntimeError):
+    """The forwarded tool raised inside the daemon."""
+
+
+def socket_path(configured: Optional[str] = None) -> str:
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"asana-mcp-{os.getuid()}.sock")
+
+
+def _identity(token: str, api_base: str) -> Dict[str, str]:
+    # The daemon answers only callers configured for the same Asana identity.
+    return {"credential": fingerprint(token) if token else "", "api_base": api_base}
+
+
+def _paths(tool: str, settings: Mapping[str, Any]) -> Dict[str, str]:
+    return {name: os.path.abspath(settings[name]) if settings[name] else "" for name in PATH_SETTINGS.get(tool, ())}
+
+
+def _is_live(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def _reply_timeout(tool_timeout: Optional[float]) -> float:
+    return tool_timeout + REPLY_GRACE_SECONDS if tool_timeout else REPLY_TIMEOUT_SECONDS
+
+
+def spawn() -> None:
+    """Start a detached daemon; it exits on its own after ASANA_DAEMON_IDLE_SECONDS."""
+    subprocess.Popen(
+        [sys.executable, "-m", "scripts.run_server", "--daemon"],
+        # `-m scripts.run_server` resolves against the working directory, which
+        # is wherever the script was launched from.
+        cwd=PROJECT_ROOT,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def forward(tool: str, payload: Dict[str, Any], environ: Mapping[str, str] = os.environ) -> Optional[Dict[str, Any]]:
+    """Run ``tool`` in the warm daemon; None means run it in-process instead."""
+    if tool not in DAEMON_TOOLS:
+        return None
+    try:
+        settings = read_settings(environ)
+    except (RuntimeError, ValueError):
+        return None
+    path = socket_path(settings["asana_daemon_socket"])
+    identity = _identity(settings["asana_access_token"], settings["asana_api_base"])
+    request = {"tool": tool, "payload": payload, "paths": _paths(tool, settings), **identity}
+    timeout = _reply_timeout(settings["asana_tool_timeout_seconds"])
+    sent = False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(path)
+            sock.settimeout(timeout)
+            sent = True
+            sock.sendall(codec.dumps(request) + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        if is_true(settings["asana_daemon_autostart"]):
+            spawn()
+        return None
+    except TimeoutError as exc:
+        if sent:
+            # The daemon may still be running the call; running it again here could repeat a write.
+            raise DaemonError(f"No reply from the daemon within {timeout:g}s") from exc
+        return None
+    except OSError:
+        return None
+    if not line:
+        return None
+    response = codec.loads(line)
+    if "exception" in response:
+        raise DaemonError(response["exception"])
+    return response.get("result")
+
+
+class Daemon:
+    """Serves tool calls for the scripts over a Unix socket, one JSON line per
+    request, reusing a single warm client, rate limiter and response cache."""
+
+    def __init__(self, path: str, idle_seconds: float = 0.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.path = path
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped = asyncio.Event()
+        self._active = 0
+        self._last_used = clock()
+        self.requests = 0
+
+    async def start(self) -> None:
+        self._claim_path()
+        # Owner-only from the moment it exists: the daemon acts with our token.
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path, limit=MAX_MESSAGE_BYTES)
+        finally:
+            os.umask(umask)
+
+    def _claim_path(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        if _is_live(self.path):
+            raise OSError(errno.EADDRINUSE, "Another daemon is listening", self.path)
+        os.unlink(self.path)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def serve(self) -> None:
+        idle_task = asyncio.create_task(self._watch_idle()) if self.idle_seconds > 0 else None
+        try:
+            await self._stopped.wait()
+        finally:
+            if idle_task is not None:
+                idle_task.cancel()
+            await self.aclose()
+
+    async def _watch_idle(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.idle_seconds, IDLE_CHECK_SECONDS))
+            if self._active == 0 and self._clock() - self._last_used >= self.idle_seconds:
+                self.stop()
+                return
+
+    async def aclose(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._active += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._dispatch(codec.loads(line))
+                writer.write(codec.dumps(response) + b"\n")
+                await writer.drain()
+        except (ValueError, ConnectionError):
+            pass
+        finally:
+            self._active -= 1
+            self._last_used = self._clock()
+            writer.close()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from src import tool_impl, tools
+        from src.config import get_settings
+
+        self.requests += 1
+        tool = request.get("tool")
+        if tool not in DAEMON_TOOLS:
+            return {"error": "unknown_tool"}
+        settings = get_settings()
+        expected = _identity("", settings.asana_api_base)
+        expected["credential"] = tool_impl.get_client_pool().default_credential()
+        if {key: request.get(key) for key in expected} != expected:
+            return {"error": "identity_mismatch"}
+        if request.get("paths") != _paths(tool, settings.model_dump()):
+            # Same setting, different working directory: the files would land elsewhere.
+            return {"error": "path_mismatch"}
+        try:
+            # Same runner as the MCP tools: metrics, ASANA_TOOL_TIMEOUT_SECONDS and deadline_exceeded.
+            result = await tools._run(f"asana_{tool}", tool, request.get("payload") or {})
+        except Exception as exc:  # noqa: BLE001 - reported to the script, the daemon keeps serving
+            return {"exception": f"{type(exc).__name__}: {exc}"}
+        return {"result": result}
+
+
+async def _serve(daemon: Daemon) -> None:
+    from src import tool_impl
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, daemon.stop)
+    await daemon.start()
+    try:
+        await daemon.serve()
+    finally:
+        await tool_impl.get_client_pool().aclose()
+
+
+def run_daemon() -> int:
+    from src.config import get_settings
+    from src.logging_utils import configure_logging
+
+    logger = configure_logging()
+    settings = get_settings()
+    daemon = Daemon(socket_path(settings.asana_daemon_socket), settings.asana_daemon_idle_seconds)
+    logger.info("Asana CLI daemon starting on %s.", daemon.path)
+    try:
+        asyncio.run(_serve(daemon))
+    except OSError as exc:
+        if exc.errno == errno.EADDRINUSE:
+            logger.info("Asana CLI daemon already running on %s.", daemon.path)
+            return 0
+        raise
+    logger.info("Asana CLI daemon stopped after %d request(s).", daemon.requests)
+    return 0
@@ -0,0 +1,35 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Absolute time.monotonic() deadline for the current tool call; tasks spawned
+# from the call inherit it through the copied context.
+_deadline: ContextVar[Optional[float]] = ContextVar("asana_mcp_deadline", default=None)
+
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the enclosed work to ``seconds``; nested scopes can only shorten it."""
+    current = _deadline.get()
+    deadline = current
+    if seconds is not None:
+        candidate = time.monotonic() + max(0.0, seconds)
+        deadline = candidate if current is None else min(current, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield remaining()
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,179 @@
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+DEFAULT_API_BASE = "https://app.asana.com/api/1.0"
+DEFAULT_LOG_FILE = "logs/asana-mcp.log"
+DEFAULT_LOG_LEVEL = "INFO"
+BOOL_STRINGS = {"1", "0", "true", "false", "t", "f", "yes", "no", "y", "n", "on", "off"}
+BOOL_SETTINGS = (
+    "asana_cache_enabled",
+    "asana_http2",
+    "asana_retry_non_idempotent",
+    "asana_accept_client_tokens",
+    "asana_daemon_autostart",
+)
+TRUE_STRINGS = {"1", "true", "t", "yes", "y", "on"}
+TRANSPORTS = ("stdio", "http")
+JSON_CODECS = ("auto", "orjson", "msgspec", "stdlib")
+LOG_LEVELS = {"CRITICAL", "FATAL", "ERROR", "WARN", "WARNING", "INFO", "DEBUG", "NOTSET"}
+
+
+def _optional_str(value: str) -> Optional[str]:
+    return value or None
+
+
+def _optional_float(value: str) -> Optional[float]:
+    return float(value) if value else None
+
+
+# (settings field, environment variable, parser, default)
+SETTINGS_ENV: List[Tuple[str, str, Callable[[str], Any], str]] = [
+    ("asana_api_base", "ASANA_API_BASE", str, DEFAULT_API_BASE),
+    ("asana_timeout_seconds", "ASANA_TIMEOUT_SECONDS", float, "30"),
+    ("asana_connect_timeout_seconds", "ASANA_CONNECT_TIMEOUT_SECONDS", _optional_float, ""),
+    ("asana_read_timeout_seconds", "ASANA_READ_TIMEOUT_SECONDS", _optional_float, ""),
+    ("asana_write_timeout_seconds", "ASANA_WRITE_TIMEOUT_SECONDS", _optional_float, ""),
+    ("asana_pool_timeout_seconds", "ASANA_POOL_TIMEOUT_SECONDS", _optional_float, ""),
+    ("asana_http2", "ASANA_HTTP2", str, "false"),
+    ("asana_max_connections", "ASANA_MAX_CONNECTIONS", int, "20"),
+    ("asana_max_keepalive_connections", "ASANA_MAX_KEEPALIVE_CONNECTIONS", int, "10"),
+    ("asana_keepalive_expiry_seconds", "ASANA_KEEPALIVE_EXPIRY_SECONDS", float, "30"),
+    ("asana_prewarm_connections", "ASANA_PREWARM_CONNECTIONS", int, "0"),
+    ("asana_client_pool_max", "ASANA_CLIENT_POOL_MAX", int, "32"),
+    ("asana_client_idle_seconds", "ASANA_CLIENT_IDLE_SECONDS", float, "900"),
+    ("asana_token_reload_seconds", "ASANA_TOKEN_RELOAD_SECONDS", float, "5"),
+    ("asana_accept_client_tokens", "ASANA_ACCEPT_CLIENT_TOKENS", str, "false"),
+    ("asana_tool_timeout_seconds", "ASANA_TOOL_TIMEOUT_SECONDS", _optional_float, ""),
+    ("asana_max_retries", "ASANA_MAX_RETRIES", int, "3"),
+    ("asana_retry_base_delay_seconds", "ASANA_RETRY_BASE_DELAY_SECONDS", float, "0.5"),
+    ("asana_retry_max_delay_seconds", "ASANA_RETRY_MAX_DELAY_SECONDS", float, "30"),
+    ("asana_retry_deadline_seconds", "ASANA_RETRY_DEADLINE_SECONDS", float, "60"),
+    ("asana_retry_after_cap_seconds", "ASANA_RETRY_AFTER_CAP_SECONDS", float, "60"),
+    ("asana_retry_non_idempotent", "ASANA_RETRY_NON_IDEMPOTENT", str, "false"),
+    ("asana_circuit_failure_threshold", "ASANA_CIRCUIT_FAILURE_THRESHOLD", int, "5"),
+    ("asana_circuit_reset_seconds", "ASANA_CIRCUIT_RESET_SECONDS", float, "30"),
+    ("asana_circuit_half_open_probes", "ASANA_CIRCUIT_HALF_OPEN_PROBES", int, "1"),
+    ("asana_rate_limit_per_minute", "ASANA_RATE_LIMIT_PER_MINUTE", int, "150"),
+    ("asana_search_rate_limit_per_minute", "ASANA_SEARCH_RATE_LIMIT_PER_MINUTE", int, "60"),
+    ("asana_max_concurrent_requests", "ASANA_MAX_CONCURRENT_REQUESTS", int, "15"),
+    ("asana_cache_enabled", "ASANA_CACHE_ENABLED", str, "true"),
+    ("asana_cache_max_entries", "ASANA_CACHE_MAX_ENTRIES", int, "512"),
+    ("asana_cache_max_bytes", "ASANA_CACHE_MAX_BYTES", int, "8000000"),
+    ("asana_resolver_ttl_seconds", "ASANA_RESOLVER_TTL_SECONDS", float, "600"),
+    ("asana_resolver_path", "ASANA_RESOLVER_PATH", _optional_str, ""),
+    ("asana_mirror_path", "ASANA_MIRROR_PATH", _optional_str, ""),
+    ("asana_export_dir", "ASANA_EXPORT_DIR", str, "exports"),
+    ("asana_mirror_max_staleness_seconds", "ASANA_MIRROR_MAX_STALENESS_SECONDS", float, "300"),
+    ("asana_metrics_file", "ASANA_METRICS_FILE", _optional_str, ""),
+    ("asana_metrics_interval_seconds", "ASANA_METRICS_INTERVAL_SECONDS", float, "15"),
+    ("asana_transport", "ASANA_TRANSPORT", str, "stdio"),
+    ("asana_http_host", "ASANA_HTTP_HOST", str, "127.0.0.1"),
+    ("asana_http_port", "ASANA_HTTP_PORT", int, "8000"),
+    ("asana_http_workers", "ASANA_HTTP_WORKERS", int, "1"),
+    ("asana_http_shutdown_timeout_seconds", "ASANA_HTTP_SHUTDOWN_TIMEOUT_SECONDS", float, "10"),
+    ("asana_http_auth_token", "ASANA_HTTP_AUTH_TOKEN", _optional_str, ""),
+    ("asana_daemon_socket", "ASANA_DAEMON_SOCKET", _optional_str, ""),
+    ("asana_daemon_idle_seconds", "ASANA_DAEMON_IDLE_SECONDS", float, "900"),
+    ("asana_daemon_autostart", "ASANA_DAEMON_AUTOSTART", str, "false"),
+    ("log_level", "LOG_LEVEL", str, DEFAULT_LOG_LEVEL),
+    ("log_file", "LOG_FILE", str, DEFAULT_LOG_FILE),
+]
+
+
+def is_true(value: Any) -> bool:
+    """Boolean settings as pydantic reads them, for callers that skip Settings."""
+    return str(value).strip().lower() in TRUE_STRINGS
+
+
+def read_token(environ: Mapping[str, str] = os.environ) -> str:
+    logger = logging.getLogger("asana_mcp")
+    token_file = None
+    if "ASANA_TOKEN_FILE" in environ:
+        token_file = environ.get("ASANA_TOKEN_FILE", "")
+        logger.info("ASANA_TOKEN_FILE set (redacted)")
+        if not token_file.strip():
+            raise RuntimeError("ASANA_TOKEN_FILE is set but empty.")
+    token_from_file = ""
+    if token_file:
+        token_path = Path(token_file)
+        if token_path.exists():
+            token_from_file = token_path.read_text(encoding="utf-8").strip()
+            if not token_from_file:
+                logger.warning("ASANA_TOKEN_FILE is empty after trimming: %s", token_path)
+        else:
+            logger.warning("ASANA_TOKEN_FILE does not exist: %s", token_path)
+    return token_from_file or environ.get("ASANA_ACCESS_TOKEN", "")
+
+
+def read_settings(environ: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"asana_access_token": read_token(environ)}
+    for name, env_var, parse, default in SETTINGS_ENV:
+        data[name] = parse(environ.get(env_var, default))
+    return data
+
+
+def log_options(environ: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    return {
+        "log_file": environ.get("LOG_FILE", DEFAULT_LOG_FILE),
+        "log_level": environ.get("LOG_LEVEL", DEFAULT_LOG_LEVEL),
+        "queue_size": int(environ.get("LOG_QUEUE_SIZE", "10000")),
+        "overflow": environ.get("LOG_OVERFLOW_POLICY", "block"),
+        "sample_every": int(environ.get("LOG_SAMPLE_EVERY", "10")),
+    }
+
+
+def json_codec(environ: Mapping[str, str] = os.environ) -> str:
+    name = environ.get("ASANA_JSON_CODEC", "auto").strip().lower() or "auto"
+    if name not in JSON_CODECS:
+        raise ValueError(f"ASANA_JSON_CODEC must be one of {', '.join(JSON_CODECS)}, got {name!r}")
+    return name
+
+
+def health_problems(environ: Mapping[str, str] = os.environ) -> List[str]:
+    """Configuration check: token present, every setting parses, and ``Settings`` accepts the values."""
+    problems = []
+    try:
+        data = read_settings(environ)
+    except RuntimeError as exc:
+        return [str(exc)]
+    except ValueError as exc:
+        return [f"Invalid numeric setting: {exc}"]
+    try:
+        log_options(environ)
+    except ValueError as exc:
+        problems.append(f"Invalid logging setting: {exc}")
+    try:
+        json_codec(environ)
+    except ValueError as exc:
+        problems.append(str(exc))
+    if not data["asana_access_token"]:
+        problems.append("Set ASANA_ACCESS_TOKEN or provide a valid ASANA_TOKEN_FILE with a non-empty token.")
+    for name in BOOL_SETTINGS:
+        if str(data[name]).lower() not in BOOL_STRINGS:
+            problems.append(f"{name.upper()} must be a boolean.")
+    if data["asana_transport"] not in TRANSPORTS:
+        problems.append(f"ASANA_TRANSPORT must be one of {', '.join(TRANSPORTS)}.")
+    if str(data["log_level"]).upper() not in LOG_LEVELS:
+        problems.append(f"Unknown LOG_LEVEL: {data['log_level']}")
+    if not problems:
+        problems.extend(_validation_problems(data))
+    return problems
+
+
+def _validation_problems(data: Dict[str, Any]) -> List[str]:
+    # Range and type checks live on Settings; load pydantic only once the cheap checks pass.
+    from pydantic import ValidationError
+
+    from src.config import Settings
+
+    try:
+        Settings(**data)
+    except ValidationError as exc:
+        env_names = {name: env_var for name, env_var, _, _ in SETTINGS_ENV}
+        return [
+            f"{env_names.get(str(error['loc'][0]), str(error['loc'][0]).upper())}: {error['msg']}"
+            for error in exc.errors()
+        ]
+    return []
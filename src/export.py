@@ -0,0 +1,212 @@
+import asyncio
+import gzip
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src import codec
+from src.asana_client import MAX_PAGE_SIZE, AsanaError, AsyncAsanaClient
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+CHECKPOINT_VERSION = 1
+SECTION_FIELDS = "name"
+
+Transform = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class ExportPathError(AsanaError):
+    code = "invalid_path"
+
+    def __init__(self, path: str, root: Path):
+        super().__init__(400, f"Export path {path!r} must stay inside {str(root)!r}", {"path": path})
+
+
+class CheckpointMismatch(AsanaError):
+    code = "checkpoint_mismatch"
+
+    def __init__(self, path: Path):
+        super().__init__(
+            409,
+            "A checkpoint for a different export exists at this path; pass resume=false to start over",
+            {"checkpoint": str(path)},
+        )
+
+
+def export_path(root: Path, path: str) -> Path:
+    """Resolve ``path`` under ``root``; absolute paths and ``..`` must still land inside it."""
+    base = root.resolve()
+    target = (base / path).resolve()
+    if target == base or base not in target.parents:
+        raise ExportPathError(path, base)
+    return target
+
+
+class ProjectExport:
+    """Streams every task of a project to an NDJSON file, one section per worker.
+
+    Pages are appended as they arrive, so memory holds at most one page per
+    worker. After each page the file size and the section's next offset are
+    checkpointed; a resumed export truncates anything written after the last
+    checkpoint and continues each section from its saved offset. With gzip,
+    every page is its own gzip member, so truncating at a page boundary always
+    leaves a valid stream. File I/O runs in a worker thread, one page at a time
+    under a lock, so the event loop keeps fetching while a page is written.
+    """
+
+    def __init__(
+        self,
+        client: AsyncAsanaClient,
+        project_gid: str,
+        path: Path,
+        opt_fields: str,
+        compress: bool = False,
+        concurrency: int = 4,
+        transform: Optional[Transform] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.client = client
+        self.project_gid = project_gid
+        self.path = path
+        self.checkpoint_path = path.with_name(path.name + CHECKPOINT_SUFFIX)
+        self.opt_fields = opt_fields
+        self.compress = compress
+        self.concurrency = concurrency
+        self.transform = transform
+        self._clock = clock
+        self.requests = 0
+        self.resumed = False
+        self._state: Dict[str, Any] = {}
+        self._handle: Any = None
+        self._io_lock = asyncio.Lock()
+
+    def _identity(self) -> Dict[str, Any]:
+        return {"project_gid": self.project_gid, "opt_fields": self.opt_fields, "gzip": self.compress}
+
+    def _load_checkpoint(self, resume: bool) -> Optional[Dict[str, Any]]:
+        if not resume or not self.checkpoint_path.exists():
+            return None
+        try:
+            state = codec.loads(self.checkpoint_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != CHECKPOINT_VERSION or state.get("export") != self._identity():
+            raise CheckpointMismatch(self.checkpoint_path)
+        # Output shorter than the checkpoint says was written cannot be resumed.
+        if not self.path.exists() or self.path.stat().st_size < state["bytes"]:
+            return None
+        return state
+
+    def _save_checkpoint(self, snapshot: bytes) -> None:
+        temp = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        temp.write_bytes(snapshot)
+        os.replace(temp, self.checkpoint_path)
+
+    def _append(self, chunk: bytes, snapshot: bytes) -> None:
+        if chunk:
+            self._handle.write(chunk)
+            self._handle.flush()
+        self._save_checkpoint(snapshot)
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests += 1
+        return await self.client.request("GET", path, params=params)
+
+    async def _sections(self) -> List[Dict[str, Any]]:
+        sections: List[Dict[str, Any]] = []
+        path = f"/projects/{self.project_gid}/sections"
+        async for page in self.client.iter_pages(path, {"opt_fields": SECTION_FIELDS}):
+            self.requests += 1
+            for section in page.get("data") or []:
+                sections.append({"gid": str(section["gid"]), "name": section.get("name"), "offset": None})
+        return sections
+
+    def _open(self, state: Optional[Dict[str, Any]]) -> Any:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if state is None:
+            return open(self.path, "wb")
+        handle = open(self.path, "r+b")
+        handle.truncate(state["bytes"])
+        handle.seek(state["bytes"])
+        return handle
+
+    async def run(self, resume: bool = True) -> Dict[str, Any]:
+        started = self._clock()
+        state = await asyncio.to_thread(self._load_checkpoint, resume)
+        if state is None:
+            sections = await self._sections()
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "export": self._identity(),
+                "sections": sections,
+                "done": [],
+                "bytes": 0,
+                "records": 0,
+            }
+            self._handle = await asyncio.to_thread(self._open, None)
+        else:
+            self.resumed = True
+            self._handle = await asyncio.to_thread(self._open, state)
+        self._state = state
+        await asyncio.to_thread(self._save_checkpoint, codec.dumps(state))
+        try:
+            slots = asyncio.Semaphore(self.concurrency)
+            done = set(state["done"])
+            pending = [section for section in state["sections"] if section["gid"] not in done]
+            await asyncio.gather(*(self._export_section(section, slots) for section in pending))
+        finally:
+            self._handle.close()
+        self.checkpoint_path.unlink()
+        return {
+            "path": str(self.path),
+            "gzip": self.compress,
+            "records": state["records"],
+            "sections": len(state["sections"]),
+            "bytes": state["bytes"],
+            "resumed": self.resumed,
+            "upstream_calls": self.requests,
+            "elapsed_ms": round((self._clock() - started) * 1000, 1),
+        }
+
+    async def _export_section(self, section: Dict[str, Any], slots: asyncio.Semaphore) -> None:
+        path = f"/sections/{section['gid']}/tasks"
+        label = {"gid": section["gid"], "name": section["name"]}
+        async with slots:
+            while True:
+                params: Dict[str, Any] = {"opt_fields": self.opt_fields, "limit": MAX_PAGE_SIZE}
+                if section["offset"]:
+                    params["offset"] = section["offset"]
+                page = await self._get(path, params)
+                next_page = page.get("next_page")
+                offset = next_page.get("offset") if isinstance(next_page, dict) else None
+                await self._write(page.get("data") or [], label, section, offset)
+                if not offset:
+                    return
+
+    def _encode(self, tasks: List[Dict[str, Any]], section: Dict[str, Any]) -> bytes:
+        if not tasks:
+            return b""
+        lines = []
+        for task in tasks:
+            record = {**task, "section": section}
+            if self.transform is not None:
+                record = self.transform(record)
+            lines.append(codec.dumps(record))
+        return b"\n".join(lines) + b"\n"
+
+    async def _write(
+        self, tasks: List[Dict[str, Any]], label: Dict[str, Any], section: Dict[str, Any], offset: Optional[str]
+    ) -> None:
+        chunk = self._encode(tasks, label)
+        if chunk and self.compress:
+            chunk = await asyncio.to_thread(gzip.compress, chunk, compresslevel=6)
+        # One page at a time: pages from concurrent sections never interleave,
+        # and each checkpoint matches the bytes written before it.
+        async with self._io_lock:
+            state = self._state
+            state["bytes"] += len(chunk)
+            state["records"] += len(tasks)
+            section["offset"] = offset
+            if not offset:
+                state["done"].append(section["gid"])
+            await asyncio.to_thread(self._append, chunk, codec.dumps(state))
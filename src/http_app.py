@@ -0,0 +1,114 @@
+import asyncio
+import hmac
+import os
+import signal
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import Settings, get_settings
+from src.env import health_problems
+from src.logging_utils import configure_logging
+
+HEALTH_PATH = "/healthz"
+MCP_PATH = "/mcp"
+UVICORN_LOG_LEVELS = {"WARN": "warning", "FATAL": "critical", "NOTSET": "debug"}
+
+
+async def healthz(request: Request) -> JSONResponse:
+    # Same checks as --health-check, so probes and the CLI agree.
+    problems = health_problems()
+    if problems:
+        return JSONResponse({"status": "error", "problems": problems}, status_code=503)
+    return JSONResponse({"status": "ok"})
+
+
+class BearerAuthMiddleware:
+    """Require ``Authorization: Bearer <token>`` on everything except the health probe."""
+
+    def __init__(self, app: ASGIApp, token: str) -> None:
+        self.app = app
+        self._expected = f"Bearer {token}".encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] != HEALTH_PATH:
+            supplied = dict(scope.get("headers") or []).get(b"authorization", b"")
+            if not hmac.compare_digest(supplied, self._expected):
+                response = JSONResponse({"error": "unauthorized"}, status_code=401)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+async def _close_clients() -> None:
+    # Only close clients that were created; tool_impl may never have loaded.
+    tool_impl = sys.modules.get("src.tool_impl")
+    cache_info = getattr(getattr(tool_impl, "get_client_pool", None), "cache_info", None)
+    if cache_info is not None and cache_info().currsize:
+        await tool_impl.get_client_pool().aclose()
+
+
+def create_http_app(
+    settings: Optional[Settings] = None, stateless: Optional[bool] = None, host: Optional[str] = None
+) -> Starlette:
+    from src.server import _prewarm, create_server
+
+    settings = settings or get_settings()
+    if stateless is None:
+        # Sessions live in one process; with several workers any worker may
+        # receive a session's next request, so run without server-side sessions.
+        stateless = settings.asana_http_workers > 1
+    # The bind host decides FastMCP's DNS-rebinding protection (on for loopback).
+    server = create_server(transport="http", stateless=stateless, host=host or settings.asana_http_host)
+    server.custom_route(HEALTH_PATH, methods=["GET"], include_in_schema=False)(healthz)
+    app = server.streamable_http_app()
+    session_lifespan = app.router.lifespan_context
+    logger = configure_logging()
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_lifespan(app):
+            prewarm = asyncio.create_task(_prewarm()) if settings.asana_prewarm_connections else None
+            logger.info("HTTP transport ready on %s.", MCP_PATH)
+            try:
+                yield
+            finally:
+                logger.info("HTTP transport draining.")
+                if prewarm is not None:
+                    prewarm.cancel()
+                await _close_clients()
+
+    app.router.lifespan_context = lifespan
+    if settings.asana_http_auth_token:
+        app.add_middleware(BearerAuthMiddleware, token=settings.asana_http_auth_token)
+    return app
+
+
+def _exit_on_sigterm(signum: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def run_http(host: str, port: int, workers: int, settings: Optional[Settings] = None) -> None:
+    settings = settings or get_settings()
+    # uvicorn drains connections on SIGTERM and then re-raises the signal;
+    # turn that into SystemExit so the caller's cleanup (log flush, metrics) runs.
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    options: Dict[str, Any] = {
+        "host": host,
+        "port": port,
+        "log_level": UVICORN_LOG_LEVELS.get(settings.log_level.upper(), settings.log_level.lower()),
+        "timeout_graceful_shutdown": settings.asana_http_shutdown_timeout_seconds,
+    }
+    if workers > 1:
+        # Each worker process imports the factory and reads settings from the
+        # environment, so pass the command-line overrides down that way.
+        os.environ.update({"ASANA_HTTP_HOST": host, "ASANA_HTTP_PORT": str(port), "ASANA_HTTP_WORKERS": str(workers)})
+        uvicorn.run("src.http_app:create_http_app", factory=True, workers=workers, **options)
+    else:
+        uvicorn.run(create_http_app(settings, host=host), **options)
@@ -1,46 +1,101 @@
-import json
+import atexit
 import logging
+import queue
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Any, Dict
-
-SENSITIVE_KEYS = {
-    "authorization",
-    "access_token",
-    "refresh_token",
-    "token",
-    "password",
-    "secret",
-    "notes",
-    "email",
-}
-
-
-def _redact_value(value: Any) -> Any:
-    if value is None:
-        return value
-    if isinstance(value, str):
-        return "[REDACTED]"
-    if isinstance(value, (bytes, bytearray)):
-        return "[REDACTED]"
-    return "[REDACTED]"
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
+from src import codec
+from src.env import log_options
+from src.redaction import SENSITIVE_KEYS, RedactionPlan, compile_plan, redact
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_SAMPLE_EVERY = 10
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 def redact_dict(payload: Any) -> Any:
-    if isinstance(payload, dict):
-        redacted: Dict[str, Any] = {}
-        for key, value in payload.items():
-            if key.lower() in SENSITIVE_KEYS:
-                redacted[key] = _redact_value(value)
-            else:
-                redacted[key] = redact_dict(value)
-        return redacted
-    if isinstance(payload, list):
-        return [redact_dict(item) for item in payload]
-    return payload
-
-
-def setup_logging(log_file: str, log_level: str) -> logging.Logger:
+    return redact(payload)
+
+
+class _AuditMessage:
+    __slots__ = ("event", "payload", "plan", "_text")
+
+    def __init__(self, event: str, payload: Any, plan: Optional[RedactionPlan] = None) -> None:
+        self.event = event
+        self.payload = payload
+        self.plan = plan
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            redacted = self.plan.apply(self.payload) if self.plan else redact(self.payload)
+            self._text = codec.dumps_text({"event": self.event, "payload": redacted}, sort_keys=True)
+        return self._text
+
+
+class BoundedQueueHandler(QueueHandler):
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        overflow: str = "block",
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown log overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.dropped = 0
+        self._overflowed = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == "sample":
+            self._overflowed += 1
+            if self._overflowed % self.sample_every:
+                self.dropped += 1
+                return
+        try:
+            self.queue.get_nowait()
+            self.dropped += 1
+        except queue.Empty:
+            pass
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BlockingSentinelListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+_LISTENER: Optional[QueueListener] = None
+_QUEUE_HANDLER: Optional[BoundedQueueHandler] = None
+
+
+def setup_logging(
+    log_file: str,
+    log_level: str,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    overflow: str = "block",
+    sample_every: int = DEFAULT_SAMPLE_EVERY,
+) -> logging.Logger:
+    global _LISTENER, _QUEUE_HANDLER
     logger = logging.getLogger("asana_mcp")
     if logger.handlers:
         return logger
@@ -62,13 +117,54 @@ def setup_logging(log_file: str, log_level: str) -> logging.Logger:
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max(1, queue_size))
+    _QUEUE_HANDLER = BoundedQueueHandler(log_queue, overflow, sample_every)
+    _LISTENER = _BlockingSentinelListener(log_queue, file_handler, stream_handler)
+    _LISTENER.start()
+    atexit.register(shutdown_logging)
+
+    logger.addHandler(_QUEUE_HANDLER)
 
     return logger
 
 
-def audit(logger: logging.Logger, event: str, payload: Any) -> None:
-    redacted = redact_dict(payload)
-    message = json.dumps({"event": event, "payload": redacted}, sort_keys=True)
-    logger.info(message)
+def configure_logging() -> logging.Logger:
+    """Set up logging once from LOG_* environment variables; later calls reuse it."""
+    return setup_logging(**log_options())
+
+
+def shutdown_logging() -> None:
+    global _LISTENER, _QUEUE_HANDLER
+    if _LISTENER is None:
+        return
+    listener, _LISTENER = _LISTENER, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    if _QUEUE_HANDLER is not None:
+        logging.getLogger("asana_mcp").removeHandler(_QUEUE_HANDLER)
+        _QUEUE_HANDLER = None
+
+
+def log_queue_stats() -> Dict[str, Any]:
+    if _QUEUE_HANDLER is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "queued": _QUEUE_HANDLER.queue.qsize(),
+        "dropped": _QUEUE_HANDLER.dropped,
+        "overflow": _QUEUE_HANDLER.overflow,
+    }
+
+
+def audit(
+    logger: logging.Logger,
+    event: str,
+    payload: Any,
+    model: Optional[Type["BaseModel"]] = None,
+) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    snapshot = dict(payload) if isinstance(payload, dict) else payload
+    plan = compile_plan(model) if model is not None else None
+    logger.info(_AuditMessage(event, snapshot, plan))
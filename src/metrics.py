@@ -0,0 +1,332 @@
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Sequence[float] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+QUANTILES = (0.5, 0.9, 0.99)
+
+_GID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_current_tool: ContextVar[Optional[str]] = ContextVar("asana_mcp_current_tool", default=None)
+
+
+def endpoint_family(path: str) -> str:
+    return _GID_SEGMENT.sub("/{gid}", path.split("?", 1)[0]) or "/"
+
+
+def current_tool() -> Optional[str]:
+    return _current_tool.get()
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        rows = []
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            rows.append((_format_bound(bound), seen))
+        rows.append(("+Inf", self.count))
+        return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+        }
+        for q in QUANTILES:
+            data[f"p{int(q * 100)}"] = round(self.quantile(q), 6)
+        return data
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class _ToolCall:
+    __slots__ = ("outcome",)
+
+    def __init__(self) -> None:
+        self.outcome = "exception"
+
+
+class _RequestCall:
+    __slots__ = ("status",)
+
+    def __init__(self) -> None:
+        self.status = "exception"
+
+
+class Metrics:
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self.tool_latency: Dict[str, Histogram] = {}
+            self.tool_calls: Dict[Tuple[str, str], int] = {}
+            self.tool_upstream_calls: Dict[str, int] = {}
+            self.tools_in_flight: Dict[str, int] = {}
+            self.request_latency: Dict[Tuple[str, str], Histogram] = {}
+            self.responses: Dict[Tuple[str, str], int] = {}
+            self.requests_in_flight: Dict[str, int] = {}
+            self.retries: Dict[Tuple[str, str], int] = {}
+            self.errors: Dict[Tuple[str, str], int] = {}
+            self.sleep_seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def track_tool(self, tool: str) -> Iterator[_ToolCall]:
+        call = _ToolCall()
+        token = _current_tool.set(tool)
+        with self._lock:
+            self.tools_in_flight[tool] = self.tools_in_flight.get(tool, 0) + 1
+        started = self._clock()
+        try:
+            yield call
+        finally:
+            elapsed = self._clock() - started
+            _current_tool.reset(token)
+            with self._lock:
+                self.tools_in_flight[tool] -= 1
+                self._histogram(self.tool_latency, tool).observe(elapsed)
+                key = (tool, call.outcome)
+                self.tool_calls[key] = self.tool_calls.get(key, 0) + 1
+
+    @contextmanager
+    def track_request(self, method: str, path: str) -> Iterator[_RequestCall]:
+        call = _RequestCall()
+        endpoint = endpoint_family(path)
+        tool = _current_tool.get()
+        with self._lock:
+            self.requests_in_flight[endpoint] = self.requests_in_flight.get(endpoint, 0) + 1
+            if tool:
+                self.tool_upstream_calls[tool] = self.tool_upstream_calls.get(tool, 0) + 1
+        started = self._clock()
+        try:
+            yield call
+        except Exception as exc:
+            self.record_error(path, type(exc).__name__)
+            raise
+        finally:
+            elapsed = self._clock() - started
+            with self._lock:
+                self.requests_in_flight[endpoint] -= 1
+                self._histogram(self.request_latency, (method.upper(), endpoint)).observe(elapsed)
+                key = (endpoint, str(call.status))
+                self.responses[key] = self.responses.get(key, 0) + 1
+
+    def record_retry(self, path: str, reason: str) -> None:
+        key = (endpoint_family(path), reason)
+        with self._lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+
+    def record_error(self, path: str, kind: str) -> None:
+        key = (endpoint_family(path), kind)
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def record_sleep(self, reason: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.sleep_seconds[reason] = self.sleep_seconds.get(reason, 0.0) + seconds
+
+    def _histogram(self, table: Dict[Any, Histogram], key: Any) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(self.buckets)
+        return histogram
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            tools: Dict[str, Dict[str, Any]] = {}
+            for tool, histogram in self.tool_latency.items():
+                tools[tool] = {"latency_seconds": histogram.snapshot(), "outcomes": {}}
+            for (tool, outcome), count in self.tool_calls.items():
+                tools.setdefault(tool, {"outcomes": {}})["outcomes"][outcome] = count
+            for tool, count in self.tool_upstream_calls.items():
+                tools.setdefault(tool, {"outcomes": {}})["upstream_calls"] = count
+            endpoints: Dict[str, Dict[str, Any]] = {}
+            for (method, endpoint), histogram in self.request_latency.items():
+                endpoints[f"{method} {endpoint}"] = histogram.snapshot()
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 3),
+                "tools": tools,
+                "endpoints": endpoints,
+                "responses": _nested(self.responses),
+                "retries": _nested(self.retries),
+                "errors": _nested(self.errors),
+                "sleep_seconds": {reason: round(total, 6) for reason, total in self.sleep_seconds.items()},
+                "in_flight": {
+                    "tools": {k: v for k, v in self.tools_in_flight.items() if v},
+                    "requests": {k: v for k, v in self.requests_in_flight.items() if v},
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            _histogram_lines(
+                lines, "asana_mcp_tool_duration_seconds", "Tool call latency.",
+                {(("tool", tool),): h for tool, h in self.tool_latency.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_tool_calls_total", "Tool calls by outcome.",
+                {(("tool", t), ("outcome", o)): v for (t, o), v in self.tool_calls.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_tool_upstream_calls_total", "Asana requests made on behalf of a tool.",
+                {(("tool", t),): v for t, v in self.tool_upstream_calls.items()},
+            )
+            _histogram_lines(
+                lines, "asana_mcp_upstream_request_duration_seconds", "Asana request latency per attempt.",
+                {(("method", m), ("endpoint", e)): h for (m, e), h in self.request_latency.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_upstream_responses_total", "Asana responses by status.",
+                {(("endpoint", e), ("status", s)): v for (e, s), v in self.responses.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_upstream_retries_total", "Retried Asana requests.",
+                {(("endpoint", e), ("reason", r)): v for (e, r), v in self.retries.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_upstream_errors_total", "Asana requests that failed for good.",
+                {(("endpoint", e), ("kind", k)): v for (e, k), v in self.errors.items()},
+            )
+            _counter_lines(
+                lines, "asana_mcp_sleep_seconds_total", "Time spent waiting on rate limits and backoff.",
+                {(("reason", r),): v for r, v in self.sleep_seconds.items()},
+            )
+            _gauge_lines(
+                lines, "asana_mcp_tools_in_flight", "Tool calls currently running.",
+                {(("tool", t),): v for t, v in self.tools_in_flight.items()},
+            )
+            _gauge_lines(
+                lines, "asana_mcp_upstream_in_flight", "Asana requests currently in flight.",
+                {(("endpoint", e),): v for e, v in self.requests_in_flight.items()},
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _nested(table: Dict[Tuple[str, str], Any]) -> Dict[str, Dict[str, Any]]:
+    nested: Dict[str, Dict[str, Any]] = {}
+    for (outer, inner), value in table.items():
+        nested.setdefault(outer, {})[inner] = value
+    return nested
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs) + "}"
+
+
+def _counter_lines(lines: List[str], name: str, help_text: str, values: Dict[Labels, float]) -> None:
+    _sample_lines(lines, name, help_text, "counter", values)
+
+
+def _gauge_lines(lines: List[str], name: str, help_text: str, values: Dict[Labels, float]) -> None:
+    _sample_lines(lines, name, help_text, "gauge", values)
+
+
+def _sample_lines(lines: List[str], name: str, help_text: str, kind: str, values: Dict[Labels, float]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in sorted(values.items()):
+        lines.append(f"{name}{_labels(labels)} {value}")
+
+
+def _histogram_lines(lines: List[str], name: str, help_text: str, values: Dict[Labels, Histogram]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in sorted(values.items()):
+        for bound, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(labels, ('le', bound))} {count}")
+        lines.append(f"{name}_sum{_labels(labels)} {histogram.total}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+
+class MetricsFileWriter:
+    """Periodically dumps metrics in Prometheus text format (textfile collector style)."""
+
+    def __init__(self, metrics: Metrics, path: str, interval: float) -> None:
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="asana-mcp-metrics", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.metrics.write_prometheus(self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.metrics.write_prometheus(self.path)
+
+
+REGISTRY = Metrics()
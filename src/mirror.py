@@ -0,0 +1,311 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src import codec
+from src.asana_client import AsanaError, AsyncAsanaClient
+
+MIRROR_TASK_FIELDS = ",".join(
+    [
+        "name",
+        "notes",
+        "completed",
+        "completed_at",
+        "assignee.name",
+        "due_on",
+        "start_on",
+        "created_at",
+        "modified_at",
+        "memberships.project.name",
+        "memberships.section.name",
+        "permalink_url",
+    ]
+)
+DELETE_ACTIONS = {"deleted", "removed"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    gid TEXT PRIMARY KEY,
+    name TEXT,
+    notes TEXT,
+    completed INTEGER,
+    completed_at TEXT,
+    assignee_gid TEXT,
+    modified_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_projects (
+    task_gid TEXT NOT NULL,
+    project_gid TEXT NOT NULL,
+    PRIMARY KEY (task_gid, project_gid)
+);
+CREATE INDEX IF NOT EXISTS task_projects_project ON task_projects (project_gid);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_gid TEXT PRIMARY KEY,
+    workspace_gid TEXT,
+    sync_token TEXT,
+    synced_at REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    name, notes, content='tasks', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_ai AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_ad AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, name, notes) VALUES ('delete', old.rowid, old.name, old.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_au AFTER UPDATE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, name, notes) VALUES ('delete', old.rowid, old.name, old.notes);
+    INSERT INTO tasks_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes);
+END;
+"""
+
+
+def _fts_query(text: str) -> str:
+    terms = [term.replace('"', '""') for term in text.split() if term.strip()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+class TaskMirror:
+    def __init__(self, path: str) -> None:
+        db_path = Path(path)
+        if str(db_path) != ":memory:" and not db_path.parent.exists():
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def upsert_tasks(self, tasks: Iterable[Dict[str, Any]], project_gid: Optional[str] = None) -> int:
+        count = 0
+        with self._lock, self._conn:
+            for task in tasks:
+                assignee = task.get("assignee") or {}
+                self._conn.execute(
+                    """
+                    INSERT INTO tasks (gid, name, notes, completed, completed_at, assignee_gid, modified_at, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(gid) DO UPDATE SET
+                        name=excluded.name, notes=excluded.notes, completed=excluded.completed,
+                        completed_at=excluded.completed_at, assignee_gid=excluded.assignee_gid,
+                        modified_at=excluded.modified_at, data=excluded.data
+                    """,
+                    (
+                        task["gid"],
+                        task.get("name"),
+                        task.get("notes"),
+                        1 if task.get("completed") else 0,
+                        task.get("completed_at"),
+                        assignee.get("gid") if isinstance(assignee, dict) else None,
+                        task.get("modified_at"),
+                        codec.dumps_text(task),
+                    ),
+                )
+                project_gids = {
+                    membership["project"]["gid"]
+                    for membership in task.get("memberships") or []
+                    if isinstance(membership, dict) and isinstance(membership.get("project"), dict)
+                }
+                if project_gid:
+                    project_gids.add(project_gid)
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO task_projects (task_gid, project_gid) VALUES (?, ?)",
+                    [(task["gid"], gid) for gid in project_gids],
+                )
+                count += 1
+        return count
+
+    def project_task_gids(self, project_gid: str) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_gid FROM task_projects WHERE project_gid = ?", (project_gid,)
+            ).fetchall()
+        return {row["task_gid"] for row in rows}
+
+    def prune_project(self, project_gid: str, keep: Set[str]) -> int:
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT task_gid FROM task_projects WHERE project_gid = ?", (project_gid,)
+            ).fetchall()
+            stale = [(row["task_gid"],) for row in rows if row["task_gid"] not in keep]
+            self._conn.executemany(
+                "DELETE FROM task_projects WHERE task_gid = ? AND project_gid = ?",
+                [(gid, project_gid) for (gid,) in stale],
+            )
+            self._conn.execute(
+                "DELETE FROM tasks WHERE gid NOT IN (SELECT task_gid FROM task_projects)"
+            )
+        return len(stale)
+
+    def get_state(self, project_gid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM sync_state WHERE project_gid = ?", (project_gid,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def set_state(self, project_gid: str, workspace_gid: Optional[str], sync_token: Optional[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO sync_state (project_gid, workspace_gid, sync_token, synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(project_gid) DO UPDATE SET
+                    workspace_gid=COALESCE(excluded.workspace_gid, sync_state.workspace_gid),
+                    sync_token=excluded.sync_token, synced_at=excluded.synced_at
+                """,
+                (project_gid, workspace_gid, sync_token, time.time()),
+            )
+
+    def mirrored_projects(self, workspace_gid: Optional[str] = None) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM sync_state"
+        args: tuple = ()
+        if workspace_gid:
+            query += " WHERE workspace_gid = ?"
+            args = (workspace_gid,)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, args).fetchall()]
+
+    def search(
+        self,
+        project_gids: List[str],
+        text: Optional[str] = None,
+        assignee: Optional[str] = None,
+        completed_since: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        placeholders = ",".join("?" * len(project_gids))
+        clauses = [f"t.gid IN (SELECT task_gid FROM task_projects WHERE project_gid IN ({placeholders}))"]
+        args: List[Any] = list(project_gids)
+        joins = ""
+        order = "t.modified_at DESC"
+        if text and _fts_query(text):
+            joins = "JOIN tasks_fts f ON f.rowid = t.rowid"
+            clauses.append("tasks_fts MATCH ?")
+            args.append(_fts_query(text))
+            order = "f.rank"
+        if assignee:
+            clauses.append("t.assignee_gid = ?")
+            args.append(assignee)
+        if completed_since:
+            clauses.append("(t.completed = 0 OR t.completed_at >= ?)")
+            args.append(completed_since)
+        query = f"SELECT t.data FROM tasks t {joins} WHERE {' AND '.join(clauses)} ORDER BY {order} LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [codec.loads(row["data"]) for row in rows]
+
+
+async def _fetch_sync_token(client: AsyncAsanaClient, project_gid: str) -> Optional[str]:
+    try:
+        response = await client.request("GET", "/events", params={"resource": project_gid})
+    except AsanaError as exc:
+        if exc.status_code == 412:
+            return exc.details.get("sync")
+        raise
+    return response.get("sync")
+
+
+async def _full_sync(
+    client: AsyncAsanaClient, mirror: TaskMirror, project_gid: str, workspace_gid: Optional[str]
+) -> Dict[str, Any]:
+    sync_token = await _fetch_sync_token(client, project_gid)
+    seen: Set[str] = set()
+    upserted = 0
+    async for page in client.iter_pages(
+        f"/projects/{project_gid}/tasks", params={"opt_fields": MIRROR_TASK_FIELDS}
+    ):
+        tasks = page.get("data") or []
+        upserted += await asyncio.to_thread(mirror.upsert_tasks, tasks, project_gid)
+        seen.update(task["gid"] for task in tasks)
+    pruned = await asyncio.to_thread(mirror.prune_project, project_gid, seen)
+    await asyncio.to_thread(mirror.set_state, project_gid, workspace_gid, sync_token)
+    return {"project_gid": project_gid, "mode": "full", "upserted": upserted, "deleted": pruned}
+
+
+async def _fetch_task(client: AsyncAsanaClient, task_gid: str) -> Optional[Dict[str, Any]]:
+    if client.cache is not None:
+        client.cache.invalidate([f"/tasks/{task_gid}"])
+    try:
+        response = await client.request(
+            "GET", f"/tasks/{task_gid}", params={"opt_fields": MIRROR_TASK_FIELDS}
+        )
+    except AsanaError as exc:
+        if exc.status_code == 404:
+            return None
+        raise
+    return response.get("data")
+
+
+async def sync_project(
+    client: AsyncAsanaClient,
+    mirror: TaskMirror,
+    project_gid: str,
+    workspace_gid: Optional[str] = None,
+    full: bool = False,
+) -> Dict[str, Any]:
+    state = await asyncio.to_thread(mirror.get_state, project_gid)
+    if full or not state or not state.get("sync_token"):
+        return await _full_sync(client, mirror, project_gid, workspace_gid)
+
+    sync_token = state["sync_token"]
+    changed: Set[str] = set()
+    removed: Set[str] = set()
+    events = 0
+    while True:
+        try:
+            response = await client.request(
+                "GET", "/events", params={"resource": project_gid, "sync": sync_token}
+            )
+        except AsanaError as exc:
+            if exc.status_code == 412:
+                return await _full_sync(client, mirror, project_gid, workspace_gid)
+            raise
+        for event in response.get("data") or []:
+            resource = event.get("resource") or {}
+            if resource.get("resource_type") != "task" or not resource.get("gid"):
+                continue
+            events += 1
+            if event.get("action") in DELETE_ACTIONS:
+                removed.add(resource["gid"])
+                changed.discard(resource["gid"])
+            else:
+                changed.add(resource["gid"])
+                removed.discard(resource["gid"])
+        sync_token = response.get("sync") or sync_token
+        if not response.get("has_more"):
+            break
+
+    fetched = await asyncio.gather(*(_fetch_task(client, gid) for gid in sorted(changed)))
+    tasks = [task for task in fetched if task]
+    gone = removed | {gid for gid, task in zip(sorted(changed), fetched) if not task}
+    in_project = [
+        task for task in tasks
+        if any(
+            (membership.get("project") or {}).get("gid") == project_gid
+            for membership in task.get("memberships") or []
+        )
+    ]
+    gone |= {task["gid"] for task in tasks} - {task["gid"] for task in in_project}
+    upserted = await asyncio.to_thread(mirror.upsert_tasks, in_project, project_gid)
+    keep = await asyncio.to_thread(mirror.project_task_gids, project_gid)
+    deleted = await asyncio.to_thread(mirror.prune_project, project_gid, keep - gone)
+    await asyncio.to_thread(mirror.set_state, project_gid, workspace_gid, sync_token)
+    return {
+        "project_gid": project_gid,
+        "mode": "incremental",
+        "events": events,
+        "upserted": upserted,
+        "deleted": deleted,
+    }
+
@@ -0,0 +1,96 @@
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+PROFILE_MODES = ("cpu", "memory")
+DEFAULT_OUTPUTS = {
+    "cpu": "logs/asana-mcp.pstats",
+    "memory": "logs/asana-mcp.tracemalloc",
+}
+TRACEMALLOC_FRAMES = 10
+
+_ACTIVE: Optional["Profiler"] = None
+
+
+class Profiler:
+    """Hot-path profiling for a server run: cProfile (cpu) or tracemalloc (memory)."""
+
+    def __init__(self, mode: str, output: Optional[str] = None) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.output = output or DEFAULT_OUTPUTS[mode]
+        self._profile: Optional[cProfile.Profile] = None
+
+    def start(self) -> None:
+        global _ACTIVE
+        if self.mode == "cpu":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        _ACTIVE = self
+
+    def stop(self) -> str:
+        global _ACTIVE
+        _ensure_parent(self.output)
+        if self.mode == "cpu" and self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.output)
+        elif tracemalloc.is_tracing():
+            tracemalloc.take_snapshot().dump(self.output)
+            tracemalloc.stop()
+        if _ACTIVE is self:
+            _ACTIVE = None
+        return self.output
+
+    def snapshot(self, limit: int = 10) -> Dict[str, Any]:
+        if self.mode == "memory":
+            return {"mode": self.mode, "output": self.output, "top": _top_allocations(limit)}
+        return {"mode": self.mode, "output": self.output, "top": self._top_functions(limit)}
+
+    def _top_functions(self, limit: int) -> List[Dict[str, Any]]:
+        if self._profile is None:
+            return []
+        self._profile.disable()
+        try:
+            stats = pstats.Stats(self._profile, stream=io.StringIO())
+        finally:
+            self._profile.enable()
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        rows = []
+        for func in stats.fcn_list[:limit]:  # type: ignore[attr-defined]
+            calls, _, total, cumulative, _ = stats.stats[func]  # type: ignore[attr-defined]
+            filename, line, name = func
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": calls,
+                    "total_seconds": round(total, 6),
+                    "cumulative_seconds": round(cumulative, 6),
+                }
+            )
+        return rows
+
+
+def _top_allocations(limit: int) -> List[Dict[str, Any]]:
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = tracemalloc.take_snapshot()
+    return [
+        {"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def _ensure_parent(path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def active_profiler() -> Optional[Profiler]:
+    return _ACTIVE
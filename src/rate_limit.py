@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+
+from src.config import Settings
+
+SEARCH_PATH_SUFFIX = "/tasks/search"
+MIN_RATE_FRACTION = 0.1
+RECOVERY_FRACTION = 0.02
+BACKOFF_FACTOR = 0.5
+
+
+def is_search_path(path: str) -> bool:
+    return path.rstrip("/").endswith(SEARCH_PATH_SUFFIX)
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = rate_per_minute / 60.0
+        self.rate = self.max_rate
+        self.burst = burst if burst is not None else max(1.0, rate_per_minute / 6.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, cost: float = 1.0) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, cost: float = 1.0) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self.burst, self._tokens + cost)
+
+    def slow_down(self) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate * BACKOFF_FACTOR)
+
+    def speed_up(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_FRACTION)
+
+
+class RateLimiter:
+    """Request budget and in-flight cap shared by every client built on it.
+
+    ``max_concurrent`` caps threaded callers (the sync client, through
+    ``slots``) and coroutines on an event loop (async clients, through
+    ``async_slots()``) separately: a blocking semaphore cannot be awaited, and
+    an asyncio one cannot be waited on from a thread. All async clients that
+    share the limiter share one cap per loop.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        search_requests_per_minute: float,
+        max_concurrent: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self._clock = clock
+        self._general = TokenBucket(requests_per_minute, clock=clock)
+        self._search = TokenBucket(search_requests_per_minute, clock=clock)
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RateLimiter":
+        return cls(
+            settings.asana_rate_limit_per_minute,
+            settings.asana_search_rate_limit_per_minute,
+            settings.asana_max_concurrent_requests,
+        )
+
+    def reserve(self, path: str, cost: float = 1.0) -> float:
+        delay = self._general.reserve(cost)
+        if is_search_path(path):
+            delay = max(delay, self._search.reserve(cost))
+        with self._lock:
+            paused = self._blocked_until - self._clock()
+        return max(delay, paused, 0.0)
+
+    @property
+    def burst(self) -> float:
+        """Tokens the general bucket can hand out without waiting."""
+        return self._general.burst
+
+    def refund(self, path: str, cost: float = 1.0) -> None:
+        """Return a reservation whose request was never sent."""
+        self._general.refund(cost)
+        if is_search_path(path):
+            self._search.refund(cost)
+
+    def async_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_slots.get(loop)
+            if slots is None:
+                slots = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrent)
+        return slots
+
+    def on_rate_limited(self, path: str, retry_after: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + retry_after)
+        self._general.slow_down()
+        if is_search_path(path):
+            self._search.slow_down()
+
+    def on_success(self, path: str) -> None:
+        self._general.speed_up()
+        if is_search_path(path):
+            self._search.speed_up()
@@ -0,0 +1,190 @@
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from src import codec
+
+R = TypeVar("R", bound="Record")
+RefKey = Tuple[str, Optional[str], Optional[str], Tuple[str, ...]]
+RefTable = Dict[RefKey, "Ref"]
+REF_KEYS = frozenset({"gid", "name", "resource_type"})
+
+
+class Ref:
+    """A compact ``{gid, name, resource_type}`` reference such as an assignee or project.
+
+    Within one decode, equal references are the same object, so 10k tasks in
+    one project hold one project reference instead of 10k dicts. ``keys``
+    records which of the three the response carried, in order, so an explicit
+    ``"name": null`` survives ``to_dict``.
+    """
+
+    __slots__ = ("gid", "name", "resource_type", "keys")
+
+    def __init__(
+        self,
+        gid: str,
+        name: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        keys: Tuple[str, ...] = ("gid", "name", "resource_type"),
+    ) -> None:
+        if not isinstance(gid, str):
+            raise TypeError(f"Reference gid must be a string, got {type(gid).__name__}")
+        self.gid = gid
+        self.name = name
+        self.resource_type = resource_type
+        self.keys = keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.keys}
+
+    def _key(self) -> RefKey:
+        return (self.gid, self.name, self.resource_type, self.keys)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Ref) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"Ref({self.gid!r}, {self.name!r})"
+
+
+def _pack(value: Any, refs: RefTable) -> Any:
+    if isinstance(value, dict):
+        if "gid" in value and value.keys() <= REF_KEYS:
+            key = (value["gid"], value.get("name"), value.get("resource_type"), tuple(value))
+            ref = refs.get(key)
+            if ref is None:
+                ref = refs[key] = Ref(*key)
+            return ref
+        return {key: _pack(item, refs) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_pack(item, refs) for item in value)
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    if isinstance(value, Ref):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_unpack(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _unpack(item) for key, item in value.items()}
+    return value
+
+
+class Record:
+    """Slotted stand-in for an Asana resource dict.
+
+    Known fields live in slots; fields the response omitted stay unset (and
+    are omitted again by ``to_dict``), and anything unknown goes to ``extra``,
+    so ``to_dict`` round-trips the original payload.
+    """
+
+    __slots__ = ("extra",)
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_SET: ClassVar[frozenset] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any], refs: Optional[RefTable] = None) -> R:
+        refs = {} if refs is None else refs
+        record = cls.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if key in cls._FIELD_SET:
+                setattr(record, key, _pack(value, refs))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = _pack(value, refs)
+        record.extra = extra
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {}
+        for field in self.FIELDS:
+            try:
+                data[field] = _unpack(getattr(self, field))
+            except AttributeError:
+                continue
+        if self.extra:
+            data.update((key, _unpack(value)) for key, value in self.extra.items())
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({getattr(self, 'gid', None)!r}, {getattr(self, 'name', None)!r})"
+
+
+class TaskRecord(Record):
+    FIELDS = (
+        "gid",
+        "resource_type",
+        "name",
+        "completed",
+        "completed_at",
+        "assignee",
+        "due_on",
+        "due_at",
+        "start_on",
+        "created_at",
+        "modified_at",
+        "notes",
+        "parent",
+        "projects",
+        "memberships",
+        "tags",
+        "num_subtasks",
+        "permalink_url",
+        "resource_subtype",
+    )
+    __slots__ = FIELDS
+
+
+class ProjectRecord(Record):
+    FIELDS = (
+        "gid",
+        "resource_type",
+        "name",
+        "archived",
+        "color",
+        "notes",
+        "owner",
+        "team",
+        "workspace",
+        "created_at",
+        "modified_at",
+        "due_on",
+        "start_on",
+        "public",
+        "permalink_url",
+    )
+    __slots__ = FIELDS
+
+
+class UserRecord(Record):
+    FIELDS = ("gid", "resource_type", "name", "email", "photo", "workspaces")
+    __slots__ = FIELDS
+
+
+def from_dicts(cls: Type[R], items: Iterable[Dict[str, Any]]) -> List[R]:
+    """Records for ``items``, sharing equal references across all of them."""
+    refs: RefTable = {}
+    return [cls.from_dict(item, refs) for item in items if isinstance(item, dict)]
+
+
+def decode_page(data: Union[bytes, str], cls: Type[R]) -> List[R]:
+    """Decode an Asana list response (``{"data": [...]}``) straight into records."""
+    return from_dicts(cls, codec.loads(data).get("data") or [])
+
+
+def encode_records(records: Iterable[Record]) -> bytes:
+    return codec.dumps({"data": [record.to_dict() for record in records]})
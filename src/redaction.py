@@ -0,0 +1,140 @@
+import types
+import typing
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+SENSITIVE_KEYS = {
+    "authorization",
+    "access_token",
+    "refresh_token",
+    "token",
+    "password",
+    "secret",
+    "notes",
+    "email",
+}
+REDACTED = "[REDACTED]"
+TRUNCATED = "[TRUNCATED]"
+MAX_DEPTH = 32
+MAX_NODES = 50_000
+
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+# Exact types only: audit payloads come from json decoding or model_dump().
+_CONTAINERS = frozenset({dict, list})
+_MAX_SHAPES = 4096
+_SHAPES: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+
+def is_sensitive_key(key: Any) -> bool:
+    return isinstance(key, str) and key.lower() in SENSITIVE_KEYS
+
+
+def _sensitive_keys(value: Dict[Any, Any]) -> Tuple[Any, ...]:
+    # Payloads repeat a handful of key layouts (one per resource type), so the
+    # sensitive-key scan is done once per layout rather than once per dict.
+    shape = tuple(value)
+    found = _SHAPES.get(shape)
+    if found is None:
+        found = tuple(key for key in shape if is_sensitive_key(key))
+        if len(_SHAPES) >= _MAX_SHAPES:
+            _SHAPES.clear()
+        _SHAPES[shape] = found
+    return found
+
+
+def _redact(value: Any, depth: int, budget: List[int]) -> Any:
+    budget[0] -= 1
+    if depth > MAX_DEPTH or budget[0] < 0:
+        return TRUNCATED
+    if type(value) is list:
+        changed_list: Optional[List[Any]] = None
+        for index, item in enumerate(value):
+            if type(item) in _CONTAINERS:
+                new_item = _redact(item, depth + 1, budget)
+                if new_item is not item:
+                    if changed_list is None:
+                        changed_list = list(value)
+                    changed_list[index] = new_item
+        return value if changed_list is None else changed_list
+
+    sensitive = _sensitive_keys(value)
+    changed: Optional[Dict[Any, Any]] = None
+    if sensitive:
+        changed = dict(value)
+        for key in sensitive:
+            if value[key] is not None:
+                changed[key] = REDACTED
+    for key, item in value.items():
+        if type(item) in _CONTAINERS and key not in sensitive:
+            new_item = _redact(item, depth + 1, budget)
+            if new_item is not item:
+                if changed is None:
+                    changed = dict(value)
+                changed[key] = new_item
+    return value if changed is None else changed
+
+
+def redact(payload: Any, max_nodes: int = MAX_NODES) -> Any:
+    if type(payload) not in _CONTAINERS:
+        return payload
+    return _redact(payload, 0, [max_nodes])
+
+
+def _may_contain_containers(annotation: Any) -> bool:
+    if annotation in _SCALAR_TYPES:
+        return False
+    origin = typing.get_origin(annotation)
+    if origin is typing.Literal:
+        return False
+    if origin is Union or origin is types.UnionType:
+        return any(_may_contain_containers(arg) for arg in typing.get_args(annotation))
+    return True
+
+
+class RedactionPlan:
+    __slots__ = ("fields", "sensitive", "nested")
+
+    def __init__(self, fields: FrozenSet[str], sensitive: FrozenSet[str], nested: FrozenSet[str]) -> None:
+        self.fields = fields
+        self.sensitive = sensitive
+        self.nested = nested
+
+    def apply(self, payload: Any) -> Any:
+        if not isinstance(payload, dict) or not self.fields.issuperset(payload):
+            return redact(payload)
+        changed: Optional[Dict[str, Any]] = None
+        budget = [MAX_NODES]
+        for key in self.sensitive:
+            item = payload.get(key)
+            if item is not None:
+                if changed is None:
+                    changed = dict(payload)
+                changed[key] = REDACTED
+        for key in self.nested:
+            item = payload.get(key)
+            if isinstance(item, (dict, list)):
+                new_item = _redact(item, 1, budget)
+                if new_item is not item:
+                    if changed is None:
+                        changed = dict(payload)
+                    changed[key] = new_item
+        return payload if changed is None else changed
+
+
+@lru_cache(maxsize=None)
+def compile_plan(model: Type["BaseModel"]) -> RedactionPlan:
+    fields = set()
+    sensitive = set()
+    nested = set()
+    for name, field in model.model_fields.items():
+        keys = {key for key in (name, field.alias, field.serialization_alias) if isinstance(key, str)}
+        fields.update(keys)
+        for key in keys:
+            if is_sensitive_key(key):
+                sensitive.add(key)
+            elif _may_contain_containers(field.annotation):
+                nested.add(key)
+    return RedactionPlan(frozenset(fields), frozenset(sensitive), frozenset(nested))
@@ -0,0 +1,285 @@
+import asyncio
+import bisect
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src import codec
+from src.asana_client import MAX_PAGE_SIZE, AsanaError, AsyncAsanaClient
+from src.singleflight import AsyncSingleFlight
+
+GID_RE = re.compile(r"^\d+$")
+# Resolution order: later kinds are scoped by the ones before them.
+KINDS = ("workspace", "project", "section", "user", "tag")
+# Listing endpoint per kind; {scope} is the workspace gid, or the project gid for sections.
+LISTING_PATHS = {
+    "workspace": "/workspaces",
+    "project": "/workspaces/{scope}/projects",
+    "section": "/projects/{scope}/sections",
+    "user": "/workspaces/{scope}/users",
+    "tag": "/workspaces/{scope}/tags",
+}
+PASSTHROUGH = {"user": {"me"}}
+MAX_LISTING_ITEMS = 10_000
+# A name missing from a fresh listing triggers at most one re-fetch per interval,
+# so something created a moment ago still resolves.
+MISS_REFRESH_SECONDS = 30.0
+MAX_CANDIDATES = 10
+INDEX_VERSION = 1
+
+
+class NameNotFound(AsanaError):
+    code = "name_not_found"
+
+    def __init__(self, kind: str, name: str, hint: Optional[str] = None):
+        message = f"No {kind} named {name!r}" + (f"; {hint}" if hint else "")
+        super().__init__(404, message, {"kind": kind, "name": name})
+
+
+class AmbiguousName(AsanaError):
+    code = "ambiguous_name"
+
+    def __init__(self, kind: str, name: str, candidates: List[Tuple[str, str]]):
+        super().__init__(
+            409,
+            f"{len(candidates)} {kind}s match {name!r}; pass a gid or a longer name",
+            {
+                "kind": kind,
+                "name": name,
+                "candidates": [{"gid": gid, "name": label} for gid, label in candidates[:MAX_CANDIDATES]],
+            },
+        )
+
+
+def is_gid(value: str) -> bool:
+    return bool(GID_RE.match(value))
+
+
+def _passes_through(kind: str, value: str) -> bool:
+    # Asana accepts a user's email wherever it accepts a user gid.
+    return is_gid(value) or value in PASSTHROUGH.get(kind, ()) or (kind == "user" and "@" in value)
+
+
+def needs_resolution(kind: str, value: Any) -> bool:
+    return any(not _passes_through(kind, item) for item in _split(value))
+
+
+def _split(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, str)]
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return []
+
+
+class _Listing:
+    __slots__ = ("names", "loaded_at", "_folded", "_sorted")
+
+    def __init__(self, names: Dict[str, str], loaded_at: float) -> None:
+        self.names = names
+        self.loaded_at = loaded_at
+        self._folded: Dict[str, List[str]] = {}
+        for gid, name in names.items():
+            self._folded.setdefault(name.casefold(), []).append(gid)
+        self._sorted = sorted(self._folded)
+
+    def lookup(self, name: str) -> Tuple[int, List[str]]:
+        """Matching gids and the tier they matched at: 0 exact, 1 case-insensitive, 2 prefix."""
+        folded = name.casefold()
+        gids = self._folded.get(folded)
+        if gids:
+            exact = [gid for gid in gids if self.names[gid] == name]
+            return (0, exact) if exact else (1, list(gids))
+        matches: List[str] = []
+        for key in self._sorted[bisect.bisect_left(self._sorted, folded) :]:
+            if not key.startswith(folded):
+                break
+            matches.extend(self._folded[key])
+        return 2, matches
+
+
+class NameIndex:
+    """Name→gid listings keyed by ``(kind, scope)``; lookups never touch the network."""
+
+    def __init__(self) -> None:
+        self._listings: Dict[Tuple[str, str], _Listing] = {}
+
+    def replace(self, kind: str, scope: str, names: Dict[str, str], loaded_at: float) -> None:
+        self._listings[(kind, scope)] = _Listing(names, loaded_at)
+
+    def loaded_at(self, kind: str, scope: str) -> Optional[float]:
+        listing = self._listings.get((kind, scope))
+        return listing.loaded_at if listing is not None else None
+
+    def gids(self, kind: str, scope: str) -> List[str]:
+        listing = self._listings.get((kind, scope))
+        return list(listing.names) if listing is not None else []
+
+    def lookup(self, kind: str, name: str, scopes: Iterable[str]) -> List[Tuple[str, str]]:
+        best = 3
+        found: Dict[str, str] = {}
+        for scope in scopes:
+            listing = self._listings.get((kind, scope))
+            if listing is None:
+                continue
+            tier, gids = listing.lookup(name)
+            if not gids or tier > best:
+                continue
+            if tier < best:
+                best, found = tier, {}
+            found.update((gid, listing.names[gid]) for gid in gids)
+        return sorted(found.items(), key=lambda item: (item[1].casefold(), item[0]))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "listings": [
+                {"kind": kind, "scope": scope, "loaded_at": listing.loaded_at, "names": listing.names}
+                for (kind, scope), listing in self._listings.items()
+            ],
+        }
+
+    def load_json(self, document: Dict[str, Any]) -> None:
+        if document.get("version") != INDEX_VERSION:
+            return
+        for listing in document.get("listings") or []:
+            if listing.get("kind") in LISTING_PATHS:
+                self.replace(listing["kind"], listing.get("scope", ""), listing["names"], float(listing["loaded_at"]))
+
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, Dict[str, int]] = {}
+        for (kind, _scope), listing in self._listings.items():
+            entry = counts.setdefault(kind, {"listings": 0, "names": 0})
+            entry["listings"] += 1
+            entry["names"] += len(listing.names)
+        return counts
+
+
+class Resolver:
+    """Turns workspace, project, section, user and tag names into gids.
+
+    Listings are fetched once per scope and reused for ``ttl`` seconds; with a
+    ``path`` they survive restarts. Matching is exact, then case-insensitive,
+    then unique prefix; more than one hit at the best tier is ``ambiguous_name``.
+    """
+
+    def __init__(
+        self,
+        client: Callable[[], AsyncAsanaClient],
+        ttl: float = 600.0,
+        path: Optional[str] = None,
+        owner: str = "",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._client = client
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self.owner = owner
+        self._clock = clock
+        self._flights = AsyncSingleFlight()
+        self.index = NameIndex()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self._load_file()
+
+    def _load_file(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            document = codec.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+        # Names are only valid for the credential that listed them.
+        if document.get("owner") == self.owner:
+            self.index.load_json(document)
+
+    def _save_file(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp.write_bytes(codec.dumps({"owner": self.owner, **self.index.to_json()}))
+        os.replace(temp, self.path)
+
+    async def resolve_fields(self, fields: Dict[str, str], data: Dict[str, Any]) -> None:
+        """Replace names with gids in ``data`` for each ``field -> kind``, in place.
+
+        Workspaces resolve first and scope projects, users and tags; the first
+        project scopes sections.
+        """
+        scope: Dict[str, Optional[str]] = {"workspace": None, "project": None}
+        for field, kind in sorted(fields.items(), key=lambda item: KINDS.index(item[1])):
+            value = data.get(field)
+            if value is None:
+                continue
+            parent = scope["project"] if kind == "section" else scope["workspace"]
+            items = [await self.resolve(kind, item, parent) for item in _split(value)]
+            if kind in scope and items and scope[kind] is None:
+                scope[kind] = items[0]
+            if isinstance(value, list):
+                data[field] = items
+            else:
+                data[field] = ",".join(items)
+
+    async def resolve(self, kind: str, value: str, scope: Optional[str] = None) -> str:
+        if _passes_through(kind, value):
+            return value
+        scopes = await self._scopes(kind, value, scope)
+        loaded = await asyncio.gather(*(self._ensure(kind, item) for item in scopes))
+        matches = self.index.lookup(kind, value, scopes)
+        if not matches and not all(loaded):
+            await asyncio.gather(*(self._ensure(kind, item, miss=True) for item in scopes))
+            matches = self.index.lookup(kind, value, scopes)
+        if not matches:
+            self.misses += 1
+            raise NameNotFound(kind, value)
+        if len(matches) > 1:
+            self.misses += 1
+            raise AmbiguousName(kind, value, matches)
+        self.hits += 1
+        return matches[0][0]
+
+    async def _scopes(self, kind: str, value: str, scope: Optional[str]) -> List[str]:
+        if kind == "workspace":
+            return [""]
+        if scope is not None:
+            return [scope]
+        if kind == "section":
+            raise NameNotFound(kind, value, "section names need a project (gid or name) alongside them")
+        # No workspace given: search every workspace the credential can see.
+        await self._ensure("workspace", "")
+        return self.index.gids("workspace", "")
+
+    async def _ensure(self, kind: str, scope: str, miss: bool = False) -> bool:
+        """Load the listing unless fresh; returns True when it was just loaded."""
+        loaded_at = self.index.loaded_at(kind, scope)
+        age = self._clock() - loaded_at if loaded_at is not None else None
+        if age is not None and age < (MISS_REFRESH_SECONDS if miss else self.ttl):
+            return False
+        await self._flights.do((kind, scope), lambda: self._load(kind, scope))
+        return True
+
+    async def _load(self, kind: str, scope: str) -> None:
+        names: Dict[str, str] = {}
+        path = LISTING_PATHS[kind].format(scope=scope)
+        pages = self._client().iter_pages(path, {"opt_fields": "name"}, MAX_PAGE_SIZE, MAX_LISTING_ITEMS)
+        async for page in pages:
+            for item in page.get("data") or []:
+                if isinstance(item, dict) and item.get("gid"):
+                    names[str(item["gid"])] = str(item.get("name") or "")
+        self.index.replace(kind, scope, names, self._clock())
+        self.loads += 1
+        self._save_file()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kinds": self.index.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "ttl_seconds": self.ttl,
+            "persistent": self.path is not None,
+        }
@@ -0,0 +1,110 @@
+import random
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from src import deadline
+from src.config import Settings
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class RetryPolicy:
+    """Decorrelated-jitter backoff bounded by a per-call deadline.
+
+    429 responses are always retried (Asana did not process the request); 5xx
+    responses and transport errors only for idempotent methods unless
+    ``retry_non_idempotent`` is set.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        deadline: float = 60.0,
+        retry_after_cap: float = 60.0,
+        retry_non_idempotent: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max(max_delay, base_delay)
+        self.deadline = deadline
+        self.retry_after_cap = retry_after_cap
+        self.retry_non_idempotent = retry_non_idempotent
+        self._clock = clock
+        self._uniform = uniform
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RetryPolicy":
+        return cls(
+            max_retries=settings.asana_max_retries,
+            base_delay=settings.asana_retry_base_delay_seconds,
+            max_delay=settings.asana_retry_max_delay_seconds,
+            deadline=settings.asana_retry_deadline_seconds,
+            retry_after_cap=settings.asana_retry_after_cap_seconds,
+            retry_non_idempotent=settings.asana_retry_non_idempotent,
+        )
+
+    def begin(self, method: str) -> "RetryState":
+        return RetryState(self, method.upper())
+
+    def rate_limit_pause(self, response: httpx.Response) -> float:
+        pause = retry_after(response)
+        return min(self.base_delay if pause is None else pause, self.retry_after_cap)
+
+    def backoff(self, previous: float) -> float:
+        return min(self.max_delay, self._uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+class RetryState:
+    """Attempt counter and deadline for one logical request."""
+
+    def __init__(self, policy: RetryPolicy, method: str) -> None:
+        self.policy = policy
+        self.attempt = 0
+        self.idempotent = method in IDEMPOTENT_METHODS or policy.retry_non_idempotent
+        self._previous = policy.base_delay
+        self._deadline_at = policy._clock() + policy.deadline
+
+    def remaining(self) -> float:
+        left = max(0.0, self._deadline_at - self.policy._clock())
+        call_left = deadline.remaining()
+        return left if call_left is None else min(left, call_left)
+
+    def next_delay(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """Delay before the next attempt, or None when the call should give up.
+
+        ``response`` is None for transport errors.
+        """
+        if self.attempt >= self.policy.max_retries:
+            return None
+        if response is not None and response.status_code == 429:
+            delay = retry_after(response)
+            if delay is not None and delay > self.policy.retry_after_cap:
+                return None
+        elif not self.idempotent or (response is not None and response.status_code not in RETRYABLE_STATUS):
+            return None
+        else:
+            delay = None
+        if delay is None:
+            delay = self.policy.backoff(self._previous)
+            self._previous = delay
+        if delay > self.remaining():
+            return None
+        self.attempt += 1
+        return delay
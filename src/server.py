@@ -1,22 +1,87 @@
 import argparse
-import logging
-import os
+import sys
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
-from mcp.server.fastmcp import FastMCP
-
-from src.config import get_settings
-from src.logging_utils import setup_logging
-from src.tools import register_tools
 from src.version import VERSION
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+# Keep module-level imports to the standard library: every MCP client launch
+# pays for them before --version/--health-check can answer. The MCP SDK,
+# pydantic and httpx load in create_server() (the health check loads only
+# pydantic, to validate Settings); tool_impl on the first tool call.
+
+
+async def _prewarm() -> None:
+    import time
+
+    from src.config import get_settings
+    from src.tool_impl import get_async_client, get_logger
+
+    started = time.perf_counter()
+    try:
+        opened = await get_async_client().prewarm(get_settings().asana_prewarm_connections)
+    except Exception as exc:  # pre-warm is best effort
+        get_logger().warning("Connection pre-warm failed: %s", exc)
+        return
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    get_logger().info("Pre-warmed %d Asana connection(s) in %sms", opened, elapsed_ms)
+
+
+@asynccontextmanager
+async def _prewarm_lifespan(server: Any) -> AsyncIterator[dict]:
+    import asyncio
+
+    # Open connections in the background so the handshake overlaps with the
+    # client's initialize exchange instead of delaying it.
+    task = asyncio.create_task(_prewarm())
+    try:
+        yield {}
+    finally:
+        task.cancel()
+
+
+def create_server(transport: str = "stdio", stateless: bool = False, host: Optional[str] = None) -> "FastMCP":
+    from mcp.server.fastmcp import FastMCP
+
+    from src.config import get_settings
+    from src.tools import register_tools
 
-def create_server() -> FastMCP:
     settings = get_settings()
-    mcp = FastMCP("asana-mcp")
+    if transport == "http":
+        # The FastMCP lifespan runs once per session over HTTP; the HTTP app
+        # pre-warms once per process instead.
+        mcp = FastMCP(
+            "asana-mcp",
+            host=host or settings.asana_http_host,
+            port=settings.asana_http_port,
+            stateless_http=stateless,
+        )
+    else:
+        lifespan = _prewarm_lifespan if settings.asana_prewarm_connections else None
+        mcp = FastMCP("asana-mcp", lifespan=lifespan)
     register_tools(mcp)
     return mcp
 
 
+def health_check() -> int:
+    from src.env import health_problems
+    from src.logging_utils import configure_logging
+
+    logger = configure_logging()
+    problems = health_problems()
+    if problems:
+        for problem in problems:
+            logger.error("Health check failed: %s", problem)
+            print(problem, file=sys.stderr)
+        return 1
+    logger.info("Health check ok.")
+    print("ok")
+    return 0
+
+
 def _print_banner(log_file: str, log_level: str) -> None:
     print(f"Asana MCP server starting (log_file={log_file}, log_level={log_level})")
 
@@ -33,28 +98,93 @@ def main() -> None:
         action="store_true",
         help="Validate configuration and exit.",
     )
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http"),
+        default=None,
+        help="stdio (default) or http: streamable HTTP for many concurrent sessions (env ASANA_TRANSPORT).",
+    )
+    parser.add_argument("--host", default=None, help="HTTP bind address (env ASANA_HTTP_HOST).")
+    parser.add_argument("--port", type=int, default=None, help="HTTP port (env ASANA_HTTP_PORT).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="HTTP worker processes (env ASANA_HTTP_WORKERS); each has its own cache and rate budget.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve the scripts/asana_*.py entry points from one warm process over a Unix socket.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("cpu", "memory"),
+        default=None,
+        help="Profile the run with cProfile (cpu) or tracemalloc (memory).",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Where to write the profile on shutdown.",
+    )
     args = parser.parse_args()
 
     if args.version:
         print(VERSION)
         return
 
-    log_file = os.getenv("LOG_FILE", "logs/asana-mcp.log")
-    log_level = os.getenv("LOG_LEVEL", "INFO")
-    setup_logging(log_file, log_level)
+    if args.health_check:
+        raise SystemExit(health_check())
+
+    if args.daemon:
+        from src.daemon import run_daemon
+        from src.logging_utils import shutdown_logging
+
+        try:
+            raise SystemExit(run_daemon())
+        finally:
+            shutdown_logging()
 
+    from src.config import get_settings
+    from src.logging_utils import configure_logging, shutdown_logging
+    from src.metrics import REGISTRY, MetricsFileWriter
+    from src.profiling import Profiler
+
+    logger = configure_logging()
     settings = get_settings()
-    logger = logging.getLogger("asana_mcp")
 
-    if args.health_check:
-        logger.info("Health check ok.")
-        print("ok")
-        return
+    transport = args.transport or settings.asana_transport
+    workers = args.workers or settings.asana_http_workers
+    single_process = transport == "stdio" or workers == 1
+    if not single_process and (settings.asana_metrics_file or args.profile):
+        logger.warning("ASANA_METRICS_FILE and --profile only cover single-process runs; ignored with %d workers.", workers)
 
     _print_banner(settings.log_file, settings.log_level)
-    logger.info("Asana MCP server starting.")
-    server = create_server()
-    server.run()
+    logger.info("Asana MCP server starting (transport=%s).", transport)
+    metrics_writer = None
+    if settings.asana_metrics_file and single_process:
+        metrics_writer = MetricsFileWriter(
+            REGISTRY, settings.asana_metrics_file, settings.asana_metrics_interval_seconds
+        )
+        metrics_writer.start()
+    profiler = Profiler(args.profile, args.profile_output) if args.profile and single_process else None
+    if profiler is not None:
+        profiler.start()
+    try:
+        if transport == "http":
+            from src.http_app import run_http
+
+            run_http(args.host or settings.asana_http_host, args.port or settings.asana_http_port, workers, settings)
+        else:
+            create_server().run()
+    finally:
+        logger.info("Asana MCP server stopping.")
+        if profiler is not None:
+            logger.info("Profile written to %s", profiler.stop())
+        if metrics_writer is not None:
+            metrics_writer.stop()
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+import asyncio
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+
+from src.asana_client import MAX_PAGE_SIZE, AsanaError, AsyncAsanaClient, DeadlineExceededError
+
+LINK_FIELDS = "name,completed"
+STORY_FIELDS = "created_at,created_by.name,resource_subtype,text"
+# Stories come back oldest first; the most recent ones are the tail of at most this many.
+MAX_STORY_SCAN = 1_000
+
+
+def _with_subtask_count(opt_fields: str) -> str:
+    fields = [field for field in opt_fields.split(",") if field]
+    return ",".join(fields if "num_subtasks" in fields else [*fields, "num_subtasks"])
+
+
+class TaskTreeWalk:
+    """Breadth-first fetch of a task and its subtask hierarchy.
+
+    A level's listings run concurrently, at most ``concurrency`` at a time, and
+    every request still goes through the client's shared rate limiter. Subtask
+    listings carry the requested fields, so a node costs no request of its own,
+    and nodes reporting ``num_subtasks == 0`` are never listed.
+    """
+
+    def __init__(
+        self,
+        client: AsyncAsanaClient,
+        opt_fields: str,
+        max_depth: int,
+        max_nodes: int,
+        concurrency: int,
+        links: bool = False,
+        stories: int = 0,
+    ) -> None:
+        self.client = client
+        self.opt_fields = _with_subtask_count(opt_fields)
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.links = links
+        self.stories = stories
+        self._slots = asyncio.Semaphore(concurrency)
+        self.seen: Set[str] = set()
+        self.requests = 0
+        self.depth = 0
+        self.duplicates = 0
+        self.truncated = False
+        self.errors: List[Dict[str, Any]] = []
+
+    async def run(self, task_gid: str) -> Dict[str, Any]:
+        async with self._slots:
+            self.requests += 1
+            response = await self.client.request("GET", f"/tasks/{task_gid}", params={"opt_fields": self.opt_fields})
+        root = dict(response.get("data") or {})
+        self.seen.add(str(root.get("gid") or task_gid))
+        level = [root]
+        depth = 0
+        while level:
+            expand = depth < self.max_depth
+            budget = self.max_nodes - len(self.seen)
+            listed = await asyncio.gather(*(self._fill(node, expand, budget) for node in level))
+            following: List[Dict[str, Any]] = []
+            for node, children in zip(level, listed):
+                if children is None:
+                    continue
+                node["subtasks"] = self._admit(children)
+                following.extend(node["subtasks"])
+            if following:
+                depth += 1
+            level = following
+        self.depth = depth
+        return root
+
+    def _admit(self, children: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Admission happens in level order after the listings finish, so the
+        # node budget and duplicate handling are deterministic.
+        admitted = []
+        for child in children:
+            gid = str(child.get("gid"))
+            if gid in self.seen:
+                self.duplicates += 1
+                continue
+            if len(self.seen) >= self.max_nodes:
+                self.truncated = True
+                break
+            self.seen.add(gid)
+            admitted.append(dict(child))
+        return admitted
+
+    async def _fill(self, node: Dict[str, Any], expand: bool, budget: int) -> Optional[List[Dict[str, Any]]]:
+        gid = node.get("gid")
+        has_children = node.get("num_subtasks", 1) > 0
+        parts: Dict[str, Any] = {}
+        if has_children and not (expand and budget > 0):
+            self.truncated = True
+        elif has_children:
+            parts["subtasks"] = self._list(f"/tasks/{gid}/subtasks", self.opt_fields, budget)
+        if self.links:
+            parts["dependencies"] = self._list(f"/tasks/{gid}/dependencies", LINK_FIELDS)
+            parts["dependents"] = self._list(f"/tasks/{gid}/dependents", LINK_FIELDS)
+        if self.stories:
+            parts["stories"] = self._recent_stories(f"/tasks/{gid}/stories")
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+        children = None
+        for part, result in zip(parts, results):
+            if isinstance(result, DeadlineExceededError) or not isinstance(result, (list, AsanaError)):
+                raise result
+            if isinstance(result, AsanaError):
+                error = {"gid": gid, "part": part, "status_code": result.status_code, "message": str(result)}
+                self.errors.append(error)
+            elif part == "subtasks":
+                children = result
+            else:
+                node[part] = result
+        return children
+
+    async def _list(self, path: str, opt_fields: str, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        async with self._slots:
+            async for page in self.client.iter_pages(path, {"opt_fields": opt_fields}, MAX_PAGE_SIZE, max_items):
+                self.requests += 1
+                items.extend(page.get("data") or [])
+        return items
+
+    async def _recent_stories(self, path: str) -> List[Dict[str, Any]]:
+        recent: deque = deque(maxlen=self.stories)
+        recent.extend(await self._list(path, STORY_FIELDS, MAX_STORY_SCAN))
+        return list(recent)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "nodes": len(self.seen),
+            "depth": self.depth,
+            "truncated": self.truncated,
+            "duplicates": self.duplicates,
+            "errors": self.errors,
+            "upstream_calls": self.requests,
+        }
@@ -1,24 +1,50 @@
+import asyncio
+import time
 from functools import lru_cache
-from typing import Any, Dict, Optional
-
-from pydantic import BaseModel, Field
-
-from src.asana_client import AsanaClient, AsanaError
+from pathlib import Path
+from typing import Any, AsyncIterator, ClassVar, Dict, Literal, Optional, Tuple, Type
+
+from pydantic import AliasChoices, BaseModel, Field
+
+from src.asana_client import MAX_PAGE_SIZE, AsanaError, AsyncAsanaClient
+from src.batch import batch_action, run_batch
+from src.cache import ResponseCache
+from src.client_pool import ClientPool
+from src.composite import Plan, PlanResult, run_plan
+from src.config import get_settings
+from src.credentials import TokenFile, current_token
+from src.export import ProjectExport, export_path
 from src.logging_utils import audit
+from src.logging_utils import configure_logging
+from src.logging_utils import log_queue_stats
 from src.logging_utils import redact_dict
-import os
-from src.logging_utils import setup_logging
+from src.metrics import REGISTRY
+from src.mirror import TaskMirror, sync_project
+from src.profiling import active_profiler
+from src.rate_limit import RateLimiter
+from src.resolver import Resolver, needs_resolution
+from src.task_tree import TaskTreeWalk
 
 
 _LOGGER = None
+MAX_ITEMS_CAP = 10_000
+MAX_BATCH_ITEMS = 1_000
+LOCAL_SEARCH_PARAMS = {
+    "text",
+    "assignee",
+    "projects",
+    "completed_since",
+    "limit",
+    "opt_fields",
+    "sort_by",
+    "sort_ascending",
+}
 
 
 def get_logger():
     global _LOGGER
     if _LOGGER is None:
-        log_file = os.getenv("LOG_FILE", "logs/asana-mcp.log")
-        log_level = os.getenv("LOG_LEVEL", "INFO")
-        _LOGGER = setup_logging(log_file, log_level)
+        _LOGGER = configure_logging()
     return _LOGGER
 
 
@@ -33,47 +59,189 @@ def err(code: str, message: str, details: Optional[Dict[str, Any]] = None) -> Di
     return {"status": "error", "error": payload}
 
 
+def _asana_err(exc: AsanaError) -> Dict[str, Any]:
+    return err(exc.code, str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+
+
 @lru_cache
-def get_client() -> AsanaClient:
-    return AsanaClient()
+def get_rate_limiter() -> RateLimiter:
+    return RateLimiter.from_settings(get_settings())
 
 
-class ListWorkspacesInput(BaseModel):
-    opt_fields: Optional[str] = None
+@lru_cache
+def get_response_cache() -> Optional[ResponseCache]:
+    return ResponseCache.from_settings(get_settings())
 
 
-class GetCurrentUserInput(BaseModel):
+@lru_cache
+def get_client_pool() -> ClientPool:
+    settings = get_settings()
+    return ClientPool(
+        settings,
+        token_file=TokenFile.from_env(settings.asana_access_token, settings.asana_token_reload_seconds),
+        default_limiter=get_rate_limiter(),
+        default_cache=get_response_cache(),
+    )
+
+
+def get_async_client() -> AsyncAsanaClient:
+    return get_client_pool().get(current_token())
+
+
+@lru_cache
+def _mirror() -> Optional[TaskMirror]:
+    path = get_settings().asana_mirror_path
+    return TaskMirror(path) if path else None
+
+
+def get_mirror() -> Optional[TaskMirror]:
+    # The mirror holds the server credential's view; callers with their own
+    # token must not read it.
+    return None if current_token() is not None else _mirror()
+
+
+@lru_cache(maxsize=1)
+def _resolver(owner: str) -> Resolver:
+    settings = get_settings()
+    return Resolver(
+        lambda: get_async_client(),
+        settings.asana_resolver_ttl_seconds,
+        settings.asana_resolver_path,
+        owner=owner,
+    )
+
+
+def get_export_dir() -> Path:
+    return Path(get_settings().asana_export_dir)
+
+
+def get_resolver() -> Resolver:
+    # A request token gets a throwaway index: names listed for one user are
+    # never answered from, or persisted alongside, another user's.
+    if current_token() is not None:
+        return Resolver(lambda: get_async_client(), get_settings().asana_resolver_ttl_seconds)
+    # Keyed on the current server credential, so a token file reload starts a
+    # fresh index instead of answering with names the old token listed.
+    return _resolver(get_client_pool().default_credential())
+
+
+FieldPreset = Literal["minimal", "standard", "full"]
+
+_TASK_STANDARD_FIELDS = (
+    "name,completed,assignee.name,due_on,start_on,projects.name,"
+    "memberships.section.name,modified_at,permalink_url"
+)
+FIELD_PRESETS: Dict[str, Dict[str, str]] = {
+    "workspace": {
+        "minimal": "name",
+        "standard": "name,is_organization",
+        "full": "name,is_organization,email_domains",
+    },
+    "user": {
+        "minimal": "name",
+        "standard": "name,email,workspaces.name",
+        "full": "name,email,photo,workspaces.name,workspaces.is_organization",
+    },
+    "project": {
+        "minimal": "name",
+        "standard": "name,archived,color,owner.name,team.name,modified_at,permalink_url",
+        "full": (
+            "name,archived,color,notes,owner.name,team.name,members.name,current_status_update.title,"
+            "created_at,modified_at,due_on,start_on,public,default_view,permalink_url,workspace.name"
+        ),
+    },
+    "task": {
+        "minimal": "name,completed",
+        "standard": _TASK_STANDARD_FIELDS,
+        "full": (
+            f"{_TASK_STANDARD_FIELDS},notes,completed_at,created_at,due_at,parent.name,tags.name,"
+            "followers.name,num_subtasks,dependencies,dependents,custom_fields.name,"
+            "custom_fields.display_value,memberships.project.name,resource_subtype"
+        ),
+    },
+}
+
+
+class ReadInput(BaseModel):
+    FIELD_RESOURCE: ClassVar[str] = "task"
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {}
+    DEFAULT_FIELDS: ClassVar[str] = "standard"
+
     opt_fields: Optional[str] = None
+    fields: Optional[FieldPreset] = None
+    compact: bool = False
+
+
+class ListWorkspacesInput(ReadInput):
+    FIELD_RESOURCE: ClassVar[str] = "workspace"
 
 
-class ListProjectsInput(BaseModel):
+class GetCurrentUserInput(ReadInput):
+    FIELD_RESOURCE: ClassVar[str] = "user"
+
+
+class ListProjectsInput(ReadInput):
+    FIELD_RESOURCE: ClassVar[str] = "project"
+    DEFAULT_FIELDS: ClassVar[str] = "minimal"
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"workspace_gid": "workspace"}
+
     workspace_gid: str = Field(min_length=1)
     archived: Optional[bool] = None
     limit: Optional[int] = Field(default=None, ge=1, le=100)
-    opt_fields: Optional[str] = None
+    offset: Optional[str] = None
+    max_items: Optional[int] = Field(default=None, ge=1, le=MAX_ITEMS_CAP)
+    page_size: Optional[int] = Field(default=None, ge=1, le=MAX_PAGE_SIZE)
 
 
-class GetTaskInput(BaseModel):
+class GetTaskInput(ReadInput):
     task_gid: str = Field(min_length=1)
-    opt_fields: Optional[str] = None
 
 
-class SearchTasksInput(BaseModel):
+class GetTaskTreeInput(GetTaskInput):
+    DEFAULT_FIELDS: ClassVar[str] = "minimal"
+
+    max_depth: int = Field(default=3, ge=0, le=10)
+    max_nodes: int = Field(default=500, ge=1, le=MAX_ITEMS_CAP)
+    include_dependencies: bool = False
+    # Most recent stories to attach per node; 0 skips the stories calls.
+    stories: int = Field(default=0, ge=0, le=100)
+    concurrency: int = Field(default=8, ge=1, le=50)
+
+
+class SearchTasksInput(ReadInput):
+    DEFAULT_FIELDS: ClassVar[str] = "minimal"
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"workspace_gid": "workspace", "projects": "project", "assignee": "user"}
+
     workspace_gid: str = Field(min_length=1)
     text: Optional[str] = None
     assignee: Optional[str] = None
     projects: Optional[str] = None
     completed_since: Optional[str] = None
     limit: Optional[int] = Field(default=None, ge=1, le=100)
+    created_at_before: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("created_at_before", "created_at.before"),
+        serialization_alias="created_at.before",
+    )
+    max_items: Optional[int] = Field(default=None, ge=1, le=MAX_ITEMS_CAP)
+    page_size: Optional[int] = Field(default=None, ge=1, le=MAX_PAGE_SIZE)
     sort_by: Optional[str] = None
     sort_ascending: Optional[bool] = None
-    opt_fields: Optional[str] = None
+    source: Literal["live", "local"] = "live"
 
 
 class CreateTaskInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {
+        "workspace": "workspace",
+        "projects": "project",
+        "assignee": "user",
+        "tags": "tag",
+    }
+
     name: str = Field(min_length=1)
     workspace: Optional[str] = None
     projects: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
     notes: Optional[str] = None
     assignee: Optional[str] = None
     due_on: Optional[str] = None
@@ -82,6 +250,8 @@ class CreateTaskInput(BaseModel):
 
 
 class UpdateTaskInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"workspace": "workspace", "projects": "project", "assignee": "user"}
+
     task_gid: str = Field(min_length=1)
     name: Optional[str] = None
     workspace: Optional[str] = None
@@ -98,17 +268,24 @@ class DeleteTaskInput(BaseModel):
 
 
 class MoveTaskToSectionInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"project": "project", "section_gid": "section"}
+
     section_gid: str = Field(min_length=1)
     task_gid: str = Field(min_length=1)
+    # Only used to look up a section given by name.
+    project: Optional[str] = None
     insert_before: Optional[str] = None
     insert_after: Optional[str] = None
 
 
 class CreateTaskInSectionInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {**CreateTaskInput.NAME_FIELDS, "section_gid": "section"}
+
     section_gid: str = Field(min_length=1)
     name: str = Field(min_length=1)
     workspace: Optional[str] = None
     projects: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
     notes: Optional[str] = None
     assignee: Optional[str] = None
     due_on: Optional[str] = None
@@ -118,148 +295,648 @@ class CreateTaskInSectionInput(BaseModel):
     insert_after: Optional[str] = None
 
 
-def list_workspaces(payload: Dict[str, Any]) -> Dict[str, Any]:
+class SubtaskInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"assignee": "user"}
+
+    name: str = Field(min_length=1)
+    notes: Optional[str] = None
+    assignee: Optional[str] = None
+    due_on: Optional[str] = None
+    start_on: Optional[str] = None
+
+
+class CreateTaskWithSubtasksInput(CreateTaskInput):
+    subtasks: list[SubtaskInput] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class CreateTaskWithDependenciesInput(CreateTaskInput):
+    # Asana allows at most 30 dependencies plus dependents per task.
+    dependencies: list[str] = Field(default_factory=list, max_length=30)
+    dependents: list[str] = Field(default_factory=list, max_length=30)
+
+
+class MoveTasksToSectionInOrderInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"project": "project", "section_gid": "section"}
+
+    section_gid: str = Field(min_length=1)
+    task_gids: list[str] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+    project: Optional[str] = None
+    # Where the first task goes; the rest follow it in list order.
+    insert_before: Optional[str] = None
+    insert_after: Optional[str] = None
+
+
+class BatchCreateTasksInput(BaseModel):
+    tasks: list[CreateTaskInput] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchUpdateTasksInput(BaseModel):
+    tasks: list[UpdateTaskInput] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchDeleteTasksInput(BaseModel):
+    task_gids: list[str] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchMoveTasksToSectionInput(BaseModel):
+    moves: list[MoveTaskToSectionInput] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class CacheStatsInput(BaseModel):
+    clear: bool = False
+
+
+class ServerStatsInput(BaseModel):
+    format: Literal["json", "prometheus"] = "json"
+    reset: bool = False
+    top: int = Field(default=10, ge=1, le=100)
+
+
+class ExportProjectInput(ReadInput):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"project_gid": "project"}
+
+    project_gid: str = Field(min_length=1)
+    # Relative to ASANA_EXPORT_DIR; the checkpoint sits next to it as <path>.checkpoint.
+    path: str = Field(min_length=1)
+    gzip: Optional[bool] = None
+    resume: bool = True
+    concurrency: int = Field(default=4, ge=1, le=16)
+
+
+class SyncMirrorInput(BaseModel):
+    NAME_FIELDS: ClassVar[Dict[str, str]] = {"workspace_gid": "workspace", "project_gids": "project"}
+
+    workspace_gid: str = Field(min_length=1)
+    project_gids: list[str] = Field(min_length=1)
+    full: bool = False
+
+
+async def _resolve_names(model: Type[BaseModel], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Swap names for gids in place; returns an error envelope if one does not resolve."""
+    fields: Dict[str, str] = getattr(model, "NAME_FIELDS", {})
+    if not any(needs_resolution(kind, data.get(field)) for field, kind in fields.items()):
+        return None
+    try:
+        await get_resolver().resolve_fields(fields, data)
+    except AsanaError as exc:
+        return _asana_err(exc)
+    return None
+
+
+async def _resolve_all(model: Type[BaseModel], items: list[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    for failed in await asyncio.gather(*(_resolve_names(model, item) for item in items)):
+        if failed is not None:
+            return failed
+    return None
+
+
+def _apply_projection(model: Type[ReadInput], data: Dict[str, Any]) -> bool:
+    preset = data.pop("fields", None)
+    if "opt_fields" not in data:
+        data["opt_fields"] = FIELD_PRESETS[model.FIELD_RESOURCE][preset or model.DEFAULT_FIELDS]
+    return data.pop("compact")
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            item = _compact(item)
+            if item is None or item == "" or item == [] or item == {}:
+                continue
+            compacted[key] = item
+        if list(compacted) == ["data"]:
+            return compacted["data"]
+        return compacted
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
+
+
+def _read_result(response: Any, compact: bool) -> Dict[str, Any]:
+    return ok(_compact(response) if compact else response)
+
+
+async def _collect_pages(pages: AsyncIterator[Dict[str, Any]]) -> Dict[str, Any]:
+    items: list[Any] = []
+    collected: Dict[str, Any] = {"data": items, "next_page": None}
+    async for page in pages:
+        items.extend(page.get("data") or [])
+        collected["next_page"] = page.get("next_page")
+        if "truncated" in page:
+            collected["truncated"] = page["truncated"]
+    return collected
+
+
+def _batch_result(result: Any) -> Dict[str, Any]:
+    if isinstance(result, AsanaError):
+        return _asana_err(result)
+    status_code = result.get("status_code", 500) if isinstance(result, dict) else 500
+    body = result.get("body") if isinstance(result, dict) else None
+    if status_code < 400:
+        return ok(body)
+    return err("asana_error", "Asana API error", {"status_code": status_code, "details": redact_dict(body)})
+
+
+def _batch_summary(results: list[Any]) -> Dict[str, Any]:
+    envelopes = [_batch_result(result) for result in results]
+    failed = sum(1 for envelope in envelopes if envelope["status"] == "error")
+    return {"results": envelopes, "succeeded": len(envelopes) - failed, "failed": failed}
+
+
+async def list_workspaces(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = ListWorkspacesInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.list_workspaces", data)
+    audit(get_logger(), "asana.list_workspaces", data, ListWorkspacesInput)
+    compact = _apply_projection(ListWorkspacesInput, data)
     try:
-        response = get_client().request("GET", "/workspaces", params=data or None)
-        return ok(response)
+        response = await get_async_client().request("GET", "/workspaces", params=data or None)
+        return _read_result(response, compact)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def get_current_user(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def get_current_user(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = GetCurrentUserInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.get_current_user", data)
+    audit(get_logger(), "asana.get_current_user", data, GetCurrentUserInput)
+    compact = _apply_projection(GetCurrentUserInput, data)
     try:
-        response = get_client().request("GET", "/users/me", params=data or None)
-        return ok(response)
+        response = await get_async_client().request("GET", "/users/me", params=data or None)
+        return _read_result(response, compact)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def list_projects(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def list_projects(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = ListProjectsInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.list_projects", data)
+    failed = await _resolve_names(ListProjectsInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.list_projects", data, ListProjectsInput)
+    compact = _apply_projection(ListProjectsInput, data)
     workspace_gid = data.pop("workspace_gid")
+    max_items = data.pop("max_items", None)
+    page_size = data.pop("page_size", None)
+    path = f"/workspaces/{workspace_gid}/projects"
     try:
-        response = get_client().request(
-            "GET",
-            f"/workspaces/{workspace_gid}/projects",
-            params=data or None,
-        )
-        return ok(response)
+        if max_items is None:
+            if page_size:
+                data["limit"] = page_size
+            response = await get_async_client().request("GET", path, params=data or None)
+            return _read_result(response, compact)
+        page_size = page_size or data.get("limit", MAX_PAGE_SIZE)
+        pages = get_async_client().iter_pages(path, data, page_size, max_items)
+        return _read_result(await _collect_pages(pages), compact)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def get_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def get_task(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = GetTaskInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.get_task", data)
+    audit(get_logger(), "asana.get_task", data, GetTaskInput)
+    compact = _apply_projection(GetTaskInput, data)
     task_gid = data.pop("task_gid")
     try:
-        response = get_client().request(
+        response = await get_async_client().request(
             "GET",
             f"/tasks/{task_gid}",
             params=data or None,
         )
-        return ok(response)
+        return _read_result(response, compact)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
-
-
-def search_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
-    data = SearchTasksInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.search_tasks", data)
-    workspace_gid = data.pop("workspace_gid")
+        return _asana_err(exc)
+
+
+async def get_task_tree(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = GetTaskTreeInput(**payload).model_dump(exclude_none=True)
+    audit(get_logger(), "asana.get_task_tree", data, GetTaskTreeInput)
+    compact = _apply_projection(GetTaskTreeInput, data)
+    walk = TaskTreeWalk(
+        get_async_client(),
+        data["opt_fields"],
+        data["max_depth"],
+        data["max_nodes"],
+        data["concurrency"],
+        links=data["include_dependencies"],
+        stories=data["stories"],
+    )
     try:
-        response = get_client().request(
-            "GET",
-            f"/workspaces/{workspace_gid}/tasks/search",
-            params=data or None,
+        root = await walk.run(data["task_gid"])
+    except AsanaError as exc:
+        return _asana_err(exc)
+    return _read_result({"data": root, **walk.summary()}, compact)
+
+
+async def _search_local(
+    workspace_gid: str, data: Dict[str, Any], limit: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    mirror = get_mirror()
+    if mirror is None:
+        return None, "mirror_not_configured"
+    if set(data) - LOCAL_SEARCH_PARAMS or data.get("assignee") == "me":
+        return None, "unsupported_filter"
+    if data.get("projects"):
+        project_gids = [gid.strip() for gid in data["projects"].split(",") if gid.strip()]
+    else:
+        project_gids = [state["project_gid"] for state in mirror.mirrored_projects(workspace_gid)]
+    states = [mirror.get_state(gid) for gid in project_gids]
+    if not states or any(state is None for state in states):
+        return None, "project_not_mirrored"
+
+    max_staleness = get_settings().asana_mirror_max_staleness_seconds
+    stale = [state for state in states if time.time() - state["synced_at"] > max_staleness]
+    try:
+        await asyncio.gather(
+            *(
+                sync_project(get_async_client(), mirror, state["project_gid"], state["workspace_gid"])
+                for state in stale
+            )
         )
-        return ok(response)
+    except AsanaError:
+        return None, "mirror_behind"
+
+    synced_at = min(mirror.get_state(gid)["synced_at"] for gid in project_gids)
+    tasks = mirror.search(
+        project_gids,
+        text=data.get("text"),
+        assignee=data.get("assignee"),
+        completed_since=data.get("completed_since"),
+        limit=limit,
+    )
+    return {"data": tasks, "source": "local", "staleness_seconds": round(time.time() - synced_at, 3)}, None
+
+
+async def search_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = SearchTasksInput(**payload).model_dump(exclude_none=True, by_alias=True)
+    failed = await _resolve_names(SearchTasksInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.search_tasks", data, SearchTasksInput)
+    compact = _apply_projection(SearchTasksInput, data)
+    workspace_gid = data.pop("workspace_gid")
+    max_items = data.pop("max_items", None)
+    page_size = data.pop("page_size", None)
+    source = data.pop("source")
+    path = f"/workspaces/{workspace_gid}/tasks/search"
+    try:
+        fallback_reason = None
+        if source == "local":
+            limit = max_items or page_size or data.get("limit", MAX_PAGE_SIZE)
+            local, fallback_reason = await _search_local(workspace_gid, data, limit)
+            if local is not None:
+                return _read_result(local, compact)
+        if max_items is None:
+            if page_size:
+                data["limit"] = page_size
+            response = await get_async_client().request("GET", path, params=data or None)
+        else:
+            page_size = page_size or data.get("limit", MAX_PAGE_SIZE)
+            pages = get_async_client().iter_search_pages(path, data, page_size, max_items)
+            response = await _collect_pages(pages)
+        if fallback_reason:
+            response = {**response, "source": "live", "fallback_reason": fallback_reason}
+        return _read_result(response, compact)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def create_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def create_task(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = CreateTaskInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.create_task", data)
+    failed = await _resolve_names(CreateTaskInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.create_task", data, CreateTaskInput)
     try:
-        response = get_client().request("POST", "/tasks", payload={"data": data})
+        response = await get_async_client().request("POST", "/tasks", payload={"data": data})
         return ok(response)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def update_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def update_task(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = UpdateTaskInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.update_task", data)
+    failed = await _resolve_names(UpdateTaskInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.update_task", data, UpdateTaskInput)
     task_gid = data.pop("task_gid")
     try:
-        response = get_client().request(
+        response = await get_async_client().request(
             "PUT",
             f"/tasks/{task_gid}",
             payload={"data": data},
         )
         return ok(response)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def delete_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def delete_task(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = DeleteTaskInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.delete_task", data)
+    audit(get_logger(), "asana.delete_task", data, DeleteTaskInput)
     task_gid = data.get("task_gid")
     try:
-        response = get_client().request("DELETE", f"/tasks/{task_gid}")
+        response = await get_async_client().request("DELETE", f"/tasks/{task_gid}")
         return ok(response)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
 
 
-def move_task_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def move_task_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = MoveTaskToSectionInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.move_task_to_section", data)
+    failed = await _resolve_names(MoveTaskToSectionInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.move_task_to_section", data, MoveTaskToSectionInput)
     section_gid = data.pop("section_gid")
     task_gid = data.pop("task_gid")
+    data.pop("project", None)
     payload_data = {"task": task_gid, **data}
     try:
-        response = get_client().request(
+        response = await get_async_client().request(
             "POST",
             f"/sections/{section_gid}/addTask",
             payload={"data": payload_data},
         )
         return ok(response)
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
+
 
+def _step_envelope(outcome: PlanResult, name: str) -> Dict[str, Any]:
+    result = outcome.results.get(name)
+    if isinstance(result, AsanaError):
+        return _asana_err(result)
+    if result is None:
+        return err("skipped", "Not sent because a step it depends on failed")
+    return ok(result)
 
-def create_task_in_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+
+async def create_task_in_section(payload: Dict[str, Any]) -> Dict[str, Any]:
     data = CreateTaskInSectionInput(**payload).model_dump(exclude_none=True)
-    audit(get_logger(), "asana.create_task_in_section", data)
+    failed = await _resolve_names(CreateTaskInSectionInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.create_task_in_section", data, CreateTaskInSectionInput)
     section_gid = data.pop("section_gid")
-    insert_before = data.pop("insert_before", None)
-    insert_after = data.pop("insert_after", None)
-    try:
-        created = get_client().request("POST", "/tasks", payload={"data": data})
-        task_data = created.get("data") if isinstance(created, dict) else None
-        task_gid = task_data.get("gid") if isinstance(task_data, dict) else None
-        if not task_gid:
-            return err("asana_error", "Asana API returned no task gid", {"details": redact_dict(created)})
-
-        add_payload = {"task": task_gid}
-        if insert_before:
-            add_payload["insert_before"] = insert_before
-        if insert_after:
-            add_payload["insert_after"] = insert_after
-
-        moved = get_client().request(
+    placement = {key: data.pop(key) for key in ("insert_before", "insert_after") if key in data}
+    projects = data.get("projects") or []
+
+    plan = Plan()
+    if not placement and len(projects) == 1:
+        # Placed at creation through memberships: one call instead of two.
+        data["memberships"] = [{"project": data.pop("projects")[0], "section": section_gid}]
+        plan.add("task", "POST", "/tasks", data)
+    else:
+        plan.add("task", "POST", "/tasks", data)
+        plan.add(
+            "section_update",
             "POST",
-            f"/sections/{section_gid}/addTask",
-            payload={"data": add_payload},
+            after=["task"],
+            build=lambda done: (f"/sections/{section_gid}/addTask", {"task": done["task"]["gid"], **placement}),
+        )
+    outcome = await run_plan(get_async_client(), plan)
+    if not outcome.ok("task"):
+        return _asana_err(outcome.error("task"))
+    if not (outcome.data("task") or {}).get("gid"):
+        return err("asana_error", "Asana API returned no task gid", {"details": redact_dict(outcome.results["task"])})
+    if outcome.error("section_update") is not None:
+        return _asana_err(outcome.error("section_update"))
+    return ok(
+        {
+            "task": outcome.results["task"],
+            "section_update": outcome.results.get("section_update"),
+            "upstream_calls": outcome.upstream_calls,
+        }
+    )
+
+
+async def create_task_with_subtasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = CreateTaskWithSubtasksInput(**payload).model_dump(exclude_none=True)
+    subtasks = data.pop("subtasks")
+    failed = await _resolve_names(CreateTaskInput, data) or await _resolve_all(SubtaskInput, subtasks)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.create_task_with_subtasks", {**data, "subtasks": subtasks}, CreateTaskWithSubtasksInput)
+    plan = Plan()
+    plan.add("task", "POST", "/tasks", data)
+    for index, subtask in enumerate(subtasks):
+        plan.add(
+            f"subtask.{index}",
+            "POST",
+            after=["task"],
+            build=lambda done, subtask=subtask: (f"/tasks/{done['task']['gid']}/subtasks", subtask),
+        )
+    outcome = await run_plan(get_async_client(), plan)
+    if not outcome.ok("task"):
+        return _asana_err(outcome.error("task"))
+    envelopes = [_step_envelope(outcome, f"subtask.{index}") for index in range(len(subtasks))]
+    failures = sum(1 for envelope in envelopes if envelope["status"] == "error")
+    return ok(
+        {
+            "task": outcome.results["task"],
+            "subtasks": envelopes,
+            "succeeded": len(envelopes) - failures,
+            "failed": failures,
+            "upstream_calls": outcome.upstream_calls,
+        }
+    )
+
+
+async def create_task_with_dependencies(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = CreateTaskWithDependenciesInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_names(CreateTaskWithDependenciesInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.create_task_with_dependencies", data, CreateTaskWithDependenciesInput)
+    links = {"dependencies": data.pop("dependencies"), "dependents": data.pop("dependents")}
+    plan = Plan()
+    plan.add("task", "POST", "/tasks", data)
+    # Both link calls only need the new gid, so they share one batch request.
+    for field, gids in links.items():
+        if gids:
+            endpoint = "addDependencies" if field == "dependencies" else "addDependents"
+            plan.add(
+                field,
+                "POST",
+                after=["task"],
+                build=lambda done, endpoint=endpoint, field=field, gids=gids: (
+                    f"/tasks/{done['task']['gid']}/{endpoint}",
+                    {field: gids},
+                ),
+            )
+    outcome = await run_plan(get_async_client(), plan)
+    if not outcome.ok("task"):
+        return _asana_err(outcome.error("task"))
+    result: Dict[str, Any] = {"task": outcome.results["task"]}
+    for field in links:
+        result[field] = _step_envelope(outcome, field) if field in plan.steps else None
+    result["upstream_calls"] = outcome.upstream_calls
+    return ok(result)
+
+
+async def move_tasks_to_section_in_order(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = MoveTasksToSectionInOrderInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_names(MoveTasksToSectionInOrderInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.move_tasks_to_section_in_order", data, MoveTasksToSectionInOrderInput)
+    path = f"/sections/{data['section_gid']}/addTask"
+    placement = {key: data[key] for key in ("insert_before", "insert_after") if key in data}
+    # Each move anchors on the previous task, so the chain is inherently sequential;
+    # a failed move skips the rest instead of scrambling the order.
+    plan = Plan()
+    previous = None
+    for index, task_gid in enumerate(data["task_gids"]):
+        anchor = {"insert_after": previous} if previous else placement
+        after = [f"move.{index - 1}"] if index else []
+        plan.add(f"move.{index}", "POST", path, {"task": task_gid, **anchor}, after=after)
+        previous = task_gid
+    outcome = await run_plan(get_async_client(), plan)
+    envelopes = [_step_envelope(outcome, name) for name in plan.steps]
+    failures = sum(1 for envelope in envelopes if envelope["status"] == "error")
+    return ok(
+        {
+            "results": envelopes,
+            "succeeded": len(envelopes) - failures,
+            "failed": failures,
+            "upstream_calls": outcome.upstream_calls,
+        }
+    )
+
+
+async def batch_create_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = BatchCreateTasksInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_all(CreateTaskInput, data["tasks"])
+    if failed:
+        return failed
+    audit(get_logger(), "asana.batch_create_tasks", data, BatchCreateTasksInput)
+    actions = [batch_action("POST", "/tasks", task) for task in data["tasks"]]
+    results = await run_batch(get_async_client(), actions)
+    return ok(_batch_summary(results))
+
+
+async def batch_update_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = BatchUpdateTasksInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_all(UpdateTaskInput, data["tasks"])
+    if failed:
+        return failed
+    audit(get_logger(), "asana.batch_update_tasks", data, BatchUpdateTasksInput)
+    actions = []
+    for task in data["tasks"]:
+        fields = {key: value for key, value in task.items() if key != "task_gid"}
+        actions.append(batch_action("PUT", f"/tasks/{task['task_gid']}", fields))
+    results = await run_batch(get_async_client(), actions)
+    return ok(_batch_summary(results))
+
+
+async def batch_delete_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = BatchDeleteTasksInput(**payload).model_dump(exclude_none=True)
+    audit(get_logger(), "asana.batch_delete_tasks", data, BatchDeleteTasksInput)
+    actions = [batch_action("DELETE", f"/tasks/{task_gid}") for task_gid in data["task_gids"]]
+    results = await run_batch(get_async_client(), actions)
+    return ok(_batch_summary(results))
+
+
+async def batch_move_tasks_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = BatchMoveTasksToSectionInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_all(MoveTaskToSectionInput, data["moves"])
+    if failed:
+        return failed
+    audit(get_logger(), "asana.batch_move_tasks_to_section", data, BatchMoveTasksToSectionInput)
+    actions = []
+    for move in data["moves"]:
+        placement = {key: value for key, value in move.items() if key not in {"section_gid", "task_gid", "project"}}
+        actions.append(
+            batch_action("POST", f"/sections/{move['section_gid']}/addTask", {"task": move["task_gid"], **placement})
+        )
+    results = await run_batch(get_async_client(), actions)
+    return ok(_batch_summary(results))
+
+
+async def cache_stats(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = CacheStatsInput(**payload).model_dump(exclude_none=True)
+    audit(get_logger(), "asana.cache_stats", data, CacheStatsInput)
+    cache = get_response_cache()
+    if cache is None:
+        return ok({"enabled": False})
+    if data["clear"]:
+        cache.clear()
+    return ok({"enabled": True, **cache.stats()})
+
+
+async def sync_mirror(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = SyncMirrorInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_names(SyncMirrorInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.sync_mirror", data, SyncMirrorInput)
+    mirror = get_mirror()
+    if mirror is None:
+        return err("mirror_not_configured", "Set ASANA_MIRROR_PATH to enable the local task mirror.")
+    try:
+        results = await asyncio.gather(
+            *(
+                sync_project(get_async_client(), mirror, project_gid, data["workspace_gid"], data["full"])
+                for project_gid in data["project_gids"]
+            )
         )
-        return ok({"task": created, "section_update": moved})
+        return ok({"projects": results})
     except AsanaError as exc:
-        return err("asana_error", str(exc), {"status_code": exc.status_code, "details": redact_dict(exc.details)})
+        return _asana_err(exc)
+
+
+async def export_project(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = ExportProjectInput(**payload).model_dump(exclude_none=True)
+    failed = await _resolve_names(ExportProjectInput, data)
+    if failed:
+        return failed
+    audit(get_logger(), "asana.export_project", data, ExportProjectInput)
+    compact = _apply_projection(ExportProjectInput, data)
+    try:
+        target = export_path(get_export_dir(), data["path"])
+        export = ProjectExport(
+            get_async_client(),
+            data["project_gid"],
+            target,
+            data["opt_fields"],
+            compress=data.get("gzip", target.suffix == ".gz"),
+            concurrency=data["concurrency"],
+            transform=_compact if compact else None,
+        )
+        return ok(await export.run(resume=data["resume"]))
+    except AsanaError as exc:
+        return _asana_err(exc)
+    except OSError as exc:
+        return err("export_failed", f"Could not write the export: {exc}", {"path": data["path"]})
+
+
+def server_stats_snapshot(top: int = 10) -> Dict[str, Any]:
+    cache = get_response_cache()
+    client = get_async_client()
+    snapshot: Dict[str, Any] = {
+        "metrics": REGISTRY.snapshot(),
+        "cache": {"enabled": True, **cache.stats()} if cache is not None else {"enabled": False},
+        "coalesced_requests": client.coalesced_requests,
+        "pool": client.pool_stats(),
+        "clients": get_client_pool().stats(),
+        "circuits": client.breaker.snapshot(),
+        "resolver": get_resolver().stats(),
+        "log_queue": log_queue_stats(),
+    }
+    profiler = active_profiler()
+    if profiler is not None:
+        snapshot["profile"] = profiler.snapshot(top)
+    return snapshot
+
+
+async def server_stats(payload: Dict[str, Any]) -> Dict[str, Any]:
+    data = ServerStatsInput(**payload).model_dump(exclude_none=True)
+    audit(get_logger(), "asana.server_stats", data, ServerStatsInput)
+    if data["format"] == "prometheus":
+        result: Dict[str, Any] = {"prometheus": REGISTRY.to_prometheus()}
+    else:
+        result = server_stats_snapshot(data["top"])
+    if data["reset"]:
+        REGISTRY.reset()
+    return ok(result)
+
@@ -1,57 +1,208 @@
-from typing import Any, Dict
+import asyncio
+from types import ModuleType
+from typing import Any, Dict, Optional
 
 from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.server import request_ctx
 
-from src import tool_impl
+from src import codec
+from src.config import get_settings
+from src.credentials import credential_scope
+from src.deadline import deadline_scope
+from src.metrics import REGISTRY
+
+# Clients may bound a single call with `"_meta": {"timeoutMs": 5000}`.
+META_TIMEOUT_KEY = "timeoutMs"
+# Over HTTP, with ASANA_ACCEPT_CLIENT_TOKENS, each request may act as its own Asana user.
+TOKEN_HEADER = "x-asana-token"
 
 
 def _wrap(payload: Dict[str, Any]) -> Dict[str, Any]:
     return payload or {}
 
 
+def _timeout_seconds() -> Optional[float]:
+    configured = get_settings().asana_tool_timeout_seconds
+    timeouts = [configured] if configured else []
+    try:
+        meta = request_ctx.get().meta
+    except LookupError:
+        meta = None
+    requested = (meta.model_extra or {}).get(META_TIMEOUT_KEY) if meta is not None else None
+    if isinstance(requested, (int, float)) and not isinstance(requested, bool) and requested > 0:
+        timeouts.append(requested / 1000)
+    return min(timeouts) if timeouts else None
+
+
+def _impl() -> ModuleType:
+    # tool_impl pulls in httpx, sqlite3 and the pydantic input models; load it
+    # on the first tool call instead of at server start.
+    from src import tool_impl
+
+    return tool_impl
+
+
+def _request_token() -> Optional[str]:
+    if not get_settings().asana_accept_client_tokens:
+        return None
+    try:
+        request = request_ctx.get().request
+    except LookupError:
+        return None
+    headers = getattr(request, "headers", None)
+    token = headers.get(TOKEN_HEADER, "").strip() if headers is not None else ""
+    return token or None
+
+
+async def _run(name: str, impl_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    timeout = _timeout_seconds()
+    with REGISTRY.track_tool(name) as call, deadline_scope(timeout), credential_scope(_request_token()):
+        try:
+            # Cancelling the awaited coroutine aborts in-flight HTTP requests and
+            # backoff sleeps, whether the MCP client cancelled or the deadline hit.
+            result = await asyncio.wait_for(getattr(_impl(), impl_name)(_wrap(payload)), timeout)
+        except asyncio.TimeoutError:
+            call.outcome = "deadline_exceeded"
+            message = f"{name} did not finish within {timeout:g}s"
+            return _impl().err("deadline_exceeded", message, {"timeout_seconds": timeout})
+        except asyncio.CancelledError:
+            call.outcome = "cancelled"
+            raise
+        call.outcome = result.get("status", "ok") if isinstance(result, dict) else "ok"
+    return result
+
+
 def register_tools(mcp: FastMCP) -> None:
     @mcp.tool(name="asana_get_current_user", description="Get current Asana user profile")
-    def asana_get_current_user(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.get_current_user(_wrap(payload))
+    async def asana_get_current_user(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_get_current_user", "get_current_user", payload)
 
     @mcp.tool(name="asana_list_workspaces", description="List Asana workspaces")
-    def asana_list_workspaces(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.list_workspaces(_wrap(payload))
+    async def asana_list_workspaces(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_list_workspaces", "list_workspaces", payload)
 
     @mcp.tool(name="asana_list_projects", description="List projects in a workspace")
-    def asana_list_projects(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.list_projects(_wrap(payload))
+    async def asana_list_projects(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_list_projects", "list_projects", payload)
 
     @mcp.tool(name="asana_get_task", description="Get a task by gid")
-    def asana_get_task(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.get_task(_wrap(payload))
+    async def asana_get_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_get_task", "get_task", payload)
 
-    @mcp.tool(name="asana_search_tasks", description="Search tasks within a workspace")
-    def asana_search_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.search_tasks(_wrap(payload))
+    @mcp.tool(
+        name="asana_get_task_tree",
+        description="Get a task with its subtask hierarchy, optionally with dependencies and recent stories",
+    )
+    async def asana_get_task_tree(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_get_task_tree", "get_task_tree", payload)
+
+    @mcp.tool(
+        name="asana_search_tasks",
+        description=(
+            "Search tasks within a workspace (source=local answers from the local mirror). "
+            "max_items pages only when sorted by created_at (the default); any other sort_by returns a single "
+            "page (at most 100 tasks) and sets truncated=true when more may exist"
+        ),
+    )
+    async def asana_search_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_search_tasks", "search_tasks", payload)
 
     @mcp.tool(name="asana_create_task", description="Create a task")
-    def asana_create_task(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.create_task(_wrap(payload))
+    async def asana_create_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_create_task", "create_task", payload)
 
     @mcp.tool(name="asana_update_task", description="Update a task")
-    def asana_update_task(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.update_task(_wrap(payload))
+    async def asana_update_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_update_task", "update_task", payload)
 
     @mcp.tool(name="asana_delete_task", description="Delete a task")
-    def asana_delete_task(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.delete_task(_wrap(payload))
+    async def asana_delete_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_delete_task", "delete_task", payload)
 
     @mcp.tool(
         name="asana_move_task_to_section",
-        description="Add or move a task to a specific section",
+        description="Add or move a task to a specific section (a section name needs `project` alongside it)",
     )
-    def asana_move_task_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.move_task_to_section(_wrap(payload))
+    async def asana_move_task_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_move_task_to_section", "move_task_to_section", payload)
 
     @mcp.tool(
         name="asana_create_task_in_section",
         description="Create a task and add it to a specific section",
     )
-    def asana_create_task_in_section(payload: Dict[str, Any]) -> Dict[str, Any]:
-        return tool_impl.create_task_in_section(_wrap(payload))
+    async def asana_create_task_in_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_create_task_in_section", "create_task_in_section", payload)
+
+    @mcp.tool(
+        name="asana_create_task_with_subtasks",
+        description="Create a task and its subtasks (subtasks go through the batch API together)",
+    )
+    async def asana_create_task_with_subtasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_create_task_with_subtasks", "create_task_with_subtasks", payload)
+
+    @mcp.tool(
+        name="asana_create_task_with_dependencies",
+        description="Create a task and link the tasks it waits on (dependencies) and that wait on it (dependents)",
+    )
+    async def asana_create_task_with_dependencies(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_create_task_with_dependencies", "create_task_with_dependencies", payload)
+
+    @mcp.tool(
+        name="asana_move_tasks_to_section_in_order",
+        description="Move tasks into a section so they end up in the given order",
+    )
+    async def asana_move_tasks_to_section_in_order(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_move_tasks_to_section_in_order", "move_tasks_to_section_in_order", payload)
+
+    @mcp.tool(name="asana_batch_create_tasks", description="Create many tasks via the Asana batch API")
+    async def asana_batch_create_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_batch_create_tasks", "batch_create_tasks", payload)
+
+    @mcp.tool(name="asana_batch_update_tasks", description="Update many tasks via the Asana batch API")
+    async def asana_batch_update_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_batch_update_tasks", "batch_update_tasks", payload)
+
+    @mcp.tool(name="asana_batch_delete_tasks", description="Delete many tasks via the Asana batch API")
+    async def asana_batch_delete_tasks(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_batch_delete_tasks", "batch_delete_tasks", payload)
+
+    @mcp.tool(
+        name="asana_batch_move_tasks_to_section",
+        description="Add or move many tasks to sections via the Asana batch API",
+    )
+    async def asana_batch_move_tasks_to_section(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_batch_move_tasks_to_section", "batch_move_tasks_to_section", payload)
+
+    @mcp.tool(name="asana_cache_stats", description="Show (or clear) the read-through response cache")
+    async def asana_cache_stats(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_cache_stats", "cache_stats", payload)
+
+    @mcp.tool(
+        name="asana_sync_mirror",
+        description="Sync projects into the local task mirror (full first, then incremental via events)",
+    )
+    async def asana_sync_mirror(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_sync_mirror", "sync_mirror", payload)
+
+    @mcp.tool(
+        name="asana_export_project",
+        description="Stream every task of a project to an NDJSON (optionally gzip) file; returns a summary",
+    )
+    async def asana_export_project(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_export_project", "export_project", payload)
+
+    @mcp.tool(
+        name="asana_server_stats",
+        description="Server metrics: per-tool/endpoint latency, retries, sleeps, errors, in-flight gauges",
+    )
+    async def asana_server_stats(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await _run("asana_server_stats", "server_stats", payload)
+
+    @mcp.resource(
+        "asana://server/stats",
+        name="asana_server_stats",
+        description="Live server metrics snapshot (same data as the asana_server_stats tool)",
+        mime_type="application/json",
+    )
+    def asana_server_stats_resource() -> str:
+        return codec.dumps_text(_impl().server_stats_snapshot(), sort_keys=True)
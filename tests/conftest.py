@@ -0,0 +1,70 @@
+from typing import Optional
+
+import httpx
+import pytest
+
+from benchmarks.fake_asana import FakeAsana, FakeAsanaConfig
+from src import tool_impl
+from src.asana_client import AsyncAsanaClient
+from src.config import Settings
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _log_file_outside_repo(tmp_path_factory):
+    """Logging is configured once per process; point it at a temp file before any test can set it up."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("LOG_FILE", str(tmp_path_factory.mktemp("logs") / "asana-mcp.log"))
+        yield
+
+
+@pytest.fixture
+def make_settings():
+    """Build Settings with a test token; keyword arguments override fields."""
+
+    def build(**overrides) -> Settings:
+        values = {"asana_access_token": "token"}
+        values.update(overrides)
+        return Settings(**values)
+
+    return build
+
+
+@pytest.fixture
+def make_client(make_settings):
+    """Build an async client over a mock handler (or a ready transport); extra arguments go to the client."""
+
+    def build(handler, settings: Optional[Settings] = None, **options) -> AsyncAsanaClient:
+        transport = handler if isinstance(handler, httpx.AsyncBaseTransport) else httpx.MockTransport(handler)
+        return AsyncAsanaClient(settings or make_settings(), transport=transport, **options)
+
+    return build
+
+
+@pytest.fixture
+def quiet_audit(monkeypatch):
+    """Keep tool calls from writing audit records."""
+    monkeypatch.setattr(tool_impl, "audit", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def use_client(monkeypatch, quiet_audit):
+    """Route tool implementations to the given client, with auditing silenced."""
+
+    def install(client: AsyncAsanaClient) -> AsyncAsanaClient:
+        monkeypatch.setattr(tool_impl, "get_async_client", lambda: client)
+        return client
+
+    return install
+
+
+@pytest.fixture
+def fake_asana(make_client, make_settings, use_client):
+    """Serve tools from an in-memory FakeAsana built with the given config fields."""
+
+    def build(**config) -> FakeAsana:
+        fake = FakeAsana(FakeAsanaConfig(**config))
+        settings = make_settings(asana_cache_enabled=False, asana_max_retries=0)
+        use_client(make_client(fake.transport(), settings))
+        return fake
+
+    return build
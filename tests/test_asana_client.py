@@ -0,0 +1,47 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src import tool_impl
+from src.rate_limit import RateLimiter
+
+
+@pytest.fixture
+def settings(make_settings):
+    return make_settings(asana_max_retries=2)
+
+
+def test_async_client_retries_after_rate_limit(monkeypatch, make_client, settings):
+    calls = []
+    sleeps = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "1"}, json={"errors": []})
+        return httpx.Response(200, json={"data": {"gid": "1"}})
+
+    clock = [0.0]
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr("src.asana_client.asyncio.sleep", fake_sleep)
+    limiter = RateLimiter(600, 60, max_concurrent=2, clock=lambda: clock[0])
+    client = make_client(handler, settings, limiter=limiter)
+    response = asyncio.run(client.request("GET", "/users/me"))
+    assert response == {"data": {"gid": "1"}}
+    assert len(calls) == 2
+    assert sleeps == [1.0]
+
+
+def test_async_tool_returns_error_envelope(make_client, use_client, settings):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"errors": [{"message": "Not found"}]})
+
+    use_client(make_client(handler, settings))
+    result = asyncio.run(tool_impl.get_task({"task_gid": "42"}))
+    assert result["status"] == "error"
+    assert result["error"]["details"]["status_code"] == 404
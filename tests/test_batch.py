@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src import tool_impl
+from src.batch import chunked
+from src.rate_limit import RateLimiter
+from src.retry import RetryPolicy
+
+
+def test_chunked_respects_batch_limit():
+    assert [len(chunk) for chunk in chunked(list(range(23)))] == [10, 10, 3]
+
+
+def test_batch_create_reports_per_item_results(make_client, use_client):
+    sizes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        actions = json.loads(request.content)["data"]["actions"]
+        sizes.append(len(actions))
+        results = []
+        for action in actions:
+            if action["data"]["name"] == "bad":
+                results.append({"status_code": 400, "body": {"errors": [{"message": "bad"}]}})
+            else:
+                results.append({"status_code": 201, "body": {"data": {"name": action["data"]["name"]}}})
+        return httpx.Response(200, json={"data": results})
+
+    use_client(make_client(handler))
+    tasks = [{"name": f"task-{i}"} for i in range(12)] + [{"name": "bad"}]
+    result = asyncio.run(tool_impl.batch_create_tasks({"tasks": tasks}))
+    summary = result["data"]
+    assert sorted(sizes) == [3, 10]
+    assert summary["succeeded"] == 12
+    assert summary["failed"] == 1
+    assert summary["results"][0]["data"]["data"]["name"] == "task-0"
+    assert summary["results"][-1]["error"]["details"]["status_code"] == 400
+
+
+def test_batch_chunk_failure_marks_each_item(make_client, use_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"errors": [{"message": "forbidden"}]})
+
+    use_client(make_client(handler))
+    result = asyncio.run(tool_impl.batch_delete_tasks({"task_gids": ["1", "2"]}))
+    assert result["data"]["failed"] == 2
+    assert all(item["status"] == "error" for item in result["data"]["results"])
+
+
+class VirtualTime:
+    """Fake clock and sleep: time jumps to the next sleeper's wake-up once every task is blocked."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._sleepers = []
+        self._real_sleep = asyncio.sleep
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        wake = asyncio.get_running_loop().create_future()
+        self._sleepers.append((self.now + delay, wake))
+        await wake
+
+    async def run(self, coro):
+        task = asyncio.ensure_future(coro)
+        while not task.done():
+            for _ in range(50):
+                await self._real_sleep(0)
+            if self._sleepers and not task.done():
+                self._sleepers.sort(key=lambda sleeper: sleeper[0])
+                self.now, wake = self._sleepers.pop(0)
+                wake.set_result(None)
+        return task.result()
+
+
+@pytest.mark.parametrize("overrides", [{}, {"asana_max_concurrent_requests": 50}])
+def test_large_batch_stays_within_the_default_rate_budget(
+    monkeypatch, make_client, make_settings, use_client, overrides
+):
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        actions = json.loads(request.content)["data"]["actions"]
+        sent.extend(action["data"]["name"] for action in actions)
+        return httpx.Response(200, json={"data": [{"status_code": 201, "body": {"data": {}}} for _ in actions]})
+
+    settings = make_settings(**overrides)
+    time = VirtualTime()
+    monkeypatch.setattr("src.asana_client.asyncio.sleep", time.sleep)
+    client = make_client(
+        handler,
+        settings,
+        limiter=RateLimiter(
+            settings.asana_rate_limit_per_minute,
+            settings.asana_search_rate_limit_per_minute,
+            settings.asana_max_concurrent_requests,
+            clock=time,
+        ),
+        retry_policy=RetryPolicy(deadline=settings.asana_retry_deadline_seconds, clock=time),
+    )
+    use_client(client)
+    tasks = [{"name": f"task-{i}"} for i in range(tool_impl.MAX_BATCH_ITEMS)]
+    summary = asyncio.run(time.run(tool_impl.batch_create_tasks({"tasks": tasks})))["data"]
+    assert (summary["succeeded"], summary["failed"]) == (len(tasks), 0)
+    assert sorted(sent) == sorted(task["name"] for task in tasks)
@@ -0,0 +1,37 @@
+from benchmarks.bench_tools import SCENARIOS, BenchOptions, check_baseline, run_suite, tool_functions
+
+
+def _options(**overrides):
+    base = dict(iterations=2, concurrency=2, latency_ms=0.0, tasks=50, projects=20, alloc_samples=1)
+    return BenchOptions(**{**base, **overrides})
+
+
+def test_every_tool_function_has_a_scenario():
+    assert sorted({scenario.tool for scenario in SCENARIOS}) == tool_functions()
+
+
+def test_suite_runs_offline_without_errors():
+    rows = run_suite(_options())
+    assert {row["scenario"] for row in rows} == {scenario.name for scenario in SCENARIOS}
+    assert all(row["errors"] == 0 for row in rows), [row for row in rows if row["errors"]]
+    by_name = {row["scenario"]: row for row in rows}
+    assert by_name["create_task_in_section"]["upstream_calls_per_op"] == 2.0
+    assert by_name["create_task_in_section_one_call"]["upstream_calls_per_op"] == 1.0
+    assert by_name["create_task_with_subtasks"]["upstream_calls_per_op"] == 4.0
+    assert by_name["create_task_with_dependencies"]["upstream_calls_per_op"] == 2.0
+    assert by_name["get_task_tree"]["upstream_calls_per_op"] == 5.0
+    assert by_name["search_tasks_local"]["upstream_calls"] == 0
+
+
+def test_injected_rate_limits_are_retried():
+    rows = run_suite(_options(iterations=6, error_rate_429=0.5, only=["get_task"]))
+    assert rows[0]["errors"] == 0
+    assert rows[0]["retries"] > 0
+    assert rows[0]["upstream_calls"] > 6
+
+
+def test_baseline_flags_extra_upstream_calls():
+    row = {"scenario": "get_task", "upstream_calls_per_op": 2.0, "errors": 0, "p99_ms": 1.0}
+    baseline = [{**row, "upstream_calls_per_op": 1.0}]
+    assert check_baseline([row], baseline, None) == ["get_task: upstream calls/op 2.0 > 1.0"]
+    assert check_baseline([{**row, "upstream_calls_per_op": 1.0}], baseline, None) == []
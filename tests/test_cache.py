@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+
+from src.cache import ResponseCache, cache_key, invalidation_prefixes
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_normalizes_opt_fields():
+    first = cache_key("/tasks/1", {"opt_fields": "name, notes,gid"})
+    second = cache_key("/tasks/1", {"opt_fields": "gid,name,notes"})
+    assert first == second
+
+
+def test_ttl_expiry_and_lru_eviction():
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, max_bytes=1_000, clock=clock)
+    for gid in ("1", "2", "3"):
+        cache.set(cache_key(f"/tasks/{gid}"), b'{"data": {}}')
+    assert cache.get(cache_key("/tasks/1")) is None
+    assert cache.get(cache_key("/tasks/3")) is not None
+    clock.now = 31.0
+    assert cache.get(cache_key("/tasks/3")) is None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+
+
+def test_write_invalidates_cached_task(make_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json={"data": {"gid": "1", "name": f"v{len(calls)}"}})
+
+    cache = ResponseCache()
+    client = make_client(handler, cache=cache)
+
+    async def scenario():
+        first = await client.request("GET", "/tasks/1", params={"opt_fields": "name"})
+        cached = await client.request("GET", "/tasks/1", params={"opt_fields": "name"})
+        await client.request("POST", "/sections/9/addTask", payload={"data": {"task": "1"}})
+        fresh = await client.request("GET", "/tasks/1", params={"opt_fields": "name"})
+        return first, cached, fresh
+
+    first, cached, fresh = asyncio.run(scenario())
+    assert first == cached
+    assert fresh["data"]["name"] == "v3"
+    assert [method for method, _ in calls] == ["GET", "POST", "GET"]
+
+
+def test_project_writes_invalidate_workspace_project_listings(make_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json={"data": [{"gid": "5", "name": f"v{len(calls)}"}]})
+
+    cache = ResponseCache()
+    client = make_client(handler, cache=cache)
+
+    async def scenario():
+        first = await client.request("GET", "/workspaces/1/projects", params={"opt_fields": "name"})
+        cached = await client.request("GET", "/workspaces/1/projects", params={"opt_fields": "name"})
+        await client.request("PUT", "/projects/5", payload={"data": {"name": "Renamed"}})
+        fresh = await client.request("GET", "/workspaces/1/projects", params={"opt_fields": "name"})
+        return first, cached, fresh
+
+    first, cached, fresh = asyncio.run(scenario())
+    assert first == cached
+    assert fresh["data"][0]["name"] == "v3"
+    assert [method for method, _ in calls] == ["GET", "PUT", "GET"]
+    assert cache.stats()["invalidations"] == 1
+
+    assert invalidation_prefixes("POST", "/workspaces/1/projects") == ["/workspaces/1/projects"]
+    assert invalidation_prefixes("POST", "/projects", {"data": {"workspace": "2"}}) == ["/workspaces/2/projects"]
+    assert invalidation_prefixes("POST", "/tasks", {"data": {"projects": ["5"]}}) == []
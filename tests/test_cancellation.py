@@ -0,0 +1,142 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import RequestParams
+
+from src import tool_impl, tools
+from src.deadline import deadline_scope, remaining
+from src.metrics import Metrics
+from src.singleflight import AsyncSingleFlight
+
+
+@pytest.fixture
+def tool_env(monkeypatch, make_client, make_settings, use_client):
+    """Run tools with default settings; the returned function installs a cache-free client over a handler."""
+    monkeypatch.setattr(tools, "get_settings", make_settings)
+
+    def install(handler, **overrides):
+        return use_client(make_client(handler, make_settings(asana_cache_enabled=False, **overrides)))
+
+    return install
+
+
+def _slow_handler(started, aborted):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.path)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            aborted.append(request.url.path)
+            raise
+        return httpx.Response(200, json={"data": {"gid": "1"}})
+
+    return handler
+
+
+def test_nested_deadline_scopes_only_shorten():
+    with deadline_scope(10):
+        with deadline_scope(60):
+            assert remaining() <= 10
+        with deadline_scope(None):
+            assert remaining() <= 10
+    assert remaining() is None
+
+
+def test_singleflight_cancels_upstream_when_last_waiter_leaves():
+    flights = AsyncSingleFlight()
+    started, aborted = [], []
+
+    async def work():
+        started.append(1)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            aborted.append(1)
+            raise
+        return "done"
+
+    async def scenario():
+        first = asyncio.ensure_future(flights.do("key", work))
+        second = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert aborted == []
+        second.cancel()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert started == [1]
+    assert aborted == [1]
+
+
+def test_cancelled_tool_aborts_http_and_records_outcome(monkeypatch, tool_env):
+    started, aborted = [], []
+    tool_env(_slow_handler(started, aborted))
+    metrics = Metrics()
+    monkeypatch.setattr(tools, "REGISTRY", metrics)
+
+    async def scenario():
+        call = asyncio.ensure_future(tools._run("asana_get_task", "get_task", {"task_gid": "1"}))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert len(started) == 1
+    assert len(aborted) == 1
+    assert metrics.snapshot()["tools"]["asana_get_task"]["outcomes"] == {"cancelled": 1}
+
+
+def test_client_supplied_timeout_returns_deadline_envelope(monkeypatch, tool_env):
+    started, aborted = [], []
+    tool_env(_slow_handler(started, aborted))
+    monkeypatch.setattr(tools, "REGISTRY", Metrics())
+    token = request_ctx.set(SimpleNamespace(meta=RequestParams.Meta(timeoutMs=50)))
+    try:
+        result = asyncio.run(tools._run("asana_get_task", "get_task", {"task_gid": "1"}))
+    finally:
+        request_ctx.reset(token)
+    assert result["error"]["code"] == "deadline_exceeded"
+    assert result["error"]["details"] == {"timeout_seconds": 0.05}
+    assert aborted
+
+
+def test_retries_stop_at_the_call_deadline(tool_env):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503, json={"errors": []})
+
+    tool_env(handler, asana_max_retries=5, asana_retry_base_delay_seconds=10)
+
+    async def scenario():
+        with deadline_scope(1):
+            return await tool_impl.get_task({"task_gid": "1"})
+
+    result = asyncio.run(scenario())
+    assert result["error"]["details"]["status_code"] == 503
+    assert len(calls) == 1
+
+
+def test_multi_step_tool_stops_when_deadline_is_spent(tool_env):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(201, json={"data": {"gid": "77"}})
+
+    tool_env(handler)
+
+    async def scenario():
+        with deadline_scope(0.02):
+            return await tool_impl.create_task_in_section({"name": "Report", "section_gid": "3"})
+
+    result = asyncio.run(scenario())
+    assert result["error"]["code"] == "deadline_exceeded"
+    assert [path.rsplit("/", 1)[-1] for path in calls] == ["tasks"]
@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from src import tool_impl, tools
+from src.cache import ResponseCache
+from src.client_pool import ClientPool, ClientPoolFull
+from src.config import Settings
+from src.credentials import TokenFile, credential_scope
+from src.rate_limit import RateLimiter
+
+
+def _settings(**overrides) -> Settings:
+    values = {"asana_access_token": "server-token", "asana_client_idle_seconds": 60, "asana_client_pool_max": 2}
+    values.update(overrides)
+    return Settings(**values)
+
+
+def _echo_token(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"data": {"token": request.headers["Authorization"].split()[-1]}})
+
+
+@pytest.fixture
+def make_pool(make_client):
+    def build(settings, clock, **kwargs) -> ClientPool:
+        def factory(resolved, limiter, cache):
+            return make_client(_echo_token, resolved, limiter=limiter, cache=cache)
+
+        return ClientPool(settings, factory=factory, clock=lambda: clock[0], **kwargs)
+
+    return build
+
+
+def test_each_credential_gets_its_own_client_and_budget(make_pool):
+    clock = [0.0]
+    limiter = RateLimiter(150, 60, max_concurrent=4)
+    pool = make_pool(_settings(), clock, default_limiter=limiter)
+    default = pool.get()
+    assert pool.get("server-token") is default
+    assert default.limiter is limiter
+    other = pool.get("user-token")
+    assert other is pool.get("user-token")
+    assert other.limiter is not limiter
+    assert asyncio.run(other.request("GET", "/users/me")) == {"data": {"token": "user-token"}}
+    assert [client["default"] for client in pool.stats()["clients"]] == [True, False]
+    assert "user-token" not in str(pool.stats())
+
+
+def test_cap_evicts_least_recently_used_idle_client(make_pool):
+    clock = [0.0]
+    pool = make_pool(_settings(), clock)
+    first = pool.get("a")
+    pool.get("b")
+    with pytest.raises(ClientPoolFull):
+        pool.get("c")
+    clock[0] = 5.0
+    pool.get("b")
+    pool.get("c")
+    clock[0] = 10.0
+    assert pool.get("a") is not first
+    assert pool.stats()["evicted"] == 2
+    assert len(pool.stats()["clients"]) == 2
+
+
+def test_idle_clients_are_swept(make_pool):
+    clock = [0.0]
+    pool = make_pool(_settings(asana_client_pool_max=8), clock)
+    pool.get("a")
+    clock[0] = 30.0
+    pool.get("b")
+    clock[0] = 70.0
+    assert pool.evict_idle() == 1
+    assert [client["idle_seconds"] for client in pool.stats()["clients"]] == [40.0]
+
+
+def test_token_file_is_hot_reloaded(tmp_path, make_pool):
+    token_path = tmp_path / "asana.token"
+    token_path.write_text("old-token\n")
+    clock = [0.0]
+    token_file = TokenFile(str(token_path), "env-token", interval=5, clock=lambda: clock[0])
+    cache = ResponseCache(max_entries=8, max_bytes=10_000)
+    cache.set(("/users/me", ()), b"{}")
+    pool = make_pool(_settings(), clock, token_file=token_file, default_cache=cache)
+    assert asyncio.run(pool.get().request("GET", "/workspaces")) == {"data": {"token": "env-token"}}
+
+    token_path.write_text("rotated-token\n")
+    clock[0] = 10.0
+    assert asyncio.run(pool.get().request("GET", "/workspaces")) == {"data": {"token": "rotated-token"}}
+    assert pool.stats()["token_reloads"] == 1
+    assert cache.stats()["entries"] == 0
+
+    token_path.write_text("")
+    clock[0] = 20.0
+    assert asyncio.run(pool.get().request("GET", "/workspaces")) == {"data": {"token": "rotated-token"}}
+
+
+def test_tool_call_uses_the_request_token(monkeypatch, make_pool, quiet_audit):
+    settings = _settings(asana_accept_client_tokens=True)
+    clock = [0.0]
+    pool = make_pool(settings, clock)
+    monkeypatch.setattr(tools, "get_settings", lambda: settings)
+    monkeypatch.setattr(tool_impl, "get_client_pool", lambda: pool)
+    monkeypatch.setattr(tool_impl, "_mirror", lambda: object())
+    request = SimpleNamespace(headers={"x-asana-token": "user-token"})
+    token = request_ctx.set(SimpleNamespace(meta=None, request=request))
+    try:
+        result = asyncio.run(tools._run("asana_get_current_user", "get_current_user", {}))
+    finally:
+        request_ctx.reset(token)
+    assert result["data"] == {"data": {"token": "user-token"}}
+    assert asyncio.run(tools._run("asana_get_current_user", "get_current_user", {}))["data"] == {
+        "data": {"token": "server-token"}
+    }
+    with credential_scope("user-token"):
+        assert tool_impl.get_mirror() is None
+    assert tool_impl.get_mirror() is not None
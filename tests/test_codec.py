@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from benchmarks.bench_codec import run, task_page
+from src import codec
+from src.env import health_problems, json_codec
+from src.records import ProjectRecord, TaskRecord, UserRecord, decode_page, encode_records, from_dicts
+
+SAMPLE = {"b": [1, 2.5, None, True], "a": {"name": "Café ✓", "gid": "12"}, "c": ""}
+
+
+def _installed():
+    return [name for name in codec.BACKENDS if codec.build_codec(name).name == name]
+
+
+@pytest.mark.parametrize("name", _installed())
+def test_backends_write_identical_bytes(name):
+    reference = codec.build_codec("stdlib")
+    backend = codec.build_codec(name)
+    assert backend.dumps(SAMPLE) == reference.dumps(SAMPLE)
+    assert backend.dumps(SAMPLE, sort_keys=True) == reference.dumps(SAMPLE, sort_keys=True)
+    assert backend.loads(backend.dumps(SAMPLE)) == SAMPLE
+    assert json.loads(backend.dumps_pretty(SAMPLE)) == SAMPLE
+    assert backend.dumps_pretty(SAMPLE).startswith('{\n  "a": {')
+
+
+@pytest.mark.parametrize("name", _installed())
+def test_values_the_fast_path_refuses_fall_back(name):
+    backend = codec.build_codec(name)
+    assert backend.loads(backend.dumps({"big": 2**70, 1: "x"})) == {"big": 2**70, "1": "x"}
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b"{not json")
+
+
+def test_backend_selection():
+    assert codec.build_codec("stdlib").name == "stdlib"
+    assert codec.build_codec("auto").name == _installed()[0]
+    assert json_codec({"ASANA_JSON_CODEC": "STDLIB"}) == "stdlib"
+    problems = health_problems({"ASANA_ACCESS_TOKEN": "t", "ASANA_JSON_CODEC": "yaml"})
+    assert any("ASANA_JSON_CODEC" in problem for problem in problems)
+
+
+def test_records_round_trip_and_share_references():
+    raw = task_page(20, "full")
+    records = decode_page(raw, TaskRecord)
+    assert [record.to_dict() for record in records] == json.loads(raw)["data"]
+    assert records[0].assignee is records[1].assignee
+    assert records[0].memberships[0]["project"] is records[1].projects[0]
+    assert json.loads(encode_records(records)) == json.loads(raw)
+
+    project, = from_dicts(ProjectRecord, [{"gid": "1", "name": "P", "custom": {"k": [1]}}])
+    assert not hasattr(project, "archived")
+    assert project.extra == {"custom": {"k": (1,)}}
+    assert project.to_dict() == {"gid": "1", "name": "P", "custom": {"k": [1]}}
+    assert UserRecord.from_dict({"gid": "9", "name": "U"}) == UserRecord.from_dict({"name": "U", "gid": "9"})
+
+
+def test_records_keep_explicit_nulls_and_reject_non_string_gids():
+    task = {"gid": "1", "assignee": {"gid": "2", "name": None}, "parent": None, "projects": [{"gid": "3"}]}
+    record, = from_dicts(TaskRecord, [task])
+    assert record.to_dict() == task
+    assert json.loads(encode_records([record])) == {"data": [task]}
+    with pytest.raises(TypeError, match="gid must be a string"):
+        from_dicts(TaskRecord, [{"gid": "1", "assignee": {"gid": 2}}])
+
+
+def test_benchmark_reports_codecs_and_record_memory():
+    rows = run(tasks=300, number=1)
+    assert [row["case"] for row in rows] == [f"codec:{name}" for name in _installed()] + ["records"]
+    assert rows[-1]["record_bytes"] < rows[-1]["dict_bytes"]
@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src import tool_impl
+from src.composite import Plan, run_plan
+
+
+@pytest.fixture
+def asana(make_client, make_settings, use_client):
+    sent = []
+    state = {"next_gid": 100, "fail": set()}
+
+    def respond(method, path, data):
+        if path in state["fail"]:
+            return 404, {"errors": [{"message": "Not a recognized ID"}]}
+        if method == "POST" and (path == "/tasks" or path.endswith("/subtasks")):
+            state["next_gid"] += 1
+            return 201, {"data": {"gid": str(state["next_gid"]), "name": data.get("name")}}
+        return 200, {"data": {}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/1.0")
+        body = json.loads(request.content)["data"] if request.content else None
+        sent.append((request.method, path, body))
+        if path == "/batch":
+            results = []
+            for action in body["actions"]:
+                status, payload = respond(action["method"].upper(), action["relative_path"], action.get("data") or {})
+                results.append({"status_code": status, "body": payload})
+            return httpx.Response(200, json={"data": results})
+        status, payload = respond(request.method, path, body or {})
+        return httpx.Response(status, json=payload)
+
+    use_client(make_client(handler, make_settings(asana_max_retries=0)))
+    return sent, state
+
+
+def test_plan_waves_and_skips_dependents_of_failures(asana):
+    sent, state = asana
+    state["fail"].add("/tasks/1/addFollowers")
+    plan = Plan()
+    plan.add("a", "POST", "/tasks/1/addFollowers", {})
+    plan.add("b", "POST", "/tasks/2/addFollowers", {})
+    plan.add("c", "POST", after=["a"], build=lambda done: ("/tasks/3/addFollowers", {}))
+    plan.add("d", "POST", after=["b"], build=lambda done: ("/tasks/4/addFollowers", {}))
+    assert [[step.name for step in wave] for wave in plan.waves()] == [["a", "b"], ["c", "d"]]
+    with pytest.raises(ValueError):
+        plan.add("e", "POST", after=["missing"])
+
+    outcome = asyncio.run(run_plan(tool_impl.get_async_client(), plan))
+    assert outcome.error("a").status_code == 404
+    assert outcome.results["c"] is None and outcome.ok("d")
+    assert outcome.upstream_calls == 2
+    assert [path for _, path, _ in sent] == ["/batch", "/tasks/4/addFollowers"]
+
+
+def test_create_task_in_section_uses_memberships_when_it_can(asana):
+    sent, _ = asana
+    result = asyncio.run(
+        tool_impl.create_task_in_section({"section_gid": "9", "name": "One call", "projects": ["5"]})
+    )
+    assert result["data"]["upstream_calls"] == 1
+    assert sent == [("POST", "/tasks", {"name": "One call", "memberships": [{"project": "5", "section": "9"}]})]
+
+    sent.clear()
+    placed = {"section_gid": "9", "name": "Placed", "projects": ["5"], "insert_before": "7"}
+    result = asyncio.run(tool_impl.create_task_in_section(placed))
+    assert result["data"]["upstream_calls"] == 2
+    gid = result["data"]["task"]["data"]["gid"]
+    assert sent[1] == ("POST", "/sections/9/addTask", {"task": gid, "insert_before": "7"})
+
+
+def test_subtasks_share_batches(asana):
+    sent, state = asana
+    state["fail"].add("/tasks/101/subtasks")
+    result = asyncio.run(
+        tool_impl.create_task_with_subtasks({"name": "Parent", "subtasks": [{"name": f"s{n}"} for n in range(12)]})
+    )
+    assert result["status"] == "ok"
+    assert result["data"]["upstream_calls"] == 3
+    assert result["data"]["failed"] == 12
+    assert [path for _, path, _ in sent] == ["/tasks", "/batch", "/batch"]
+
+    sent.clear()
+    state["fail"].clear()
+    result = asyncio.run(tool_impl.create_task_with_subtasks({"name": "Parent", "subtasks": [{"name": "only"}]}))
+    assert result["data"]["succeeded"] == 1
+    assert sent[1][1] == "/tasks/102/subtasks"
+
+
+def test_dependencies_and_dependents_go_in_one_batch(asana):
+    sent, _ = asana
+    payload = {"name": "Blocked", "dependencies": ["1", "2"], "dependents": ["3"]}
+    result = asyncio.run(tool_impl.create_task_with_dependencies(payload))
+    assert result["data"]["upstream_calls"] == 2
+    assert result["data"]["dependencies"]["status"] == result["data"]["dependents"]["status"] == "ok"
+    actions = sent[1][2]["actions"]
+    assert [(action["relative_path"], action["data"]) for action in actions] == [
+        ("/tasks/101/addDependencies", {"dependencies": ["1", "2"]}),
+        ("/tasks/101/addDependents", {"dependents": ["3"]}),
+    ]
+    only_task = asyncio.run(tool_impl.create_task_with_dependencies({"name": "Free"}))
+    assert only_task["data"]["dependencies"] is None and only_task["data"]["upstream_calls"] == 1
+
+
+def test_ordered_move_chains_and_stops_on_failure(asana):
+    sent, state = asana
+    payload = {"section_gid": "9", "task_gids": ["1", "2", "3"], "insert_after": "0"}
+    result = asyncio.run(tool_impl.move_tasks_to_section_in_order(payload))
+    assert [body for _, _, body in sent] == [
+        {"task": "1", "insert_after": "0"},
+        {"task": "2", "insert_after": "1"},
+        {"task": "3", "insert_after": "2"},
+    ]
+    assert result["data"]["upstream_calls"] == 3
+
+    state["fail"].add("/sections/8/addTask")
+    result = asyncio.run(tool_impl.move_tasks_to_section_in_order({"section_gid": "8", "task_gids": ["1", "2"]}))
+    assert [envelope["status"] for envelope in result["data"]["results"]] == ["error", "error"]
+    assert result["data"]["results"][1]["error"]["code"] == "skipped"
+    assert result["data"]["upstream_calls"] == 1
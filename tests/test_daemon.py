@@ -0,0 +1,182 @@
+import asyncio
+import os
+import stat
+
+import httpx
+import pytest
+
+from src import config, daemon, tool_impl, tools
+from src.client_pool import ClientPool
+from src.config import Settings
+from src.metrics import REGISTRY
+
+
+@pytest.fixture
+def warm_daemon(monkeypatch, tmp_path, make_client, quiet_audit):
+    settings = Settings(asana_access_token="server-token", asana_cache_enabled=False)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"data": {"gid": request.url.path.rsplit("/", 1)[-1]}})
+
+    pool = ClientPool(
+        settings, factory=lambda resolved, limiter, cache: make_client(handler, resolved, limiter=limiter, cache=cache)
+    )
+    monkeypatch.setattr(config, "get_settings", lambda: settings)
+    monkeypatch.setattr(tools, "get_settings", lambda: settings)
+    monkeypatch.setattr(tool_impl, "get_client_pool", lambda: pool)
+    path = str(tmp_path / "d.sock")
+    environ = {"ASANA_ACCESS_TOKEN": "server-token", "ASANA_DAEMON_SOCKET": path}
+    return path, environ, calls
+
+
+async def _with_daemon(path, body):
+    server = daemon.Daemon(path)
+    await server.start()
+    serving = asyncio.create_task(server.serve())
+    try:
+        return server, await asyncio.to_thread(body)
+    finally:
+        server.stop()
+        await serving
+
+
+def test_scripts_forward_to_the_warm_daemon(warm_daemon):
+    path, environ, calls = warm_daemon
+
+    def body():
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        first = daemon.forward("get_task", {"task_gid": "11"}, environ)
+        second = daemon.forward("get_task", {"task_gid": "12"}, environ)
+        with pytest.raises(daemon.DaemonError, match="ValidationError"):
+            daemon.forward("get_task", {}, environ)
+        return first, second
+
+    server, (first, second) = asyncio.run(_with_daemon(path, body))
+    assert first["data"] == {"data": {"gid": "11"}}
+    assert second["data"] == {"data": {"gid": "12"}}
+    assert [call.rsplit("/", 1)[-1] for call in calls] == ["11", "12"]
+    assert server.requests == 3
+    assert not os.path.exists(path)
+
+
+def test_other_identities_and_tools_fall_back_in_process(warm_daemon):
+    path, environ, calls = warm_daemon
+
+    def body():
+        other_user = daemon.forward("get_task", {"task_gid": "1"}, {**environ, "ASANA_ACCESS_TOKEN": "someone-else"})
+        other_api = daemon.forward("get_task", {"task_gid": "1"}, {**environ, "ASANA_API_BASE": "http://localhost"})
+        return other_user, other_api, daemon.forward("get_rate_limiter", {}, environ)
+
+    _, results = asyncio.run(_with_daemon(path, body))
+    assert results == (None, None, None)
+    assert calls == []
+
+
+def test_missing_daemon_falls_back_and_can_autostart(warm_daemon, monkeypatch):
+    path, environ, _ = warm_daemon
+    spawned = []
+    monkeypatch.setattr(daemon, "spawn", lambda: spawned.append(True))
+    assert daemon.forward("get_task", {"task_gid": "1"}, environ) is None
+    assert spawned == []
+    assert daemon.forward("get_task", {"task_gid": "1"}, {**environ, "ASANA_DAEMON_AUTOSTART": "true"}) is None
+    assert spawned == [True]
+
+
+def test_file_writing_tools_need_the_same_resolved_paths(warm_daemon, monkeypatch, tmp_path):
+    path, environ, _ = warm_daemon
+    settings = Settings(asana_access_token="server-token", asana_export_dir=str(tmp_path / "exports"))
+    monkeypatch.setattr(config, "get_settings", lambda: settings)
+    monkeypatch.setattr(tools, "get_settings", lambda: settings)
+
+    async def export_project(payload):
+        return {"status": "ok", "data": payload}
+
+    monkeypatch.setattr(tool_impl, "export_project", export_project)
+    monkeypatch.chdir(tmp_path)
+
+    def body():
+        # Relative directories (including the default "exports") resolve against the caller's cwd.
+        same = daemon.forward("export_project", {"path": "a.ndjson"}, {**environ, "ASANA_EXPORT_DIR": "exports"})
+        other = daemon.forward("export_project", {"path": "a.ndjson"}, {**environ, "ASANA_EXPORT_DIR": "elsewhere"})
+        default = daemon.forward("export_project", {"path": "a.ndjson"}, environ)
+        return same, other, default
+
+    server, (same, other, default) = asyncio.run(_with_daemon(path, body))
+    assert same == {"status": "ok", "data": {"path": "a.ndjson"}}
+    assert default == same
+    assert other is None
+    assert server.requests == 3
+
+
+def test_second_daemon_refuses_a_live_socket_and_idle_daemon_exits(warm_daemon):
+    path, _, _ = warm_daemon
+
+    async def scenario():
+        first = daemon.Daemon(path)
+        await first.start()
+        with pytest.raises(OSError):
+            await daemon.Daemon(path).start()
+        await first.aclose()
+
+        clock = [0.0]
+        idle = daemon.Daemon(path, idle_seconds=0.01, clock=lambda: clock[0])
+        await idle.start()
+        clock[0] = 1.0
+        await asyncio.wait_for(idle.serve(), 1)
+        return os.path.exists(path)
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_daemon_calls_go_through_the_tool_runner(warm_daemon, monkeypatch):
+    path, environ, _ = warm_daemon
+    settings = Settings(asana_access_token="server-token", asana_cache_enabled=False, asana_tool_timeout_seconds=0.05)
+    monkeypatch.setattr(tools, "get_settings", lambda: settings)
+
+    async def stuck(payload):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(tool_impl, "get_current_user", stuck)
+    REGISTRY.reset()
+
+    def body():
+        return daemon.forward("get_task", {"task_gid": "5"}, environ), daemon.forward("get_current_user", {}, environ)
+
+    _, (task, user) = asyncio.run(_with_daemon(path, body))
+    assert task["status"] == "ok"
+    assert user["error"]["code"] == "deadline_exceeded"
+    outcomes = REGISTRY.snapshot()["tools"]
+    assert outcomes["asana_get_task"]["outcomes"] == {"ok": 1}
+    assert outcomes["asana_get_current_user"]["outcomes"] == {"deadline_exceeded": 1}
+
+
+def test_forward_gives_up_on_a_silent_daemon(tmp_path, monkeypatch):
+    path = str(tmp_path / "silent.sock")
+    monkeypatch.setattr(daemon, "REPLY_GRACE_SECONDS", 0.0)
+    environ = {"ASANA_ACCESS_TOKEN": "token", "ASANA_DAEMON_SOCKET": path, "ASANA_TOOL_TIMEOUT_SECONDS": "0.1"}
+
+    async def scenario():
+        async def never_reply(reader, writer):
+            await reader.readline()
+            await asyncio.sleep(1)
+            writer.close()
+
+        server = await asyncio.start_unix_server(never_reply, path=path)
+        try:
+            return await asyncio.to_thread(daemon.forward, "create_task", {"name": "x"}, environ)
+        finally:
+            server.close()
+
+    with pytest.raises(daemon.DaemonError, match="No reply"):
+        asyncio.run(scenario())
+
+
+def test_spawn_runs_from_the_project_root(monkeypatch):
+    launched = []
+    monkeypatch.setattr(daemon.subprocess, "Popen", lambda args, **kwargs: launched.append((args, kwargs)))
+    daemon.spawn()
+    (args, kwargs), = launched
+    assert args[1:] == ["-m", "scripts.run_server", "--daemon"]
+    assert os.path.isfile(os.path.join(kwargs["cwd"], "scripts", "run_server.py"))
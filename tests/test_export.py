@@ -0,0 +1,89 @@
+import asyncio
+import gzip
+import json
+import threading
+
+import pytest
+
+from benchmarks.fake_asana import PROJECT_GID
+from src import tool_impl
+from src.export import ProjectExport
+
+
+@pytest.fixture
+def fake(fake_asana, monkeypatch, tmp_path):
+    monkeypatch.setattr(tool_impl, "get_export_dir", lambda: tmp_path)
+    return fake_asana(tasks=250, sections=2, projects=1)
+
+
+def _records(path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_exports_every_section_as_gzip_ndjson(fake, tmp_path):
+    result = asyncio.run(tool_impl.export_project({"project_gid": PROJECT_GID, "path": "out/tasks.ndjson.gz"}))
+    assert result["status"] == "ok"
+    summary = result["data"]
+    assert (summary["records"], summary["sections"], summary["gzip"], summary["resumed"]) == (250, 2, True, False)
+    # One sections listing plus two pages for each 125-task section.
+    assert summary["upstream_calls"] == 5
+    records = _records(tmp_path / "out" / "tasks.ndjson.gz")
+    assert len({record["gid"] for record in records}) == 250
+    assert {record["section"]["name"] for record in records} == {"Section 0", "Section 1"}
+    assert not (tmp_path / "out" / "tasks.ndjson.gz.checkpoint").exists()
+
+
+def test_writes_pages_off_the_event_loop(fake, monkeypatch):
+    append = ProjectExport._append
+    threads = []
+
+    def recording(self, chunk, snapshot):
+        threads.append(threading.current_thread())
+        append(self, chunk, snapshot)
+
+    monkeypatch.setattr(ProjectExport, "_append", recording)
+    result = asyncio.run(tool_impl.export_project({"project_gid": PROJECT_GID, "path": "tasks.ndjson"}))
+    assert result["data"]["records"] == 250
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+def test_resumes_from_checkpoint_without_duplicates(fake, tmp_path, monkeypatch):
+    dispatch = fake.dispatch
+    broken = {"on": True}
+
+    def flaky(method, path, params, body):
+        if broken["on"] and path == "/sections/3001/tasks" and params.get("offset"):
+            return 500, {"errors": [{"message": "boom"}]}
+        return dispatch(method, path, params, body)
+
+    monkeypatch.setattr(fake, "dispatch", flaky)
+    payload = {"project_gid": PROJECT_GID, "path": "tasks.ndjson", "concurrency": 1}
+    failed = asyncio.run(tool_impl.export_project(payload))
+    assert failed["status"] == "error"
+    checkpoint = tmp_path / "tasks.ndjson.checkpoint"
+    assert json.loads(checkpoint.read_text())["records"] == 225
+
+    # Bytes written after the last checkpoint are dropped on resume.
+    with open(tmp_path / "tasks.ndjson", "a", encoding="utf-8") as handle:
+        handle.write('{"gid": "partial"')
+    broken["on"] = False
+    resumed = asyncio.run(tool_impl.export_project(payload))["data"]
+    assert resumed["resumed"] is True and resumed["records"] == 250
+    assert resumed["upstream_calls"] == 1
+    gids = [record["gid"] for record in _records(tmp_path / "tasks.ndjson")]
+    assert len(gids) == len(set(gids)) == 250
+
+
+def test_rejects_escaping_paths_and_foreign_checkpoints(fake, tmp_path):
+    escaped = asyncio.run(tool_impl.export_project({"project_gid": PROJECT_GID, "path": "../elsewhere.ndjson"}))
+    assert escaped["error"]["code"] == "invalid_path"
+
+    (tmp_path / "tasks.ndjson").write_text("")
+    checkpoint = {"version": 1, "export": {"project_gid": "other"}, "bytes": 0}
+    (tmp_path / "tasks.ndjson.checkpoint").write_text(json.dumps(checkpoint))
+    payload = {"project_gid": PROJECT_GID, "path": "tasks.ndjson"}
+    assert asyncio.run(tool_impl.export_project(payload))["error"]["code"] == "checkpoint_mismatch"
+    assert asyncio.run(tool_impl.export_project({**payload, "resume": False}))["data"]["records"] == 250
@@ -0,0 +1,96 @@
+import functools
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from src import http_app
+from src.config import Settings
+
+BASE_URL = "http://127.0.0.1:8000"
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "0"}},
+}
+
+
+@pytest.fixture
+def http_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("ASANA_ACCESS_TOKEN", "token")
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "asana-mcp.log"))
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    return monkeypatch
+
+
+@pytest.fixture
+def quiet_settings(make_settings):
+    return functools.partial(make_settings, log_level="WARNING")
+
+
+def test_healthz_reuses_health_check(http_env, quiet_settings):
+    with TestClient(http_app.create_http_app(quiet_settings()), base_url=BASE_URL) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        http_env.setenv("ASANA_HTTP2", "maybe")
+        response = client.get("/healthz")
+        http_env.delenv("ASANA_HTTP2")
+        http_env.setenv("ASANA_MAX_CONCURRENT_REQUESTS", "0")
+        out_of_range = client.get("/healthz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "error", "problems": ["ASANA_HTTP2 must be a boolean."]}
+    # Parses, but Settings rejects it, as server startup would.
+    assert out_of_range.status_code == 503
+    assert out_of_range.json()["problems"] == [
+        "ASANA_MAX_CONCURRENT_REQUESTS: Input should be greater than or equal to 1"
+    ]
+
+
+def test_streamable_http_session_calls_a_tool(http_env, quiet_settings, make_client, use_client):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": {"gid": "7", "name": "Me"}}))
+    use_client(make_client(transport, quiet_settings(asana_cache_enabled=False)))
+
+    app = http_app.create_http_app(quiet_settings(), stateless=True)
+    with TestClient(app, base_url=BASE_URL) as client:
+        initialized = client.post("/mcp", json=INITIALIZE, headers=MCP_HEADERS)
+        assert initialized.status_code == 200
+        call = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": "asana_get_current_user", "arguments": {"payload": {}}},
+        }
+        response = client.post("/mcp", json=call, headers=MCP_HEADERS)
+    assert response.status_code == 200
+    assert '\\"gid\\": \\"7\\"' in response.text
+
+
+def test_bearer_token_guards_everything_but_healthz(http_env, quiet_settings):
+    app = http_app.create_http_app(quiet_settings(asana_http_auth_token="s3cret"), stateless=True)
+    with TestClient(app, base_url=BASE_URL) as client:
+        assert client.get("/healthz").status_code == 200
+        assert client.post("/mcp", json=INITIALIZE, headers=MCP_HEADERS).status_code == 401
+        authorized = {**MCP_HEADERS, "Authorization": "Bearer s3cret"}
+        assert client.post("/mcp", json=INITIALIZE, headers=authorized).status_code == 200
+
+
+def test_multiple_workers_use_the_app_factory(http_env, quiet_settings):
+    created = {}
+    for name in ("ASANA_HTTP_HOST", "ASANA_HTTP_PORT", "ASANA_HTTP_WORKERS"):
+        http_env.delenv(name, raising=False)
+
+    def fake_run(app, **options):
+        created["app"], created["options"] = app, options
+
+    http_env.setattr(http_app.uvicorn, "run", fake_run)
+    http_env.setattr(http_app.signal, "signal", lambda *args: None)
+    http_app.run_http("0.0.0.0", 9000, 3, quiet_settings())
+    assert created["app"] == "src.http_app:create_http_app"
+    assert created["options"]["workers"] == 3
+    assert created["options"]["timeout_graceful_shutdown"] == 10.0
+    assert Settings.from_env().asana_http_workers == 3
+
+    http_app.run_http("127.0.0.1", 9001, 1, quiet_settings())
+    assert callable(created["app"])
+    assert created["options"]["port"] == 9001
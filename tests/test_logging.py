@@ -0,0 +1,40 @@
+import json
+import logging
+import queue
+
+from src.logging_utils import BoundedQueueHandler, audit
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("asana_mcp", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_drop_oldest_keeps_newest_records():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop_oldest")
+    for index in range(4):
+        handler.handle(_record(f"m{index}"))
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ["m2", "m3"]
+    assert handler.dropped == 2
+
+
+def test_sample_admits_every_nth_overflow_record():
+    log_queue = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue, overflow="sample", sample_every=3)
+    for index in range(7):
+        handler.handle(_record(f"m{index}"))
+    assert log_queue.get_nowait().msg == "m6"
+    assert handler.dropped == 6
+
+
+def test_audit_defers_redaction_and_serialization():
+    log_queue = queue.Queue()
+    logger = logging.getLogger("asana_mcp.test_audit")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(BoundedQueueHandler(log_queue))
+    payload = {"task_gid": "1", "notes": "private"}
+    audit(logger, "asana.update_task", payload)
+    payload.pop("task_gid")
+    message = json.loads(log_queue.get_nowait().getMessage())
+    assert message == {"event": "asana.update_task", "payload": {"notes": "[REDACTED]", "task_gid": "1"}}
@@ -0,0 +1,89 @@
+import asyncio
+
+import httpx
+
+from src import tool_impl, tools
+from src.metrics import Histogram, Metrics, endpoint_family
+from src.rate_limit import RateLimiter
+
+
+def test_endpoint_family_collapses_gids():
+    assert endpoint_family("/tasks/1203/subtasks") == "/tasks/{gid}/subtasks"
+    assert endpoint_family("/workspaces/42/tasks/search") == "/workspaces/{gid}/tasks/search"
+    assert endpoint_family("/users/me") == "/users/me"
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram((0.1, 1.0, 10.0))
+    for value in [0.05] * 90 + [0.5] * 9 + [4.0]:
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == 1.0
+    assert histogram.quantile(1.0) == 4.0
+    assert histogram.cumulative()[-1] == ("+Inf", 100)
+
+
+def test_client_records_latency_retries_sleep_and_tool_calls(monkeypatch, make_client, make_settings):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"}, json={"errors": []})
+        return httpx.Response(200, json={"data": {"gid": "7"}})
+
+    clock = [0.0]
+
+    async def fake_sleep(delay):
+        clock[0] += delay
+
+    monkeypatch.setattr("src.asana_client.asyncio.sleep", fake_sleep)
+    metrics = Metrics()
+    client = make_client(
+        handler,
+        make_settings(asana_max_retries=2, asana_cache_enabled=False),
+        limiter=RateLimiter(600, 60, max_concurrent=2, clock=lambda: clock[0]),
+        metrics=metrics,
+    )
+
+    async def run():
+        with metrics.track_tool("asana_get_task") as call:
+            await client.request("GET", "/tasks/7")
+            call.outcome = "ok"
+
+    asyncio.run(run())
+    snapshot = metrics.snapshot()
+    assert snapshot["tools"]["asana_get_task"]["upstream_calls"] == 2
+    assert snapshot["tools"]["asana_get_task"]["outcomes"] == {"ok": 1}
+    assert snapshot["endpoints"]["GET /tasks/{gid}"]["count"] == 2
+    assert snapshot["responses"]["/tasks/{gid}"] == {"429": 1, "200": 1}
+    assert snapshot["retries"]["/tasks/{gid}"] == {"rate_limited": 1}
+    assert snapshot["sleep_seconds"]["backoff"] == 2.0
+    assert snapshot["in_flight"] == {"tools": {}, "requests": {}}
+
+
+def test_prometheus_text_format(tmp_path):
+    metrics = Metrics(buckets=(0.1, 1.0))
+    with metrics.track_request("GET", "/tasks/1") as call:
+        call.status = 200
+    metrics.record_error("/tasks/1", "http_404")
+    text = metrics.to_prometheus()
+    assert "# TYPE asana_mcp_upstream_request_duration_seconds histogram" in text
+    assert 'asana_mcp_upstream_request_duration_seconds_bucket{method="GET",endpoint="/tasks/{gid}",le="+Inf"} 1' in text
+    assert 'asana_mcp_upstream_errors_total{endpoint="/tasks/{gid}",kind="http_404"} 1' in text
+    path = tmp_path / "metrics" / "asana.prom"
+    metrics.write_prometheus(str(path))
+    assert path.read_text() == text
+
+
+def test_registered_tool_reports_outcome(monkeypatch, make_settings):
+    metrics = Metrics()
+    monkeypatch.setattr(tools, "REGISTRY", metrics)
+    monkeypatch.setattr(tools, "get_settings", make_settings)
+
+    async def failing(payload):
+        return tool_impl.err("asana_error", "boom")
+
+    monkeypatch.setattr(tool_impl, "get_task", failing)
+    asyncio.run(tools._run("asana_get_task", "get_task", {}))
+    assert metrics.snapshot()["tools"]["asana_get_task"]["outcomes"] == {"error": 1}
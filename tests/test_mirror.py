@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import httpx
+
+from src import tool_impl
+from src.mirror import TaskMirror, sync_project
+
+
+def _task(gid: str, name: str, notes: str = "") -> dict:
+    return {
+        "gid": gid,
+        "name": name,
+        "notes": notes,
+        "completed": False,
+        "modified_at": f"2024-01-0{gid}T00:00:00Z",
+        "memberships": [{"project": {"gid": "P"}}],
+    }
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path.removeprefix("/api/1.0")
+    sync = request.url.params.get("sync")
+    if path == "/events" and sync is None:
+        return httpx.Response(412, json={"errors": [{"message": "sync"}], "sync": "s1"})
+    if path == "/events":
+        events = [
+            {"action": "deleted", "resource": {"gid": "1", "resource_type": "task"}},
+            {"action": "changed", "resource": {"gid": "2", "resource_type": "task"}},
+        ]
+        return httpx.Response(200, json={"data": events, "sync": "s2", "has_more": False})
+    if path == "/projects/P/tasks":
+        data = [_task("1", "Write launch plan"), _task("2", "Review budget", "quarterly numbers")]
+        return httpx.Response(200, json={"data": data, "next_page": None})
+    if path == "/tasks/2":
+        return httpx.Response(200, json={"data": _task("2", "Review launch budget")})
+    return httpx.Response(404, json={"errors": []})
+
+
+def test_full_then_incremental_sync(tmp_path, make_client):
+    client = make_client(_handler)
+    mirror = TaskMirror(str(tmp_path / "mirror.db"))
+
+    first = asyncio.run(sync_project(client, mirror, "P", "W"))
+    assert first["mode"] == "full"
+    assert [task["gid"] for task in mirror.search(["P"], text="launch")] == ["1"]
+    assert [task["gid"] for task in mirror.search(["P"], text="quarter")] == ["2"]
+
+    second = asyncio.run(sync_project(client, mirror, "P", "W"))
+    assert second["mode"] == "incremental"
+    assert mirror.get_state("P")["sync_token"] == "s2"
+    assert [task["gid"] for task in mirror.search(["P"], text="launch")] == ["2"]
+
+
+def test_sync_writes_run_off_the_event_loop(tmp_path, monkeypatch, make_client):
+    client = make_client(_handler)
+    mirror = TaskMirror(str(tmp_path / "mirror.db"))
+    threads = []
+    for name in ("upsert_tasks", "prune_project", "set_state"):
+        method = getattr(mirror, name)
+
+        def recording(*args, method=method):
+            threads.append(threading.current_thread())
+            return method(*args)
+
+        monkeypatch.setattr(mirror, name, recording)
+
+    asyncio.run(sync_project(client, mirror, "P", "W"))
+    asyncio.run(sync_project(client, mirror, "P", "W"))
+    assert len(threads) == 6
+    assert threading.main_thread() not in threads
+
+
+def test_local_search_falls_back_when_mirror_missing(monkeypatch, make_client, use_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": [{"gid": "9"}]})
+
+    use_client(make_client(handler))
+    monkeypatch.setattr(tool_impl, "get_mirror", lambda: None)
+    result = asyncio.run(tool_impl.search_tasks({"workspace_gid": "1", "text": "x", "source": "local"}))
+    assert result["data"]["source"] == "live"
+    assert result["data"]["fallback_reason"] == "mirror_not_configured"
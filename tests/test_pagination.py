@@ -0,0 +1,74 @@
+import asyncio
+
+import httpx
+
+from src import tool_impl
+from src.asana_client import AsanaClient
+
+
+def _projects_handler(total: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("offset", "0"))
+        limit = int(request.url.params["limit"])
+        end = min(total, start + limit)
+        data = [{"gid": str(i)} for i in range(start, end)]
+        next_page = {"offset": str(end)} if end < total else None
+        return httpx.Response(200, json={"data": data, "next_page": next_page})
+
+    return handler
+
+
+def test_sync_paginate_follows_offsets(make_settings):
+    client = AsanaClient(make_settings(), transport=httpx.MockTransport(_projects_handler(250)))
+    gids = [item["gid"] for item in client.paginate("/workspaces/1/projects", page_size=100)]
+    assert gids == [str(i) for i in range(250)]
+
+
+def test_list_projects_stops_at_max_items(make_client, use_client):
+    use_client(make_client(_projects_handler(500)))
+    result = asyncio.run(
+        tool_impl.list_projects({"workspace_gid": "1", "max_items": 150, "page_size": 100})
+    )
+    assert len(result["data"]["data"]) == 150
+    assert result["data"]["next_page"] == {"offset": "150"}
+
+
+def test_search_pages_with_created_at_cursor(make_client, use_client):
+    cursors = []
+    tasks = [{"gid": str(i), "created_at": f"2024-01-01T00:00:{59 - i:02d}Z"} for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        before = request.url.params.get("created_at.before")
+        cursors.append(before)
+        limit = int(request.url.params["limit"])
+        remaining = [t for t in tasks if before is None or t["created_at"] < before]
+        return httpx.Response(200, json={"data": remaining[:limit]})
+
+    use_client(make_client(handler))
+    result = asyncio.run(
+        tool_impl.search_tasks({"workspace_gid": "1", "max_items": 10, "page_size": 2})
+    )
+    assert [t["gid"] for t in result["data"]["data"]] == ["0", "1", "2", "3", "4"]
+    assert cursors == [None, tasks[1]["created_at"], tasks[3]["created_at"]]
+    assert result["data"]["next_page"] is None
+
+
+def test_search_without_a_cursor_flags_truncation(make_client, use_client):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json={"data": [{"gid": str(i)} for i in range(limit)]})
+
+    use_client(make_client(handler))
+    payload = {"workspace_gid": "1", "sort_by": "modified_at", "page_size": 100}
+    result = asyncio.run(tool_impl.search_tasks({**payload, "max_items": 250}))
+    assert len(requests) == 1 and "created_at.before" not in requests[0]
+    assert len(result["data"]["data"]) == 100
+    assert result["data"]["next_page"] is None
+    assert result["data"]["truncated"] is True
+    # Asking for no more than one page holds is not a truncation.
+    result = asyncio.run(tool_impl.search_tasks({**payload, "max_items": 40}))
+    assert len(result["data"]["data"]) == 40
+    assert result["data"]["truncated"] is False
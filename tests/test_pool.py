@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from src import asana_client
+from src.env import health_problems
+
+
+@pytest.fixture
+def client_for(make_client, make_settings):
+    """Build a cache-free client over a handler with the given settings overrides."""
+
+    def build(handler, **overrides):
+        return make_client(handler, make_settings(asana_cache_enabled=False, **overrides))
+
+    return build
+
+
+def test_timeouts_fall_back_to_overall_timeout(client_for):
+    client = client_for(
+        lambda request: httpx.Response(200, json={}), asana_timeout_seconds=12, asana_connect_timeout_seconds=2
+    )
+    assert client.timeout.connect == 2
+    assert client.timeout.read == 12
+    assert client.timeout.pool == 12
+
+
+def test_pool_stats_track_peak_and_saturation(client_for):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {"gid": request.url.path.rsplit("/", 1)[-1]}})
+
+    client = client_for(handler, asana_max_connections=1, asana_max_keepalive_connections=1)
+
+    async def run():
+        await asyncio.gather(*(client.request("GET", f"/tasks/{gid}") for gid in range(3)))
+
+    asyncio.run(run())
+    stats = client.pool_stats()
+    assert stats["max_connections"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 3
+    assert stats["saturated_requests"] == 2
+
+
+def test_prewarm_sends_minimal_requests(client_for):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.path.rsplit("/", 2)[-2:], request.url.params.get("opt_fields")))
+        return httpx.Response(200, json={"data": {"gid": "1"}})
+
+    client = client_for(handler, asana_max_connections=2)
+    assert asyncio.run(client.prewarm(5)) == 2
+    assert calls == [(["users", "me"], "gid")] * 2
+
+
+def test_http2_falls_back_without_h2(monkeypatch, caplog, client_for):
+    monkeypatch.setattr(asana_client, "http2_available", lambda: False)
+    with caplog.at_level(logging.WARNING, logger="asana_mcp"):
+        client = client_for(lambda request: httpx.Response(200, json={}), asana_http2=True)
+    assert client.http2 is False
+    assert client.pool_stats()["http2"] is False
+    assert "using HTTP/1.1" in caplog.text
+
+
+def test_health_check_rejects_bad_pool_settings():
+    problems = health_problems({"ASANA_ACCESS_TOKEN": "token", "ASANA_HTTP2": "maybe"})
+    assert problems == ["ASANA_HTTP2 must be a boolean."]
+    assert health_problems({"ASANA_ACCESS_TOKEN": "token", "ASANA_MAX_CONNECTIONS": "many"})
@@ -0,0 +1,39 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src import tool_impl
+
+
+@pytest.fixture
+def run_get_task(make_client, make_settings, use_client):
+    """Call get_task against a stub task; returns the result and the opt_fields each request sent."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params.get("opt_fields"))
+        task = {"gid": "1", "name": "Task", "notes": "", "assignee": None, "tags": [], "completed": False}
+        return httpx.Response(200, json={"data": task})
+
+    use_client(make_client(handler, make_settings(asana_cache_enabled=False)))
+
+    def run(payload):
+        return asyncio.run(tool_impl.get_task(payload)), seen
+
+    return run
+
+
+def test_default_projection_applied(run_get_task):
+    _, seen = run_get_task({"task_gid": "1"})
+    assert seen == [tool_impl.FIELD_PRESETS["task"]["standard"]]
+
+
+def test_explicit_opt_fields_win_over_preset(run_get_task):
+    _, seen = run_get_task({"task_gid": "1", "opt_fields": "name", "fields": "full"})
+    assert seen == ["name"]
+
+
+def test_compact_strips_empty_fields_and_data_wrapper(run_get_task):
+    result, _ = run_get_task({"task_gid": "1", "fields": "minimal", "compact": True})
+    assert result == {"status": "ok", "data": {"gid": "1", "name": "Task", "completed": False}}
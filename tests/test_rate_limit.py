@@ -0,0 +1,89 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.asana_client import DeadlineExceededError
+from src.deadline import deadline_scope
+from src.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_shapes_requests_after_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(60, burst=2, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 1.0
+    assert bucket.reserve() == 2.0
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_search_uses_separate_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(600, 6, max_concurrent=4, clock=clock)
+    assert limiter.reserve("/workspaces/1/tasks/search") == 0.0
+    assert limiter.reserve("/workspaces/1/tasks/search") > 0.0
+    assert limiter.reserve("/tasks/1") == 0.0
+
+
+def test_retry_after_pauses_and_slows_limiter():
+    clock = FakeClock()
+    limiter = RateLimiter(600, 60, max_concurrent=4, clock=clock)
+    limiter.on_rate_limited("/tasks/1", 5.0)
+    assert limiter.reserve("/tasks/2") == 5.0
+    assert limiter._general.rate < limiter._general.max_rate
+    clock.now = 5.0
+    assert limiter.reserve("/tasks/2") == 0.0
+
+
+def test_request_rejected_by_its_deadline_refunds_tokens(make_client, make_settings):
+    clock = FakeClock()
+    limiter = RateLimiter(60, 60, max_concurrent=2, clock=clock)
+    client = make_client(
+        lambda request: httpx.Response(200, json={"data": {}}),
+        make_settings(asana_cache_enabled=False),
+        limiter=limiter,
+    )
+    for _ in range(10):
+        limiter.reserve("/tasks/1")
+    assert limiter.reserve("/tasks/1") == 1.0
+
+    async def scenario():
+        with deadline_scope(0.5):
+            await client.request("GET", "/tasks/1")
+
+    for _ in range(3):
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(scenario())
+    # The three rejected calls left the bucket where it was.
+    assert limiter.reserve("/tasks/1") == 2.0
+
+
+def test_async_clients_sharing_a_limiter_share_one_cap(make_client, make_settings):
+    limiter = RateLimiter(6000, 6000, max_concurrent=2)
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, json={"data": {}})
+
+    settings = make_settings(asana_cache_enabled=False)
+    clients = [make_client(handler, settings, limiter=limiter) for _ in range(2)]
+
+    async def scenario():
+        await asyncio.gather(*(client.request("GET", f"/tasks/{n}") for n in range(4) for client in clients))
+
+    asyncio.run(scenario())
+    assert active["peak"] == 2
@@ -1,4 +1,7 @@
+from benchmarks.bench_redaction import fixtures, legacy_redact_dict
 from src.logging_utils import redact_dict
+from src.redaction import MAX_DEPTH, TRUNCATED, compile_plan, redact
+from src.tool_impl import BatchCreateTasksInput, CreateTaskInput, GetTaskInput
 
 
 def test_redacts_sensitive_keys():
@@ -13,3 +16,51 @@ def test_redacts_sensitive_keys():
     assert redacted["notes"] == "[REDACTED]"
     assert redacted["nested"]["token"] == "[REDACTED]"
     assert redacted["list"][0]["password"] == "[REDACTED]"
+
+
+def test_clean_payload_is_returned_without_copying():
+    payload = {"data": [{"gid": "1", "name": "Task", "assignee": {"gid": "7"}}]}
+    assert redact(payload) is payload
+
+
+def test_only_changed_branches_are_copied():
+    clean = {"gid": "7", "name": "Owner"}
+    payload = {"assignee": clean, "tasks": [{"name": "A", "Notes": "private"}]}
+    redacted = redact(payload)
+    assert redacted is not payload
+    assert redacted["assignee"] is clean
+    assert redacted["tasks"][0] == {"name": "A", "Notes": "[REDACTED]"}
+    assert payload["tasks"][0]["Notes"] == "private"
+
+
+def test_none_values_stay_none():
+    assert redact({"notes": None}) == {"notes": None}
+
+
+def test_deep_or_huge_payloads_are_truncated():
+    deep: dict = {}
+    node = deep
+    for _ in range(MAX_DEPTH + 5):
+        node["child"] = {}
+        node = node["child"]
+    node = redact(deep)
+    for _ in range(MAX_DEPTH + 1):
+        node = node["child"]
+    assert node == TRUNCATED
+    assert redact({"items": [[] for _ in range(10)]}, max_nodes=5)["items"][-1] == TRUNCATED
+
+
+def test_compiled_plan_matches_generic_redaction():
+    task_input = {"task_gid": "1", "opt_fields": "name"}
+    assert compile_plan(GetTaskInput).apply(task_input) is task_input
+    create_input = {"name": "A", "notes": "private", "workspace_gid": "1"}
+    assert compile_plan(CreateTaskInput).apply(create_input) == redact(create_input)
+    batch_input = {"tasks": [{"name": "A", "notes": "private"}]}
+    assert compile_plan(BatchCreateTasksInput).apply(batch_input) == legacy_redact_dict(batch_input)
+    unknown = {"password": "pw"}
+    assert compile_plan(GetTaskInput).apply(unknown) == {"password": "[REDACTED]"}
+
+
+def test_engine_matches_legacy_on_benchmark_fixtures():
+    for payload in fixtures().values():
+        assert redact(payload) == legacy_redact_dict(payload)
@@ -0,0 +1,161 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src import tool_impl
+from src.resolver import NameIndex, Resolver
+
+LISTINGS = {
+    "/workspaces": [{"gid": "1", "name": "Acme"}, {"gid": "2", "name": "Side Projects"}],
+    "/workspaces/1/projects": [
+        {"gid": "10", "name": "Launch"},
+        {"gid": "11", "name": "Launch Retro"},
+        {"gid": "12", "name": "Budget"},
+    ],
+    "/workspaces/2/projects": [{"gid": "20", "name": "Garden"}],
+    "/projects/10/sections": [{"gid": "100", "name": "To do"}, {"gid": "101", "name": "Doing"}],
+    "/workspaces/1/users": [{"gid": "1000", "name": "Ada Lovelace"}, {"gid": "1001", "name": "Alan Turing"}],
+    "/workspaces/1/tags": [{"gid": "500", "name": "urgent"}],
+}
+
+
+@pytest.fixture
+def asana(monkeypatch, make_client, make_settings, use_client):
+    calls = []
+    posted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/1.0")
+        calls.append((request.method, path))
+        if request.method == "POST":
+            posted.append(request.read())
+            return httpx.Response(201, json={"data": {"gid": "9"}})
+        return httpx.Response(200, json={"data": LISTINGS.get(path, []), "next_page": None})
+
+    client = use_client(make_client(handler, make_settings(asana_cache_enabled=False)))
+    clock = [1000.0]
+    resolver = Resolver(lambda: client, ttl=600, clock=lambda: clock[0])
+    monkeypatch.setattr(tool_impl, "get_resolver", lambda: resolver)
+    return calls, posted, resolver, clock
+
+
+def test_lookup_tiers():
+    index = NameIndex()
+    index.replace("project", "1", {"10": "Launch", "11": "launch", "12": "Launch Retro", "13": "Budget"}, 0.0)
+    assert index.lookup("project", "Launch", ["1"]) == [("10", "Launch")]
+    assert index.lookup("project", "LAUNCH", ["1"]) == [("10", "Launch"), ("11", "launch")]
+    assert index.lookup("project", "launch r", ["1"]) == [("12", "Launch Retro")]
+    assert index.lookup("project", "bud", ["1"]) == [("13", "Budget")]
+    assert index.lookup("project", "x", ["1"]) == []
+
+
+def test_names_resolve_once_then_locally(asana):
+    calls, posted, _, _ = asana
+    payload = {
+        "name": "Ship it",
+        "workspace": "acme",
+        "projects": ["Launch", "budg"],
+        "assignee": "ada",
+        "tags": ["urgent"],
+    }
+    assert asyncio.run(tool_impl.create_task(payload))["status"] == "ok"
+    listed = [path for method, path in calls if method == "GET"]
+    assert sorted(listed) == ["/workspaces", "/workspaces/1/projects", "/workspaces/1/tags", "/workspaces/1/users"]
+    sent = json.loads(posted[0])["data"]
+    assert (sent["workspace"], sent["projects"], sent["assignee"], sent["tags"]) == ("1", ["10", "12"], "1000", ["500"])
+
+    calls.clear()
+    assert asyncio.run(tool_impl.create_task({**payload, "assignee": "me", "projects": ["12"]}))["status"] == "ok"
+    assert calls == [("POST", "/tasks")]
+
+
+def test_email_assignees_pass_through(asana):
+    calls, posted, _, _ = asana
+    payload = {"name": "x", "workspace": "1", "assignee": "alice@example.com"}
+    assert asyncio.run(tool_impl.create_task(payload))["status"] == "ok"
+    assert calls == [("POST", "/tasks")]
+    assert json.loads(posted[0])["data"]["assignee"] == "alice@example.com"
+
+
+def test_sections_are_scoped_by_project(asana):
+    calls, _, _, _ = asana
+    result = asyncio.run(tool_impl.move_task_to_section({"section_gid": "doing", "task_gid": "7", "project": "Launch"}))
+    assert result["status"] == "ok"
+    assert calls[-1] == ("POST", "/sections/101/addTask")
+
+    missing = asyncio.run(tool_impl.move_task_to_section({"section_gid": "doing", "task_gid": "7"}))
+    assert missing["error"]["code"] == "name_not_found"
+    assert "need a project" in missing["error"]["message"]
+
+
+def test_ambiguous_and_unknown_names(asana):
+    calls, _, _, clock = asana
+    assert asyncio.run(tool_impl.list_projects({"workspace_gid": "Acme"}))["status"] == "ok"
+    assert calls[-1] == ("GET", "/workspaces/1/projects")
+    result = asyncio.run(tool_impl.search_tasks({"workspace_gid": "Acme", "projects": "laun"}))
+    assert result["error"]["code"] == "ambiguous_name"
+    candidates = result["error"]["details"]["details"]["candidates"]
+    assert [candidate["gid"] for candidate in candidates] == ["10", "11"]
+
+    listed = len(calls)
+    unknown = asyncio.run(tool_impl.search_tasks({"workspace_gid": "Acme", "projects": "Nope"}))
+    assert unknown["error"]["code"] == "name_not_found"
+    assert len(calls) == listed
+    clock[0] += 60
+    asyncio.run(tool_impl.search_tasks({"workspace_gid": "Acme", "projects": "Nope"}))
+    assert calls[listed] == ("GET", "/workspaces/1/projects")
+
+
+def test_project_without_workspace_searches_every_workspace(asana):
+    _, _, resolver, _ = asana
+    assert asyncio.run(resolver.resolve("project", "garden")) == "20"
+
+
+def test_index_persists_per_credential(asana, tmp_path):
+    calls, _, resolver, clock = asana
+    path = str(tmp_path / "names.json")
+    first = Resolver(resolver._client, ttl=600, path=path, owner="abc", clock=lambda: clock[0])
+    assert asyncio.run(first.resolve("workspace", "Acme")) == "1"
+    calls.clear()
+
+    warm = Resolver(resolver._client, ttl=600, path=path, owner="abc", clock=lambda: clock[0])
+    assert asyncio.run(warm.resolve("workspace", "Acme")) == "1"
+    assert calls == []
+    other = Resolver(resolver._client, ttl=600, path=path, owner="xyz", clock=lambda: clock[0])
+    assert other.index.lookup("workspace", "Acme", [""]) == []
+
+
+def test_server_resolver_follows_the_current_credential(asana, tmp_path, monkeypatch, make_settings):
+    calls, _, resolver, _ = asana
+    monkeypatch.undo()
+    path = tmp_path / "names.json"
+    settings = make_settings(asana_cache_enabled=False, asana_resolver_path=str(path))
+    owner = ["abc"]
+
+    class Pool:
+        def default_credential(self):
+            return owner[0]
+
+    monkeypatch.setattr(tool_impl, "get_settings", lambda: settings)
+    monkeypatch.setattr(tool_impl, "get_client_pool", lambda: Pool())
+    monkeypatch.setattr(tool_impl, "get_async_client", resolver._client)
+    tool_impl._resolver.cache_clear()
+    try:
+        first = tool_impl.get_resolver()
+        assert asyncio.run(first.resolve("workspace", "Acme")) == "1"
+        assert tool_impl.get_resolver() is first
+        assert json.loads(path.read_text())["owner"] == "abc"
+
+        # A token file reload changes the fingerprint: no names from the old token are reused.
+        owner[0] = "xyz"
+        second = tool_impl.get_resolver()
+        assert second is not first
+        assert second.index.lookup("workspace", "Acme", [""]) == []
+        calls.clear()
+        assert asyncio.run(second.resolve("workspace", "Acme")) == "1"
+        assert calls == [("GET", "/workspaces")]
+        assert json.loads(path.read_text())["owner"] == "xyz"
+    finally:
+        tool_impl._resolver.cache_clear()
@@ -0,0 +1,188 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src import tool_impl
+from src.asana_client import AsanaError
+from src.circuit_breaker import CircuitBreaker, CircuitOpen
+from src.rate_limit import RateLimiter
+from src.retry import RetryPolicy
+
+
+@pytest.fixture
+def retry_client(monkeypatch, make_client, make_settings):
+    """Build a cache-free client whose sleeps are recorded and advance a fake clock instead of waiting."""
+
+    def build(handler, sleeps, clock=None, **settings):
+        clock = clock if clock is not None else [0.0]
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        monkeypatch.setattr("src.asana_client.asyncio.sleep", fake_sleep)
+        resolved = make_settings(asana_cache_enabled=False, **settings)
+        return make_client(
+            handler,
+            resolved,
+            limiter=RateLimiter(600, 600, max_concurrent=4, clock=lambda: clock[0]),
+            retry_policy=RetryPolicy(
+                max_retries=resolved.asana_max_retries,
+                deadline=resolved.asana_retry_deadline_seconds,
+                retry_after_cap=resolved.asana_retry_after_cap_seconds,
+                retry_non_idempotent=resolved.asana_retry_non_idempotent,
+                clock=lambda: clock[0],
+                uniform=lambda low, high: high,
+            ),
+            breaker=CircuitBreaker(
+                resolved.asana_circuit_failure_threshold,
+                resolved.asana_circuit_reset_seconds,
+                clock=lambda: clock[0],
+            ),
+        )
+
+    return build
+
+
+def _failing(status, calls, headers=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(status, headers=headers, json={"errors": [{"message": "down"}]})
+
+    return handler
+
+
+def test_decorrelated_jitter_grows_and_is_capped():
+    policy = RetryPolicy(max_retries=10, base_delay=0.5, max_delay=4.0, deadline=100, uniform=lambda low, high: high)
+    retry = policy.begin("GET")
+    response = httpx.Response(503)
+    assert [retry.next_delay(response) for _ in range(4)] == [1.5, 4.0, 4.0, 4.0]
+    low = RetryPolicy(uniform=lambda low, high: low).begin("GET")
+    assert low.next_delay(response) == 0.5
+
+
+def test_only_idempotent_methods_retry_server_errors(retry_client):
+    calls, sleeps = [], []
+    client = retry_client(_failing(503, calls), sleeps, asana_max_retries=2)
+    with pytest.raises(AsanaError):
+        asyncio.run(client.request("POST", "/tasks", payload={"data": {}}))
+    assert calls == ["POST"]
+    with pytest.raises(AsanaError):
+        asyncio.run(client.request("GET", "/tasks/1"))
+    assert calls == ["POST", "GET", "GET", "GET"]
+    assert sleeps == [1.5, 4.5]
+
+    calls.clear()
+    client = retry_client(_failing(503, calls), [], asana_max_retries=1, asana_retry_non_idempotent=True)
+    with pytest.raises(AsanaError):
+        asyncio.run(client.request("POST", "/tasks", payload={"data": {}}))
+    assert calls == ["POST", "POST"]
+
+
+def test_rate_limits_retry_any_method_but_respect_cap_and_deadline(retry_client):
+    calls, sleeps = [], []
+    client = retry_client(_failing(429, calls, {"Retry-After": "2"}), sleeps, asana_max_retries=1)
+    with pytest.raises(AsanaError):
+        asyncio.run(client.request("POST", "/tasks", payload={"data": {}}))
+    assert len(calls) == 2
+
+    calls.clear()
+    client = retry_client(_failing(429, calls, {"Retry-After": "600"}), [], asana_retry_after_cap_seconds=60)
+    with pytest.raises(AsanaError) as excinfo:
+        asyncio.run(client.request("GET", "/tasks/1"))
+    assert excinfo.value.status_code == 429
+    assert len(calls) == 1
+
+    calls.clear()
+    sleeps.clear()
+    client = retry_client(_failing(503, calls), sleeps, asana_max_retries=10, asana_retry_deadline_seconds=5)
+    with pytest.raises(AsanaError):
+        asyncio.run(client.request("GET", "/tasks/1"))
+    assert sum(sleeps) <= 5
+    assert len(calls) == 2
+
+
+def test_transport_errors_are_retried_for_reads(retry_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"data": {"gid": "1"}})
+
+    client = retry_client(handler, [])
+    assert asyncio.run(client.request("GET", "/tasks/1")) == {"data": {"gid": "1"}}
+    assert len(calls) == 2
+
+
+def test_exhausted_transport_retries_become_a_tool_error(retry_client, use_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    sleeps = []
+    client = retry_client(handler, sleeps, asana_max_retries=2)
+    use_client(client)
+    result = asyncio.run(tool_impl.get_task({"task_gid": "42"}))
+    assert result["status"] == "error"
+    assert result["error"]["code"] == "transport_error"
+    assert result["error"]["details"]["details"]["endpoint"] == "/tasks/{gid}"
+    assert len(sleeps) == 2
+
+
+def test_circuit_opens_fails_fast_and_recovers_after_probe(retry_client, use_client):
+    calls, clock = [], [0.0]
+    status = [503]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(status[0], json={"data": {"gid": "1"}, "errors": []})
+
+    client = retry_client(
+        handler,
+        [],
+        clock,
+        asana_max_retries=0,
+        asana_circuit_failure_threshold=2,
+        asana_circuit_reset_seconds=10,
+    )
+    use_client(client)
+    for _ in range(2):
+        result = asyncio.run(tool_impl.get_task({"task_gid": "42"}))
+        assert result["error"]["code"] == "asana_error"
+
+    result = asyncio.run(tool_impl.get_task({"task_gid": "42"}))
+    assert result["error"]["code"] == "circuit_open"
+    assert result["error"]["details"]["details"]["endpoint"] == "/tasks/{gid}"
+    assert len(calls) == 2
+    assert asyncio.run(tool_impl.list_workspaces({}))["error"]["code"] == "asana_error"
+    assert client.breaker.snapshot()["/tasks/{gid}"]["state"] == "open"
+
+    clock[0] += 10
+    status[0] = 200
+    assert asyncio.run(tool_impl.get_task({"task_gid": "42"}))["status"] == "ok"
+    assert client.breaker.snapshot()["/tasks/{gid}"] == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "trips": 1,
+        "retry_in_seconds": 0.0,
+    }
+
+
+def test_half_open_allows_limited_probes():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, half_open_probes=1, clock=lambda: now[0])
+    breaker.record("/tasks/{gid}", failed=True)
+    with pytest.raises(CircuitOpen):
+        breaker.acquire("/tasks/{gid}")
+    now[0] = 5.0
+    assert breaker.acquire("/tasks/{gid}") is True
+    with pytest.raises(CircuitOpen):
+        breaker.acquire("/tasks/{gid}")
+    breaker.record("/tasks/{gid}", failed=True, probe=True)
+    assert breaker.snapshot()["/tasks/{gid}"]["trips"] == 2
+    now[0] = 10.0
+    probe = breaker.acquire("/tasks/{gid}")
+    breaker.release("/tasks/{gid}", probe)
+    assert breaker.acquire("/tasks/{gid}") is True
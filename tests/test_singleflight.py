@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from src.asana_client import AsanaClient, AsanaError
+
+
+@pytest.fixture
+def settings(make_settings):
+    return make_settings(asana_cache_enabled=False, asana_max_retries=0)
+
+
+def test_async_identical_gets_share_one_call(make_client, settings):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {"gid": "1"}})
+
+    client = make_client(handler, settings)
+
+    async def scenario():
+        return await asyncio.gather(*(client.request("GET", "/tasks/1") for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result == {"data": {"gid": "1"}} for result in results)
+    assert results[0] is not results[1]
+
+
+def test_async_error_fans_out_to_every_waiter(make_client, settings):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, json={"errors": []})
+
+    client = make_client(handler, settings)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(client.request("GET", "/tasks/1") for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, AsanaError) for result in results)
+
+
+def test_threaded_callers_share_one_call(settings):
+    calls = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        release.wait(1)
+        return httpx.Response(200, json={"data": []})
+
+    client = AsanaClient(settings, transport=httpx.MockTransport(handler))
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.request("GET", "/workspaces")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(results) == 4
+
@@ -0,0 +1,40 @@
+from benchmarks.bench_startup import measure, parse_importtime
+from src.env import health_problems
+
+
+def test_parse_importtime_tracks_nesting():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   src.version",
+            "import time:       300 |        420 | src",
+        ]
+    )
+    samples = parse_importtime(stderr)
+    assert [(s.module, s.depth, s.cumulative_us) for s in samples] == [("src.version", 1, 120), ("src", 0, 420)]
+
+
+def test_version_and_health_check_skip_heavy_imports(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "asana-mcp.log"))
+    # The health check validates Settings, so it may load pydantic, but nothing heavier.
+    for flag, allowed in (("--version", []), ("--health-check", ["pydantic"])):
+        row = measure("source", flag, runs=1)
+        assert row["heavy_modules"] == allowed, (flag, row["heavy_modules"])
+
+
+def test_health_problems(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "asana-mcp.log"))
+    assert health_problems({"ASANA_ACCESS_TOKEN": "token"}) == []
+    assert health_problems({}) == [
+        "Set ASANA_ACCESS_TOKEN or provide a valid ASANA_TOKEN_FILE with a non-empty token."
+    ]
+    assert health_problems({"ASANA_ACCESS_TOKEN": "token", "ASANA_MAX_RETRIES": "many"})[0].startswith(
+        "Invalid numeric setting"
+    )
+    token_file = tmp_path / "asana.token"
+    token_file.write_text("file-token\n", encoding="utf-8")
+    assert health_problems({"ASANA_TOKEN_FILE": str(token_file)}) == []
+    # Parses, but Settings rejects it, as server startup would.
+    assert health_problems({"ASANA_ACCESS_TOKEN": "token", "ASANA_RATE_LIMIT_PER_MINUTE": "0"}) == [
+        "ASANA_RATE_LIMIT_PER_MINUTE: Input should be greater than or equal to 1"
+    ]
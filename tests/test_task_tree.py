@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src import tool_impl
+
+
+@pytest.fixture
+def fake(fake_asana):
+    return fake_asana(tasks=3, projects=1)
+
+
+def test_walks_levels_and_skips_leaf_listings(fake):
+    root = fake.add_task_tree(fanout=2, depth=2)
+    result = asyncio.run(tool_impl.get_task_tree({"task_gid": root}))
+    assert result["status"] == "ok"
+    tree = result["data"]
+    assert tree["nodes"] == 7 and tree["depth"] == 2 and tree["truncated"] is False
+    assert len(tree["data"]["subtasks"]) == 2
+    assert all(len(child["subtasks"]) == 2 for child in tree["data"]["subtasks"])
+    # One get for the root plus one listing per node that has children.
+    assert tree["upstream_calls"] == 4
+    assert fake.calls["GET /tasks/{gid}/subtasks"] == 3
+
+
+def test_depth_and_node_limits_truncate(fake):
+    root = fake.add_task_tree(fanout=3, depth=2)
+    shallow = asyncio.run(tool_impl.get_task_tree({"task_gid": root, "max_depth": 1}))["data"]
+    assert shallow["nodes"] == 4 and shallow["depth"] == 1 and shallow["truncated"] is True
+    assert all("subtasks" not in child for child in shallow["data"]["subtasks"])
+
+    capped = asyncio.run(tool_impl.get_task_tree({"task_gid": root, "max_nodes": 6}))["data"]
+    assert capped["nodes"] == 6 and capped["truncated"] is True
+    assert [len(child.get("subtasks", [])) for child in capped["data"]["subtasks"]] == [2, 0, 0]
+
+
+def test_links_stories_and_duplicates(fake):
+    root = fake.add_task_tree(fanout=1, depth=1)
+    child = fake.task_gids()[-1]
+    other = fake.task_gids()[0]
+    fake.tasks[root]["dependencies"] = [other]
+    # A child listed twice (e.g. re-parented mid-walk) is only kept once.
+    fake.add_subtask(root, "again")
+    fake.tasks[fake.task_gids()[-1]]["gid"] = child
+
+    payload = {"task_gid": root, "include_dependencies": True, "stories": 2}
+    tree = asyncio.run(tool_impl.get_task_tree(payload))["data"]
+    assert tree["duplicates"] == 1
+    assert [item["gid"] for item in tree["data"]["dependencies"]] == [other]
+    assert tree["data"]["dependents"] == []
+    assert [story["text"] for story in tree["data"]["stories"]] == ["Update 1", "Update 2"]
+
+
+def test_missing_root_and_partial_errors(fake):
+    missing = asyncio.run(tool_impl.get_task_tree({"task_gid": "404"}))
+    assert missing["status"] == "error"
+    assert missing["error"]["details"]["status_code"] == 404
+
+    root = fake.add_task_tree(fanout=1, depth=1)
+    fake._routes = [route for route in fake._routes if "stories" not in route[1].pattern]
+    tree = asyncio.run(tool_impl.get_task_tree({"task_gid": root, "stories": 1}))["data"]
+    assert tree["nodes"] == 2
+    assert {error["part"] for error in tree["errors"]} == {"stories"}
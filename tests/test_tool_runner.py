@@ -0,0 +1,72 @@
+import asyncio
+import io
+import json
+
+from scripts._tool_runner import run_jsonl
+
+
+def _lines(text: str):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def _source(*payloads: str) -> io.StringIO:
+    return io.StringIO("".join(payload + "\n" for payload in payloads))
+
+
+def test_jsonl_keeps_input_order_and_caps_parallelism():
+    active = {"now": 0, "peak": 0}
+
+    async def tool(payload):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(payload["delay"])
+        active["now"] -= 1
+        return {"status": "ok", "data": payload["n"]}
+
+    payloads = [json.dumps({"n": n, "delay": 0.02 if n % 2 else 0.001}) for n in range(10)]
+    out = io.StringIO()
+    summary = asyncio.run(run_jsonl(tool, _source(*payloads), out, parallel=3))
+    records = _lines(out.getvalue())
+    assert [record["result"]["data"] for record in records[:-1]] == list(range(10))
+    assert [record["line"] for record in records[:-1]] == list(range(1, 11))
+    assert active["peak"] == 3
+    assert records[-1] == {"summary": summary}
+    assert summary["total"] == summary["ok"] == 10
+    assert summary["latency_ms"]["max"] >= summary["latency_ms"]["p50"] > 0
+
+
+def test_jsonl_completion_order_and_bad_lines():
+    async def tool(payload):
+        if payload.get("boom"):
+            raise ValueError("bad input")
+        await asyncio.sleep(payload["delay"])
+        return {"status": "ok", "data": payload["delay"]}
+
+    out = io.StringIO()
+    source = _source('{"delay": 0.05}', "", "not json", "[1]", '{"boom": true}', '{"delay": 0.0}')
+    summary = asyncio.run(run_jsonl(tool, source, out, parallel=4, order="completion"))
+    records = {record["line"]: record["result"] for record in _lines(out.getvalue())[:-1]}
+    assert list(records)[-1] == 1
+    assert records[3]["error"]["code"] == records[4]["error"]["code"] == "invalid_payload"
+    assert records[5]["error"] == {"code": "exception", "message": "ValueError: bad input"}
+    assert (summary["total"], summary["ok"], summary["error"], summary["invalid"]) == (5, 2, 1, 2)
+
+
+def test_jsonl_summary_counts_each_line_once():
+    async def tool(payload):
+        return {"status": "error" if payload.get("fail") else "ok", "data": payload}
+
+    lines = ['{"n": 1}', "{oops", '{"fail": true}', '"text"', '{"n": 2}', '{"fail": true}', "[]", '{"n": 3}']
+    out = io.StringIO()
+    summary = asyncio.run(run_jsonl(tool, _source(*lines), out, parallel=2))
+    records = _lines(out.getvalue())
+    assert len(records) == len(lines) + 1
+    assert records[-1] == {"summary": summary}
+    assert (summary["total"], summary["ok"], summary["error"], summary["invalid"]) == (8, 3, 2, 3)
+    assert summary["ok"] + summary["error"] + summary["invalid"] == summary["total"]
+
+
+def test_jsonl_accepts_sync_tools():
+    out = io.StringIO()
+    asyncio.run(run_jsonl(lambda payload: {"status": "ok", "data": payload}, _source('{"a": 1}'), out))
+    assert _lines(out.getvalue())[0] == {"line": 1, "result": {"status": "ok", "data": {"a": 1}}}